@@ -0,0 +1,218 @@
+"""Content-addressed asset store shared across crawl jobs.
+
+Images and linked documents fetched by scraping tasks are stored once under
+``<store root>/objects/<sha256[:2]>/<sha256>`` and hardlinked (or copied, when
+the job directory is on another filesystem) into each job's output directory.
+A persistent URL → sha256 index lets repeat assets skip the network entirely,
+both across pages of one crawl and across jobs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import shutil
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+import httpx
+
+from .utils import save_json_atomic
+
+
+ASSET_STORE_ROOT: str = os.getenv("ASSET_STORE_ROOT", "")
+ASSET_URL_TTL_SECONDS: int = int(os.getenv("ASSET_URL_TTL_SECONDS", str(7 * 24 * 3600)))
+ASSET_MAX_BYTES: int = int(os.getenv("ASSET_MAX_BYTES", str(200 * 1024 * 1024)))
+
+
+class AssetStore:
+    """sha256-keyed object store with a URL → hash cache."""
+
+    INDEX_FLUSH_EVERY = 25
+
+    def __init__(self, root: pathlib.Path, url_ttl_seconds: int = ASSET_URL_TTL_SECONDS,
+                 max_bytes: int = ASSET_MAX_BYTES):
+        self.root = pathlib.Path(root)
+        self.objects_dir = self.root / "objects"
+        self.tmp_dir = self.root / "tmp"
+        self.index_file = self.root / "url_index.json"
+        self.url_ttl_seconds = url_ttl_seconds
+        self.max_bytes = max_bytes
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+
+        self._url_index: Dict[str, Dict[str, Any]] = self._load_index()
+        self._url_locks: Dict[str, asyncio.Lock] = {}
+        self._dirty = 0
+        self.stats = {"url_hits": 0, "downloads": 0, "dedup_hits": 0, "bytes_saved": 0}
+
+    # ───── index persistence ─────
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def flush(self) -> bool:
+        """Persist the URL index to disk."""
+        if not self._dirty:
+            return True
+        ok = save_json_atomic(self.index_file, self._url_index)
+        if ok:
+            self._dirty = 0
+        return ok
+
+    def _record(self, url: str, entry: Dict[str, Any]) -> None:
+        self._url_index[url] = entry
+        self._dirty += 1
+        if self._dirty >= self.INDEX_FLUSH_EVERY:
+            self.flush()
+
+    # ───── object helpers ─────
+
+    def object_path(self, sha256: str) -> pathlib.Path:
+        return self.objects_dir / sha256[:2] / sha256
+
+    def has_object(self, sha256: str) -> bool:
+        return self.object_path(sha256).exists()
+
+    def lookup_url(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh cached entry for ``url`` whose object still exists."""
+        entry = self._url_index.get(url)
+        if not entry:
+            return None
+        if self.url_ttl_seconds and time.time() - entry.get("fetched_at", 0) > self.url_ttl_seconds:
+            return None
+        if not self.has_object(entry.get("sha256", "")):
+            return None
+        return entry
+
+    def link_into(self, sha256: str, dest: pathlib.Path) -> bool:
+        """Hardlink the stored object to ``dest`` (copy across filesystems)."""
+        src = self.object_path(sha256)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if dest.exists():
+            try:
+                if os.path.samefile(src, dest):
+                    return True
+            except OSError:
+                pass
+            dest.unlink()
+        try:
+            os.link(src, dest)
+        except OSError:
+            shutil.copyfile(src, dest)
+        return True
+
+    # ───── fetching ─────
+
+    async def fetch(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        *,
+        timeout: float = 30.0,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Resolve ``url`` to a stored object, downloading only on a cache miss.
+        Returns the index entry plus ``cached`` (True when no download happened).
+        Raises on HTTP/network errors like ``client.get`` would.
+        """
+        lock = self._url_locks.setdefault(url, asyncio.Lock())
+        try:
+            async with lock:
+                entry = self.lookup_url(url)
+                if entry:
+                    self.stats["url_hits"] += 1
+                    self.stats["bytes_saved"] += entry.get("size", 0)
+                    return {**entry, "cached": True}
+
+                entry = await self._download(client, url, timeout=timeout, headers=headers)
+                self._record(url, entry)
+                return {**entry, "cached": False}
+        finally:
+            # Concurrent fetches of the same URL wait on one download; drop the lock afterwards
+            if not lock.locked():
+                self._url_locks.pop(url, None)
+
+    async def _download(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        *,
+        timeout: float,
+        headers: Optional[Dict[str, str]],
+    ) -> Dict[str, Any]:
+        tmp = self.tmp_dir / f"{uuid.uuid4().hex}.part"
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            async with client.stream("GET", url, timeout=timeout, headers=headers or {}) as response:
+                response.raise_for_status()
+                content_type = response.headers.get("content-type", "application/octet-stream")
+                with open(tmp, "wb") as f:
+                    async for chunk in response.aiter_bytes():
+                        size += len(chunk)
+                        if size > self.max_bytes:
+                            raise ValueError(f"asset_too_large_{size}")
+                        digest.update(chunk)
+                        f.write(chunk)
+
+            if size == 0:
+                raise ValueError("empty_asset")
+
+            sha256 = digest.hexdigest()
+            final = self.object_path(sha256)
+            if final.exists():
+                self.stats["dedup_hits"] += 1
+                self.stats["bytes_saved"] += size
+                tmp.unlink(missing_ok=True)
+            else:
+                final.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp, final)
+            self.stats["downloads"] += 1
+
+            return {
+                "sha256": sha256,
+                "size": size,
+                "content_type": content_type,
+                "fetched_at": time.time(),
+            }
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "indexed_urls": len(self._url_index)}
+
+
+# Process-wide stores, one per root, shared by all workers in this service
+_stores: Dict[str, AssetStore] = {}
+
+
+def get_asset_store(job_output_dir: str, logger: Optional[logging.Logger] = None) -> Optional[AssetStore]:
+    """
+    Return the shared store for a job. Defaults to ``<data_root>/_assets`` (job
+    directories live at ``<data_root>/<task>/<job_id>``) unless ASSET_STORE_ROOT
+    is set. Returns None if the store cannot be created.
+    """
+    root = pathlib.Path(ASSET_STORE_ROOT) if ASSET_STORE_ROOT else \
+        pathlib.Path(job_output_dir).resolve().parent.parent / "_assets"
+    key = str(root)
+    if key not in _stores:
+        try:
+            _stores[key] = AssetStore(root)
+        except Exception as e:
+            if logger:
+                logger.warning(f"Asset store unavailable at {root}: {e}")
+            return None
+    return _stores[key]
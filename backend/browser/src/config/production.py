@@ -60,6 +60,10 @@ class ScalingConfig:
     cpu_scale_down_threshold: float = 0.3
     memory_scale_up_threshold: float = 0.85
     memory_scale_down_threshold: float = 0.4
+    target_queue_wait_seconds: int = 60  # Autoscaler drains the backlog within this wait
+    worker_memory_mb: int = 400  # Memory headroom each extra worker/browser context needs
+    job_lanes: str = "long:1=booking,airbnb,twitter;short:3=*"  # <lane>:<weight>=<task prefixes>
+    lane_reservations: str = ""  # Workers dedicated to a lane, e.g. "short=1"
 
 
 @dataclass
@@ -168,6 +172,10 @@ class ProductionConfig:
         self.scaling.max_workers = self._get_int_env("MAX_WORKERS", self.scaling.max_workers)
         self.scaling.max_concurrent_jobs = self._get_int_env("MAX_CONCURRENT_JOBS", self.scaling.max_concurrent_jobs)
         self.scaling.job_timeout_seconds = self._get_int_env("JOB_TIMEOUT_SECONDS", self.scaling.job_timeout_seconds)
+        self.scaling.target_queue_wait_seconds = self._get_int_env("TARGET_QUEUE_WAIT_SECONDS", self.scaling.target_queue_wait_seconds)
+        self.scaling.worker_memory_mb = self._get_int_env("WORKER_MEMORY_MB", self.scaling.worker_memory_mb)
+        self.scaling.job_lanes = os.getenv("JOB_LANES", self.scaling.job_lanes)
+        self.scaling.lane_reservations = os.getenv("JOB_LANE_RESERVATIONS", self.scaling.lane_reservations)
 
         # Monitoring settings
         self.monitoring.prometheus_enabled = self._get_bool_env("PROMETHEUS_ENABLED", self.monitoring.prometheus_enabled)
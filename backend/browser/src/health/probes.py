@@ -33,6 +33,8 @@ except ImportError:
 
 from playwright.async_api import Browser
 
+from ..resource_sampler import get_resource_sampler
+
 
 class HealthStatus(str, Enum):
     """Health check status levels."""
@@ -533,12 +535,14 @@ class ProductionHealthChecker:
         start_time = time.time()
 
         try:
-            import psutil
+            # Latest background sample - the probe never waits on CPU measurement
+            snapshot = get_resource_sampler().snapshot()
+            if not snapshot.available:
+                raise ImportError("psutil not available")
 
-            # Get system metrics
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            cpu_percent = snapshot.cpu_percent
+            memory_percent = snapshot.memory_percent
+            disk_percent = snapshot.disk_percent
 
             response_time = (time.time() - start_time) * 1000
 
@@ -552,15 +556,15 @@ class ProductionHealthChecker:
             elif cpu_percent > warning_thresholds['cpu']:
                 issues.append(f"CPU usage high ({cpu_percent:.1f}%)")
 
-            if memory.percent > critical_thresholds['memory']:
-                issues.append(f"Memory usage critical ({memory.percent:.1f}%)")
-            elif memory.percent > warning_thresholds['memory']:
-                issues.append(f"Memory usage high ({memory.percent:.1f}%)")
+            if memory_percent > critical_thresholds['memory']:
+                issues.append(f"Memory usage critical ({memory_percent:.1f}%)")
+            elif memory_percent > warning_thresholds['memory']:
+                issues.append(f"Memory usage high ({memory_percent:.1f}%)")
 
-            if disk.percent > critical_thresholds['disk']:
-                issues.append(f"Disk usage critical ({disk.percent:.1f}%)")
-            elif disk.percent > warning_thresholds['disk']:
-                issues.append(f"Disk usage high ({disk.percent:.1f}%)")
+            if disk_percent > critical_thresholds['disk']:
+                issues.append(f"Disk usage critical ({disk_percent:.1f}%)")
+            elif disk_percent > warning_thresholds['disk']:
+                issues.append(f"Disk usage high ({disk_percent:.1f}%)")
 
             if any('critical' in issue for issue in issues):
                 status = HealthStatus.UNHEALTHY
@@ -579,10 +583,14 @@ class ProductionHealthChecker:
                 response_time_ms=response_time,
                 details={
                     "cpu_percent": cpu_percent,
-                    "memory_percent": memory.percent,
-                    "memory_available_gb": memory.available / (1024**3),
-                    "disk_percent": disk.percent,
-                    "disk_free_gb": disk.free / (1024**3)
+                    "memory_percent": memory_percent,
+                    "memory_available_gb": snapshot.memory_available_bytes / (1024**3),
+                    "disk_percent": disk_percent,
+                    "disk_free_gb": snapshot.disk_free_bytes / (1024**3),
+                    "browser_rss_gb": snapshot.browser_rss_bytes / (1024**3),
+                    "browser_processes": snapshot.browser_process_count,
+                    "open_fds": snapshot.open_fds,
+                    "sample_age_seconds": round(time.time() - snapshot.timestamp, 1)
                 }
             )
 
@@ -0,0 +1,196 @@
+"""Persistent conditional-request cache for JSON API responses.
+
+Responses are stored on disk with their ``ETag``/``Last-Modified`` validators
+under ``<cache root>/<namespace>/<key[:2]>/<key>.json``. Callers revalidate
+stored entries with ``If-None-Match``/``If-Modified-Since``; a 304 reuses the
+stored body (and, for GitHub, does not count against the rate limit). Entries
+are dropped after ``ttl_seconds`` without revalidation and the least recently
+used entries are evicted once the namespace exceeds ``max_bytes``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+from .utils import save_json_atomic
+
+
+HTTP_CACHE_ROOT: str = os.getenv("HTTP_CACHE_ROOT", "")
+HTTP_CACHE_TTL_SECONDS: int = int(os.getenv("HTTP_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+HTTP_CACHE_MAX_BYTES: int = int(os.getenv("HTTP_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+HTTP_CACHE_FRESH_SECONDS: int = int(os.getenv("HTTP_CACHE_FRESH_SECONDS", "60"))
+
+
+class ResponseCache:
+    """On-disk response cache with validators, TTL and LRU size eviction."""
+
+    EVICT_CHECK_EVERY = 50
+
+    def __init__(self, root: pathlib.Path, ttl_seconds: int = HTTP_CACHE_TTL_SECONDS,
+                 max_bytes: int = HTTP_CACHE_MAX_BYTES, fresh_seconds: int = HTTP_CACHE_FRESH_SECONDS):
+        self.root = pathlib.Path(root)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.fresh_seconds = fresh_seconds
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        # key -> [size, last_used]; rebuilt from the files on disk
+        self._index: Dict[str, list] = {}
+        self._total_bytes = 0
+        self._writes = 0
+        self.stats = {"fresh_hits": 0, "revalidated": 0, "misses": 0, "stored": 0, "evicted": 0}
+        self._scan()
+
+    # ───── keys and storage ─────
+
+    @staticmethod
+    def key_for(url: str, params: Optional[Dict[str, Any]] = None, vary: str = "") -> str:
+        """Stable key for URL + params (+ a caller-supplied vary value, e.g. a token fingerprint)."""
+        canonical = json.dumps([url, sorted((params or {}).items()), vary], default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> pathlib.Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def _scan(self) -> None:
+        for path in self.root.glob("*/*.json"):
+            try:
+                st = path.stat()
+                self._index[path.stem] = [st.st_size, st.st_mtime]
+                self._total_bytes += st.st_size
+            except OSError:
+                continue
+
+    def _drop(self, key: str) -> None:
+        size, _ = self._index.pop(key, (0, 0))
+        self._total_bytes -= size
+        self._path(key).unlink(missing_ok=True)
+
+    # ───── lookups ─────
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored entry for ``key`` unless missing or past its TTL."""
+        if key not in self._index:
+            return None
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except Exception:
+            self._drop(key)
+            return None
+
+        if self.ttl_seconds and time.time() - entry.get("validated_at", 0) > self.ttl_seconds:
+            self._drop(key)
+            return None
+
+        self._index[key][1] = time.time()
+        return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """True if the entry was validated recently enough to skip the network."""
+        return bool(self.fresh_seconds) and time.time() - entry.get("validated_at", 0) < self.fresh_seconds
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    # ───── updates ─────
+
+    def put(self, key: str, url: str, headers: httpx.Headers, body: Any) -> None:
+        """Store a 200 response body if it carries a validator."""
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if not etag and not last_modified:
+            return
+
+        now = time.time()
+        entry = {"url": url, "etag": etag, "last_modified": last_modified,
+                 "stored_at": now, "validated_at": now, "body": body}
+        path = self._path(key)
+        if not save_json_atomic(path, entry):
+            return
+
+        self._drop_from_index(key)
+        size = path.stat().st_size
+        self._index[key] = [size, now]
+        self._total_bytes += size
+        self.stats["stored"] += 1
+
+        self._writes += 1
+        if self._writes % self.EVICT_CHECK_EVERY == 0 or self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def revalidated(self, key: str, entry: Dict[str, Any]) -> None:
+        """Record a 304: the stored body is current again."""
+        entry["validated_at"] = time.time()
+        save_json_atomic(self._path(key), entry)
+        self.stats["revalidated"] += 1
+
+    def _drop_from_index(self, key: str) -> None:
+        size, _ = self._index.pop(key, (0, 0))
+        self._total_bytes -= size
+
+    def evict(self) -> int:
+        """Drop expired entries, then least recently used ones until under ``max_bytes``."""
+        evicted = 0
+        if self._total_bytes > self.max_bytes:
+            # Evict down to 90% so the next few writes don't trigger another pass
+            target = int(self.max_bytes * 0.9)
+            for key, _ in sorted(self._index.items(), key=lambda kv: kv[1][1]):
+                if self._total_bytes <= target:
+                    break
+                self._drop(key)
+                evicted += 1
+
+        if self.ttl_seconds:
+            cutoff = time.time() - self.ttl_seconds
+            for key in [k for k, (_, last_used) in self._index.items() if last_used < cutoff]:
+                self._drop(key)
+                evicted += 1
+
+        self.stats["evicted"] += evicted
+        return evicted
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "entries": len(self._index), "bytes": self._total_bytes}
+
+
+# Process-wide caches, one per namespace root
+_caches: Dict[str, ResponseCache] = {}
+
+
+def get_response_cache(job_output_dir: str, namespace: str,
+                       logger: Optional[logging.Logger] = None) -> Optional[ResponseCache]:
+    """
+    Return the shared cache for ``namespace``. Defaults to
+    ``<data_root>/_http_cache/<namespace>`` (job directories live at
+    ``<data_root>/<task>/<job_id>``) unless HTTP_CACHE_ROOT is set.
+    Returns None if the cache cannot be created.
+    """
+    base = pathlib.Path(HTTP_CACHE_ROOT) if HTTP_CACHE_ROOT else \
+        pathlib.Path(job_output_dir).resolve().parent.parent / "_http_cache"
+    root = base / namespace
+    key = str(root)
+    if key not in _caches:
+        try:
+            _caches[key] = ResponseCache(root)
+        except Exception as e:
+            if logger:
+                logger.warning(f"Response cache unavailable at {root}: {e}")
+            return None
+    return _caches[key]
@@ -0,0 +1,190 @@
+"""Process-wide pooled HTTP transports shared by all scraping tasks.
+
+Tasks used to open a fresh ``httpx.AsyncClient`` per job (or per download),
+paying DNS, TCP and TLS setup again for hosts like api.github.com and
+open.data.gov.sa on every run. This module keeps one connection-pooling
+transport per proxy configuration for the lifetime of the service. Tasks
+borrow lightweight clients on top of it: each borrowed client has its own
+headers, timeout and cookie jar (so jobs never see each other's cookies),
+while keep-alive connections and TLS sessions are reused across jobs.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+from prometheus_client import Counter
+
+
+HTTP_POOL_MAX_CONNECTIONS: int = int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", "100"))
+HTTP_POOL_MAX_KEEPALIVE: int = int(os.getenv("HTTP_POOL_MAX_KEEPALIVE", "40"))
+HTTP_POOL_KEEPALIVE_EXPIRY: float = float(os.getenv("HTTP_POOL_KEEPALIVE_EXPIRY", "60"))
+HTTP_POOL_HTTP2: bool = os.getenv("HTTP_POOL_HTTP2", "true").lower() != "false"
+
+# HTTP/2 needs the optional 'h2' package
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+HTTP_POOL_REQUESTS = Counter(
+    "browser_http_pool_requests_total",
+    "Outbound HTTP requests through the shared pool",
+    labelnames=["pool", "connection"],
+)
+HTTP_POOL_TLS_HANDSHAKES = Counter(
+    "browser_http_pool_tls_handshakes_total",
+    "TLS handshakes performed by the shared pool",
+    labelnames=["pool"],
+)
+
+MAX_TRACKED_HOSTS = 200
+
+
+class _MeteredTransport(httpx.AsyncBaseTransport):
+    """Wrap a pooled transport and record whether each request reused a connection."""
+
+    def __init__(self, inner: httpx.AsyncHTTPTransport, pool_name: str, stats: Dict[str, Any]):
+        self._inner = inner
+        self._pool_name = pool_name
+        self._stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        events = {"connect": False, "tls": False}
+        previous_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                events["connect"] = True
+            elif event_name == "connection.start_tls.complete":
+                events["tls"] = True
+            if previous_trace:
+                await previous_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        try:
+            return await self._inner.handle_async_request(request)
+        finally:
+            self._record(request.url.host, events)
+
+    def _record(self, host: str, events: Dict[str, bool]) -> None:
+        connection = "new" if events["connect"] else "reused"
+        HTTP_POOL_REQUESTS.labels(self._pool_name, connection).inc()
+        if events["tls"]:
+            HTTP_POOL_TLS_HANDSHAKES.labels(self._pool_name).inc()
+
+        self._stats["requests"] += 1
+        self._stats["new_connections"] += int(events["connect"])
+        self._stats["tls_handshakes"] += int(events["tls"])
+
+        hosts = self._stats["hosts"]
+        if host in hosts or len(hosts) < MAX_TRACKED_HOSTS:
+            entry = hosts.setdefault(host, {"requests": 0, "new_connections": 0})
+            entry["requests"] += 1
+            entry["new_connections"] += int(events["connect"])
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class HttpClientPool:
+    """One pooled transport per proxy; tasks borrow clients via ``client()``."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger("browser.http_pool")
+        self.http2 = HTTP_POOL_HTTP2 and H2_AVAILABLE
+        self.limits = httpx.Limits(
+            max_connections=HTTP_POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_POOL_MAX_KEEPALIVE,
+            keepalive_expiry=HTTP_POOL_KEEPALIVE_EXPIRY,
+        )
+        self._transports: Dict[str, _MeteredTransport] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def _transport_for(self, proxy: Optional[str]) -> _MeteredTransport:
+        key = proxy or "direct"
+        if key not in self._transports:
+            inner = httpx.AsyncHTTPTransport(
+                http2=self.http2,
+                limits=self.limits,
+                proxy=proxy,
+                retries=1,  # retry connection failures once (stale keep-alive, resets)
+            )
+            stats = {"requests": 0, "new_connections": 0, "tls_handshakes": 0, "hosts": {}}
+            pool_name = "direct" if not proxy else f"proxy-{len(self._transports)}"
+            self._transports[key] = _MeteredTransport(inner, pool_name, stats)
+            self._stats[pool_name] = stats
+            self.logger.info(f"Created pooled HTTP transport '{pool_name}' (http2={self.http2})")
+        return self._transports[key]
+
+    @asynccontextmanager
+    async def client(
+        self,
+        *,
+        proxy: Optional[str] = None,
+        timeout: httpx.Timeout | float = httpx.Timeout(30.0, connect=10.0),
+        headers: Optional[Dict[str, str]] = None,
+        follow_redirects: bool = True,
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Borrow a client backed by the shared transport. The client is not closed
+        on exit: closing it would tear down the pooled connections.
+        """
+        yield httpx.AsyncClient(
+            transport=self._transport_for(proxy),
+            timeout=timeout,
+            headers=headers,
+            follow_redirects=follow_redirects,
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        pools = {}
+        for name, stats in self._stats.items():
+            requests = stats["requests"]
+            pools[name] = {
+                "requests": requests,
+                "new_connections": stats["new_connections"],
+                "tls_handshakes": stats["tls_handshakes"],
+                "connection_reuse_ratio": round(1 - stats["new_connections"] / requests, 3) if requests else None,
+                "top_hosts": dict(sorted(
+                    stats["hosts"].items(), key=lambda kv: kv[1]["requests"], reverse=True
+                )[:20]),
+            }
+        return {
+            "http2_enabled": self.http2,
+            "limits": {
+                "max_connections": HTTP_POOL_MAX_CONNECTIONS,
+                "max_keepalive_connections": HTTP_POOL_MAX_KEEPALIVE,
+                "keepalive_expiry_seconds": HTTP_POOL_KEEPALIVE_EXPIRY,
+            },
+            "pools": pools,
+        }
+
+    async def aclose(self) -> None:
+        for transport in self._transports.values():
+            try:
+                await transport.aclose()
+            except Exception as e:
+                self.logger.warning(f"Error closing pooled HTTP transport: {e}")
+        self._transports.clear()
+
+
+_pool: Optional[HttpClientPool] = None
+
+
+def get_http_pool() -> HttpClientPool:
+    """Return the process-wide client pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = HttpClientPool()
+    return _pool
+
+
+async def close_http_pool() -> None:
+    """Close all pooled connections (service shutdown)."""
+    global _pool
+    if _pool is not None:
+        await _pool.aclose()
+        _pool = None
@@ -14,7 +14,8 @@ import datetime
 import json
 import logging
 import uuid
-from typing import Any, Dict, Optional, List
+from collections import deque
+from typing import Any, Deque, Dict, Optional, List, Tuple
 from enum import Enum
 
 # Optional Redis dependency with graceful fallback
@@ -30,8 +31,22 @@ except ImportError:
     redis = RedisPlaceholder()
     REDIS_AVAILABLE = False
 
+from prometheus_client import Histogram
 from pydantic import BaseModel, Field
 
+from .reliability.result_cache import fingerprint_params
+
+
+JOB_QUEUE_WAIT = Histogram(
+    "browser_job_queue_wait_seconds",
+    "Time jobs spend queued before a worker starts them",
+    labelnames=["lane"],
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1200, 3600),
+)
+
+# "<lane>:<weight>=<task prefixes>" entries separated by ';' ("*" marks the default lane)
+DEFAULT_JOB_LANES = "long:1=booking,airbnb,twitter;short:3=*"
+
 
 class JobStatus(str, Enum):
     """Job status enumeration with clear lifecycle states."""
@@ -61,6 +76,9 @@ class JobRecord(BaseModel):
     timeout_seconds: int = 300  # 5 minutes default
     worker_id: Optional[str] = None
     priority: int = 0  # Higher numbers = higher priority
+    progress: Optional[Dict[str, Any]] = None  # Task-reported progress/ETA while running
+    fingerprint: Optional[str] = None  # Canonical task + params hash used for deduplication
+    lane: Optional[str] = None  # Queue lane, assigned from the task name on submit
 
     @property
     def status_with_elapsed(self) -> str:
@@ -97,6 +115,48 @@ class JobRecord(BaseModel):
         return self.retry_count < self.max_retries and self.status in [JobStatus.FAILED, JobStatus.TIMEOUT]
 
 
+class JobLane(BaseModel):
+    """A named queue; lanes share workers by weighted fair scheduling."""
+
+    name: str
+    weight: int = 1
+    tasks: List[str] = []  # Task-name prefixes routed here; empty for the default lane
+
+
+def parse_job_lanes(spec: str) -> Dict[str, JobLane]:
+    """Parse a lane spec like ``"long:1=booking,airbnb;short:3=*"``."""
+    lanes: Dict[str, JobLane] = {}
+    for entry in filter(None, (part.strip() for part in spec.split(";"))):
+        try:
+            head, tasks = entry.split("=", 1)
+            name, _, weight = head.partition(":")
+            lane = JobLane(
+                name=name.strip(),
+                weight=int(weight or 1),
+                tasks=[t.strip() for t in tasks.split(",") if t.strip() and t.strip() != "*"]
+            )
+        except ValueError:
+            raise ValueError(f"Invalid job lane '{entry}' (expected '<name>:<weight>=<tasks>')")
+        if not lane.name or lane.weight < 1:
+            raise ValueError(f"Invalid job lane '{entry}'")
+        lanes[lane.name] = lane
+    if not any(not lane.tasks for lane in lanes.values()):
+        lanes["default"] = JobLane(name="default")
+    return lanes
+
+
+def parse_lane_reservations(spec: str) -> Dict[str, int]:
+    """Parse worker reservations like ``"short=1,long=1"``."""
+    reservations: Dict[str, int] = {}
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        lane, _, count = entry.partition("=")
+        try:
+            reservations[lane.strip()] = int(count)
+        except ValueError:
+            raise ValueError(f"Invalid lane reservation '{entry}' (expected '<lane>=<workers>')")
+    return reservations
+
+
 class SubmitRequest(BaseModel):
     """Enhanced job submission with reliability features."""
 
@@ -107,6 +167,7 @@ class SubmitRequest(BaseModel):
     priority: int = 0  # Higher numbers = higher priority
     max_retries: int = 3
     scrape_mode: str = "full"  # INCREMENTAL SCRAPING: "full" or "incremental"
+    no_cache: bool = False  # Always run: skip submit deduplication and cached results
 
     class Config:
         extra = "allow"
@@ -115,7 +176,8 @@ class SubmitRequest(BaseModel):
 class JobStore:
     """Job store with Redis backing and graceful in-memory fallback."""
 
-    def __init__(self, redis_url: str = "redis://localhost:6379/0", logger: Optional[logging.Logger] = None):
+    def __init__(self, redis_url: str = "redis://localhost:6379/0", logger: Optional[logging.Logger] = None,
+                 lanes: Optional[Dict[str, JobLane]] = None):
         self.redis_url = redis_url
         self.logger = logger or logging.getLogger(__name__)
         self.redis_client: Optional[redis.Redis] = None
@@ -123,19 +185,32 @@ class JobStore:
 
         # Redis key patterns
         self.job_key_pattern = "job:{job_id}"
+        # Unlaned keys from before lanes existed; drained as part of the default lane
         self.queue_key = "job_queue"
         self.priority_queue_key = "priority_job_queue"
+        self.lane_queue_key_pattern = "job_queue:{lane}"
+        self.lane_priority_queue_key_pattern = "priority_job_queue:{lane}"
         self.running_jobs_key = "running_jobs"
         self.worker_heartbeat_key = "worker_heartbeat:{worker_id}"
         # Phase 2.4: Dead Letter Queue
         self.dlq_key = "dead_letter_queue"
         self.dlq_job_key_pattern = "dlq_job:{job_id}"
+        # Deduplication: fingerprint -> job_id of the latest identical job
+        self.fingerprint_key_pattern = "job_fingerprint:{fingerprint}"
+        self.fingerprint_ttl_seconds = 24 * 3600
 
         # In-memory fallback storage when Redis unavailable
         self.memory_jobs: Dict[str, JobRecord] = {}
-        self.memory_queue: List[str] = []
+        self.memory_queues: Dict[str, List[str]] = {}
         self.memory_running: Dict[str, str] = {}  # job_id -> worker_id
         self.memory_dlq: List[str] = []
+        self.memory_fingerprints: Dict[str, str] = {}
+
+        # Lanes with smooth weighted round-robin credit and recent queue waits
+        self.lanes = lanes or parse_job_lanes(DEFAULT_JOB_LANES)
+        self.default_lane = next(name for name, lane in self.lanes.items() if not lane.tasks)
+        self._lane_credit: Dict[str, int] = {name: 0 for name in self.lanes}
+        self._lane_waits: Dict[str, Deque[float]] = {name: deque(maxlen=500) for name in self.lanes}
 
     async def connect(self) -> None:
         """Initialize Redis connection with graceful fallback."""
@@ -160,36 +235,142 @@ class JobStore:
 
     async def add_job(self, job: JobRecord) -> None:
         """Add a new job to the store and queue."""
+        job.lane = self.lane_for(job.task_name)
         if self.use_redis and self.redis_client:
             # Redis-based storage
             job_key = self.job_key_pattern.format(job_id=job.job_id)
             job_data = job.json()
             await self.redis_client.set(job_key, job_data)
-
-            # Add to appropriate queue based on priority
-            if job.priority > 0:
-                await self.redis_client.zadd(self.priority_queue_key, {job.job_id: job.priority})
-            else:
-                await self.redis_client.lpush(self.queue_key, job.job_id)
         else:
             # In-memory fallback storage
             self.memory_jobs[job.job_id] = job
-            # Simple priority queue implementation for in-memory
+
+        await self._enqueue(job)
+        self.logger.info(f"Added job {job.job_id} to lane '{job.lane}' with priority {job.priority}")
+
+    # ───── lanes ─────
+
+    def lane_for(self, task_name: str) -> str:
+        """Lane for a task: the first lane listing a matching task prefix, else the default lane."""
+        for name, lane in self.lanes.items():
+            if any(task_name.startswith(prefix) for prefix in lane.tasks):
+                return name
+        return self.default_lane
+
+    def _lane_keys(self, lane: str) -> Tuple[str, str]:
+        return (self.lane_queue_key_pattern.format(lane=lane),
+                self.lane_priority_queue_key_pattern.format(lane=lane))
+
+    async def _enqueue(self, job: JobRecord) -> None:
+        """Queue a job on its lane (priority jobs first, then FIFO)."""
+        lane = job.lane or self.lane_for(job.task_name)
+        if self.use_redis and self.redis_client:
+            queue_key, priority_key = self._lane_keys(lane)
             if job.priority > 0:
-                # Insert in priority order (higher priority first)
-                inserted = False
-                for i, existing_job_id in enumerate(self.memory_queue):
-                    existing_job = self.memory_jobs.get(existing_job_id)
-                    if existing_job and existing_job.priority < job.priority:
-                        self.memory_queue.insert(i, job.job_id)
-                        inserted = True
-                        break
-                if not inserted:
-                    self.memory_queue.append(job.job_id)
+                await self.redis_client.zadd(priority_key, {job.job_id: job.priority})
             else:
-                self.memory_queue.append(job.job_id)
+                await self.redis_client.lpush(queue_key, job.job_id)
+            return
+
+        queue = self.memory_queues.setdefault(lane, [])
+        # Simple priority queue implementation for in-memory
+        if job.priority > 0:
+            # Insert in priority order (higher priority first)
+            for i, existing_job_id in enumerate(queue):
+                existing_job = self.memory_jobs.get(existing_job_id)
+                if existing_job and existing_job.priority < job.priority:
+                    queue.insert(i, job.job_id)
+                    return
+        queue.append(job.job_id)
+
+    async def _lane_depths(self, lanes: List[str]) -> Dict[str, Tuple[int, int]]:
+        """(regular, priority) queued counts per lane."""
+        if self.use_redis and self.redis_client:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for lane in lanes:
+                queue_key, priority_key = self._lane_keys(lane)
+                pipe.llen(queue_key)
+                pipe.zcard(priority_key)
+            pipe.llen(self.queue_key)
+            pipe.zcard(self.priority_queue_key)
+            counts = await pipe.execute()
+            depths = {lane: (counts[2 * i], counts[2 * i + 1]) for i, lane in enumerate(lanes)}
+            if self.default_lane in depths:
+                regular, priority = depths[self.default_lane]
+                depths[self.default_lane] = (regular + counts[-2], priority + counts[-1])
+            return depths
+
+        depths = {}
+        for lane in lanes:
+            queue = self.memory_queues.get(lane, [])
+            priority = sum(1 for job_id in queue
+                           if job_id in self.memory_jobs and self.memory_jobs[job_id].priority > 0)
+            depths[lane] = (len(queue) - priority, priority)
+        return depths
+
+    def _pick_lane(self, pending: List[str]) -> str:
+        """Smooth weighted round-robin: each lane gets turns in proportion to its weight."""
+        total = 0
+        best = None
+        for lane in pending:
+            self._lane_credit[lane] = self._lane_credit.get(lane, 0) + self.lanes[lane].weight
+            total += self.lanes[lane].weight
+            if best is None or self._lane_credit[lane] > self._lane_credit[best]:
+                best = lane
+        self._lane_credit[best] -= total
+        return best
+
+    async def _dequeue(self, lane: str) -> Optional[str]:
+        if self.use_redis and self.redis_client:
+            queue_key, priority_key = self._lane_keys(lane)
+            keys = [(priority_key, queue_key)]
+            if lane == self.default_lane:
+                keys.append((self.priority_queue_key, self.queue_key))
+            for priority_key, queue_key in keys:
+                # ZPOPMAX is atomic, so two workers can never take the same priority job
+                popped = await self.redis_client.zpopmax(priority_key)
+                if popped:
+                    return popped[0][0]
+                job_id = await self.redis_client.rpop(queue_key)
+                if job_id:
+                    return job_id
+            return None
 
-        self.logger.info(f"Added job {job.job_id} to queue with priority {job.priority}")
+        queue = self.memory_queues.get(lane)
+        return queue.pop(0) if queue else None
+
+    async def get_job_for_fingerprint(self, fingerprint: str) -> Optional[str]:
+        """Job ID last registered for a fingerprint, if any."""
+        if self.use_redis and self.redis_client:
+            return await self.redis_client.get(self.fingerprint_key_pattern.format(fingerprint=fingerprint))
+        return self.memory_fingerprints.get(fingerprint)
+
+    async def claim_fingerprint(self, fingerprint: str, job_id: str, replace: Optional[str] = None) -> bool:
+        """
+        Register ``job_id`` for a fingerprint. Only succeeds if no job holds it
+        yet, or it is still held by ``replace`` (a finished job being superseded),
+        so concurrent identical submissions across pods elect a single job.
+        """
+        if self.use_redis and self.redis_client:
+            key = self.fingerprint_key_pattern.format(fingerprint=fingerprint)
+            if replace is None:
+                return bool(await self.redis_client.set(key, job_id, nx=True, ex=self.fingerprint_ttl_seconds))
+            # Compare-and-set so two pods can't both supersede the same finished job
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                try:
+                    await pipe.watch(key)
+                    if await pipe.get(key) != replace:
+                        return False
+                    pipe.multi()
+                    pipe.set(key, job_id, ex=self.fingerprint_ttl_seconds)
+                    await pipe.execute()
+                    return True
+                except redis.WatchError:
+                    return False
+        if self.memory_fingerprints.get(fingerprint) != replace:
+            return False
+        self.memory_fingerprints[fingerprint] = job_id
+        return True
 
     async def get_job(self, job_id: str) -> Optional[JobRecord]:
         """Retrieve a job by ID."""
@@ -215,24 +396,24 @@ class JobStore:
             # In-memory fallback update
             self.memory_jobs[job.job_id] = job
 
-    async def get_next_job(self) -> Optional[str]:
-        """Get the next job ID from the queue (priority first, then FIFO)."""
-        if self.use_redis and self.redis_client:
-            # Redis-based queue retrieval
-            # Check priority queue first
-            priority_jobs = await self.redis_client.zrevrange(self.priority_queue_key, 0, 0)
-            if priority_jobs:
-                job_id = priority_jobs[0]
-                await self.redis_client.zrem(self.priority_queue_key, job_id)
+    async def get_next_job(self, lanes: Optional[List[str]] = None) -> Optional[str]:
+        """
+        Get the next job ID, choosing among non-empty lanes by weight (priority
+        first, then FIFO within a lane). ``lanes`` restricts the choice, e.g. for
+        workers reserved to one lane.
+        """
+        candidates = [lane for lane in (lanes or self.lanes) if lane in self.lanes]
+        depths = await self._lane_depths(candidates)
+        pending = [lane for lane in candidates if sum(depths.get(lane, (0, 0)))]
+
+        while pending:
+            lane = self._pick_lane(pending)
+            job_id = await self._dequeue(lane)
+            if job_id:
                 return job_id
-            # Then check regular queue
-            job_id = await self.redis_client.rpop(self.queue_key)
-            return job_id
-        else:
-            # In-memory fallback queue retrieval
-            if self.memory_queue:
-                return self.memory_queue.pop(0)
-            return None
+            # Another worker emptied this lane in the meantime
+            pending.remove(lane)
+        return None
 
     async def mark_job_running(self, job_id: str, worker_id: str) -> None:
         """Mark a job as running and track the worker."""
@@ -245,6 +426,13 @@ class JobStore:
         job.last_heartbeat = datetime.datetime.utcnow()
         job.worker_id = worker_id
 
+        if job.retry_count == 0:
+            # Retries keep the original created_at, so only first attempts measure queue wait
+            lane = job.lane or self.lane_for(job.task_name)
+            wait_seconds = (job.started_at - job.created_at).total_seconds()
+            JOB_QUEUE_WAIT.labels(lane).observe(wait_seconds)
+            self._lane_waits.setdefault(lane, deque(maxlen=500)).append(wait_seconds)
+
         await self.update_job(job)
 
         if self.use_redis and self.redis_client:
@@ -253,6 +441,12 @@ class JobStore:
             # In-memory fallback tracking
             self.memory_running[job_id] = worker_id
 
+    async def requeue_job(self, job_id: str) -> None:
+        """Put a dequeued job that was not started back on its lane (no retry is counted)."""
+        job = await self.get_job(job_id)
+        if job and job.status == JobStatus.QUEUED:
+            await self._enqueue(job)
+
     async def mark_job_completed(self, job_id: str, result: Dict[str, Any]) -> None:
         """Mark a job as completed with results."""
         job = await self.get_job(job_id)
@@ -290,26 +484,7 @@ class JobStore:
             delay_seconds = min(60 * (2 ** job.retry_count), 600)  # Max 10 minutes
             await asyncio.sleep(delay_seconds)
 
-            if self.use_redis and self.redis_client:
-                if job.priority > 0:
-                    await self.redis_client.zadd(self.priority_queue_key, {job.job_id: job.priority})
-                else:
-                    await self.redis_client.lpush(self.queue_key, job.job_id)
-            else:
-                # In-memory re-queueing with priority
-                if job.priority > 0:
-                    # Insert in priority order
-                    inserted = False
-                    for i, existing_job_id in enumerate(self.memory_queue):
-                        existing_job = self.memory_jobs.get(existing_job_id)
-                        if existing_job and existing_job.priority < job.priority:
-                            self.memory_queue.insert(i, job.job_id)
-                            inserted = True
-                            break
-                    if not inserted:
-                        self.memory_queue.append(job.job_id)
-                else:
-                    self.memory_queue.append(job.job_id)
+            await self._enqueue(job)
 
             self.logger.info(f"Retrying job {job_id} (attempt {job.retry_count}/{job.max_retries})")
         else:
@@ -336,27 +511,40 @@ class JobStore:
         if job.status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]:
             return False
 
+        was_queued = job.status == JobStatus.QUEUED
         job.status = JobStatus.CANCELLED
         job.finished_at = datetime.datetime.utcnow()
 
         await self.update_job(job)
 
+        lane = job.lane or self.lane_for(job.task_name)
         if self.use_redis and self.redis_client:
             await self.redis_client.srem(self.running_jobs_key, job_id)
             # Remove from queues if not started
-            if job.status == JobStatus.QUEUED:
-                await self.redis_client.lrem(self.queue_key, 0, job_id)
-                await self.redis_client.zrem(self.priority_queue_key, job_id)
+            if was_queued:
+                queue_key, priority_key = self._lane_keys(lane)
+                for key in (queue_key, self.queue_key):
+                    await self.redis_client.lrem(key, 0, job_id)
+                for key in (priority_key, self.priority_queue_key):
+                    await self.redis_client.zrem(key, job_id)
         else:
             # In-memory cleanup
             self.memory_running.pop(job_id, None)
             # Remove from in-memory queue if not started
-            if job_id in self.memory_queue:
-                self.memory_queue.remove(job_id)
+            queue = self.memory_queues.get(lane, [])
+            if job_id in queue:
+                queue.remove(job_id)
 
         self.logger.info(f"Cancelled job {job_id}")
         return True
 
+    async def update_progress(self, job_id: str, progress: Dict[str, Any]) -> None:
+        """Record task-reported progress on a running job."""
+        job = await self.get_job(job_id)
+        if job and job.status == JobStatus.RUNNING:
+            job.progress = {**progress, "updated_at": datetime.datetime.utcnow().isoformat()}
+            await self.update_job(job)
+
     async def update_heartbeat(self, job_id: str, worker_id: str) -> None:
         """Update job heartbeat to indicate worker is alive."""
         job = await self.get_job(job_id)
@@ -409,19 +597,16 @@ class JobStore:
 
     async def get_queue_stats(self) -> Dict[str, Any]:
         """Get queue statistics for monitoring."""
+        depths = await self._lane_depths(list(self.lanes))
+        regular_queue_size = sum(regular for regular, _ in depths.values())
+        priority_queue_size = sum(priority for _, priority in depths.values())
+
         if self.use_redis and self.redis_client:
-            regular_queue_size = await self.redis_client.llen(self.queue_key)
-            priority_queue_size = await self.redis_client.zcard(self.priority_queue_key)
             running_jobs_count = await self.redis_client.scard(self.running_jobs_key)
             # Phase 2.4: Include DLQ stats
             dlq_stats = await self.get_dlq_stats()
         else:
             # In-memory fallback stats
-            # Count priority jobs in memory queue
-            priority_count = sum(1 for job_id in self.memory_queue
-                               if job_id in self.memory_jobs and self.memory_jobs[job_id].priority > 0)
-            regular_queue_size = len(self.memory_queue) - priority_count
-            priority_queue_size = priority_count
             running_jobs_count = len(self.memory_running)
             # Simple DLQ stats for memory mode
             dlq_stats = {
@@ -435,9 +620,27 @@ class JobStore:
             "priority_queue_size": priority_queue_size,
             "running_jobs_count": running_jobs_count,
             "total_queued": regular_queue_size + priority_queue_size,
+            "lanes": {
+                name: {
+                    "weight": lane.weight,
+                    "tasks": lane.tasks or ["*"],
+                    "queued": sum(depths.get(name, (0, 0))),
+                    **self._wait_percentiles(name)
+                }
+                for name, lane in self.lanes.items()
+            },
             "dead_letter_queue": dlq_stats
         }
 
+    def _wait_percentiles(self, lane: str) -> Dict[str, float]:
+        waits = sorted(self._lane_waits.get(lane, ()))
+        if not waits:
+            return {"wait_p50_seconds": 0.0, "wait_p95_seconds": 0.0}
+        return {
+            "wait_p50_seconds": round(waits[len(waits) // 2], 1),
+            "wait_p95_seconds": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))], 1)
+        }
+
     async def list_running_jobs(self) -> List[JobRecord]:
         """Get list of currently running jobs."""
         if self.use_redis and self.redis_client:
@@ -580,10 +783,14 @@ class JobStore:
 class JobManager:
     """High-level job management interface."""
 
-    def __init__(self, job_store: JobStore, logger: Optional[logging.Logger] = None):
+    def __init__(self, job_store: JobStore, logger: Optional[logging.Logger] = None,
+                 dedup_fresh_seconds: int = 600):
         self.job_store = job_store
         self.logger = logger or logging.getLogger(__name__)
         self._cleanup_task: Optional[asyncio.Task] = None
+        # Completed identical jobs younger than this are returned instead of re-running
+        self.dedup_fresh_seconds = dedup_fresh_seconds
+        self.dedup_stats = {"new": 0, "attached": 0, "completed": 0}
 
     async def start(self) -> None:
         """Start the job manager and cleanup task."""
@@ -614,20 +821,67 @@ class JobManager:
         max_retries: int = 3
     ) -> str:
         """Submit a new job and return job ID."""
-        job_id = uuid.uuid4().hex
+        job, _ = await self.submit_or_attach(task_name, params, timeout_seconds, priority, max_retries)
+        return job.job_id
+
+    async def submit_or_attach(
+        self,
+        task_name: str,
+        params: Dict[str, Any],
+        timeout_seconds: int = 300,
+        priority: int = 0,
+        max_retries: int = 3
+    ) -> Tuple[JobRecord, str]:
+        """
+        Submit a job unless an identical one can serve it.
+
+        Returns ``(job, outcome)`` where outcome is ``"attached"`` (an identical
+        job is queued or running), ``"completed"`` (an identical job finished
+        within ``dedup_fresh_seconds``) or ``"new"``. Params with ``no_cache``
+        always create a new job.
+        """
+        fingerprint = fingerprint_params(task_name, params)
+        dedupe = not params.get("no_cache")
 
         job = JobRecord(
-            job_id=job_id,
+            job_id=uuid.uuid4().hex,
             task_name=task_name,
             params=params,
             timeout_seconds=timeout_seconds,
             priority=priority,
-            max_retries=max_retries
+            max_retries=max_retries,
+            fingerprint=fingerprint
         )
 
+        if dedupe:
+            # Two rounds: a lost claim race means another submitter just created the job
+            for _ in range(2):
+                existing_id = await self.job_store.get_job_for_fingerprint(fingerprint)
+                existing = await self.job_store.get_job(existing_id) if existing_id else None
+                outcome = self._reuse_outcome(existing)
+                if outcome:
+                    self.dedup_stats[outcome] += 1
+                    self.logger.info(f"Deduplicated {task_name} submission onto job {existing.job_id} ({outcome})")
+                    return existing, outcome
+                if await self.job_store.claim_fingerprint(fingerprint, job.job_id, replace=existing_id):
+                    break
+
         await self.job_store.add_job(job)
-        self.logger.info(f"Submitted job {job_id} for task {task_name}")
-        return job_id
+        self.dedup_stats["new"] += 1
+        self.logger.info(f"Submitted job {job.job_id} for task {task_name}")
+        return job, "new"
+
+    def _reuse_outcome(self, job: Optional[JobRecord]) -> Optional[str]:
+        """How an existing identical job can serve a new submission, if at all."""
+        if not job:
+            return None
+        if job.status in (JobStatus.QUEUED, JobStatus.RUNNING):
+            return "attached"
+        if job.status == JobStatus.COMPLETED and job.finished_at and self.dedup_fresh_seconds > 0:
+            age = (datetime.datetime.utcnow() - job.finished_at).total_seconds()
+            if age <= self.dedup_fresh_seconds:
+                return "completed"
+        return None
 
     async def get_job_status(self, job_id: str) -> Optional[JobRecord]:
         """Get current job status."""
@@ -644,6 +898,7 @@ class JobManager:
 
         return {
             **queue_stats,
+            "deduplication": dict(self.dedup_stats),
             "running_jobs": [
                 {
                     "job_id": job.job_id,
@@ -654,7 +909,8 @@ class JobManager:
                         (datetime.datetime.utcnow() - job.started_at).total_seconds()
                         if job.started_at else 0
                     ),
-                    "status": job.status_with_elapsed
+                    "status": job.status_with_elapsed,
+                    "progress": job.progress
                 }
                 for job in running_jobs
             ]
@@ -40,8 +40,10 @@ from .exploration import PageExplorer
 config = get_config()
 
 # Import reliable infrastructure
-from .jobs import JobStore, JobManager, JobRecord, SubmitRequest
+from .jobs import JobStore, JobManager, JobRecord, SubmitRequest, parse_job_lanes, parse_lane_reservations
 from .workers import WorkerPool
+from .http_pool import get_http_pool, close_http_pool
+from .resource_sampler import get_resource_sampler, stop_resource_sampler
 from .tasks import task_registry, normalise_task
 from .reliability import MetricsCollector, AlertManager, HealthMonitor, AlertSeverity
 
@@ -303,13 +305,20 @@ async def submit_job(task_name: str, body: SubmitRequest, request: Request):
 
     try:
         # Submit job with reliability features
-        job_id = await job_manager.submit_job(
+        job, outcome = await job_manager.submit_or_attach(
             task_name=task_name,
             params=params,
             timeout_seconds=timeout_seconds,
             priority=priority,
             max_retries=max_retries
         )
+        job_id = job.job_id
+
+        if outcome == "completed":
+            # Identical job finished recently - hand back its result directly
+            return {"job_id": job_id, "deduplicated": outcome, "status": job.status.value, "result": job.result}
+        if outcome == "attached":
+            return {"job_id": job_id, "deduplicated": outcome, "status": job.status.value}
 
         service_logger.info(
             f"Submitted reliable job {job_id} for task '{task_name}' "
@@ -767,19 +776,31 @@ async def get_resource_metrics():
 
         return {
             "timestamp": datetime.datetime.utcnow().isoformat(),
+            "system": get_resource_sampler().snapshot().to_dict(),
             "resource_optimization": worker_stats.get("resource_optimization", {}),
             "service_throttling": worker_stats.get("service_throttling", {}),
             "scaling_status": {
                 "enabled": worker_stats.get("scaling_enabled", False),
                 "active": worker_stats.get("optimization_active", False),
                 "current_workers": worker_stats.get("worker_count", 0),
-                "max_workers": worker_stats.get("max_workers", 0)
+                "min_workers": worker_stats.get("min_workers", 0),
+                "max_workers": worker_stats.get("max_workers", 0),
+                "draining_workers": worker_stats.get("draining_workers", 0),
+                "autoscaler": worker_stats.get("autoscaling", {})
             }
         }
     except Exception as e:
         service_logger.error(f"Error getting resource metrics: {e}")
         raise HTTPException(status_code=500, detail="Error retrieving resource metrics")
 
+@app.get("/monitoring/http-pool")
+async def get_http_pool_stats():
+    """Shared HTTP connection pool configuration and connection reuse counters."""
+    return {
+        "timestamp": datetime.datetime.utcnow().isoformat(),
+        **get_http_pool().get_stats()
+    }
+
 @app.post("/monitoring/scale")
 async def manual_scaling(action: str):
     """Manual scaling control (for testing/emergencies)."""
@@ -965,17 +986,32 @@ async def get_service_level():
         raise HTTPException(status_code=500, detail="Error retrieving service level")
 
 
-@app.post("/fallback/cache/{service_name}")
-async def update_service_cache(service_name: str, cache_data: dict):
-    """Update cache for a specific service."""
+@app.post("/fallback/cache/{task_name}")
+async def update_service_cache(task_name: str, cache_data: dict):
+    """
+    Seed the result cache for one job of a task.
+
+    Body: ``{"params": {...}, "data": {...}, "ttl_seconds": 300}``; the entry is
+    keyed by task name plus the normalised params, like worker results.
+    """
     if not worker_pool:
         raise HTTPException(status_code=503, detail="Worker pool not initialized")
 
+    params = cache_data.get("params") or {}
+    data = cache_data.get("data")
+    if not isinstance(params, dict) or not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="Body must contain 'params' and 'data' objects")
+
     try:
-        worker_pool.fallback_manager.update_cache(service_name, cache_data)
-        return {"message": f"Cache updated for service '{service_name}'"}
+        ttl_seconds = float(cache_data.get("ttl_seconds", 300))
+        stored = await worker_pool.fallback_manager.result_cache.set(task_name, params, data, ttl_seconds)
+        if not stored:
+            raise HTTPException(status_code=400, detail="Result not cacheable (ttl_seconds must be > 0 and data JSON-serialisable)")
+        return {"message": f"Cache updated for task '{task_name}'"}
+    except HTTPException:
+        raise
     except Exception as e:
-        service_logger.error(f"Error updating cache for {service_name}: {e}")
+        service_logger.error(f"Error updating cache for {task_name}: {e}")
         raise HTTPException(status_code=500, detail=f"Error updating cache: {str(e)}")
 
 
@@ -1213,12 +1249,23 @@ async def on_startup() -> None:
             condition="lt"
         )
 
+        # Background resource sampling shared by monitors, probes and the worker pool
+        get_resource_sampler()
+
         # Redis configuration
         redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
         # Job management
-        job_store = JobStore(redis_url=redis_url, logger=service_logger)
-        job_manager = JobManager(job_store, logger=service_logger)
+        job_store = JobStore(
+            redis_url=redis_url,
+            logger=service_logger,
+            lanes=parse_job_lanes(config.scaling.job_lanes)
+        )
+        job_manager = JobManager(
+            job_store,
+            logger=service_logger,
+            dedup_fresh_seconds=int(os.getenv("JOB_DEDUP_FRESH_SECONDS", "600"))
+        )
         await job_manager.start()
         service_logger.info("✅ Reliable job manager started")
 
@@ -1253,10 +1300,17 @@ async def on_startup() -> None:
             data_root=config.system.data_root,
             logger=service_logger,
             max_workers=config.scaling.max_workers,
-            browser_runtime=browser_runtime  # Pass runtime for automatic browser restart
+            browser_runtime=browser_runtime,  # Pass runtime for automatic browser restart
+            min_workers=config.scaling.min_workers,
+            target_queue_wait_seconds=config.scaling.target_queue_wait_seconds,
+            worker_memory_mb=config.scaling.worker_memory_mb,
+            lane_reservations=parse_lane_reservations(config.scaling.lane_reservations)
         )
         await worker_pool.start()
-        service_logger.info(f"✅ Reliable worker pool started with {config.scaling.max_workers} workers")
+        service_logger.info(
+            f"✅ Reliable worker pool started with {worker_pool.min_workers} workers "
+            f"(autoscaling up to {config.scaling.max_workers})"
+        )
         service_logger.info("🔄 Automatic browser restart enabled")
 
         service_logger.info("🚀 Enhanced reliable browser automation service ready!")
@@ -1286,3 +1340,8 @@ async def on_shutdown() -> None:
     if browser_runtime:
         await browser_runtime.stop()
         service_logger.info("✅ Browser runtime stopped")
+
+    await close_http_pool()
+    service_logger.info("✅ HTTP connection pool closed")
+
+    stop_resource_sampler()
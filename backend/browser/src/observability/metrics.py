@@ -24,6 +24,8 @@ import asyncio
 from prometheus_client import Counter, Histogram, Gauge, Info, Enum as PrometheusEnum
 from prometheus_client import CollectorRegistry, generate_latest, CONTENT_TYPE_LATEST
 
+from ..resource_sampler import get_resource_sampler
+
 
 class MetricType(str, Enum):
     """Types of metrics to collect."""
@@ -437,15 +439,17 @@ class PerformanceMonitor:
     async def monitor_resource_usage(self) -> None:
         """Monitor system resource usage."""
         try:
-            import psutil
+            # Latest background sample - no blocking cpu_percent() on the event loop
+            snapshot = get_resource_sampler().snapshot()
+            if not snapshot.available:
+                self.logger.warning("psutil not available for resource monitoring")
+                return
 
-            # Get system metrics
-            memory = psutil.virtual_memory()
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = snapshot.cpu_percent
 
             # Update metrics
             self.metrics.set_resource_usage(
-                memory_bytes=memory.used,
+                memory_bytes=snapshot.memory_used_bytes,
                 cpu_percent=cpu_percent
             )
 
@@ -456,15 +460,14 @@ class PerformanceMonitor:
                     cpu_percent=cpu_percent
                 )
 
-            if memory.percent > 80:
+            if snapshot.memory_percent > 80:
                 self.logger.warning(
                     "High memory usage detected",
-                    memory_percent=memory.percent,
-                    memory_used_gb=memory.used / (1024**3)
+                    memory_percent=snapshot.memory_percent,
+                    memory_used_gb=snapshot.memory_used_bytes / (1024**3),
+                    browser_rss_gb=snapshot.browser_rss_bytes / (1024**3)
                 )
 
-        except ImportError:
-            self.logger.warning("psutil not available for resource monitoring")
         except Exception as e:
             self.logger.error(f"Resource monitoring failed: {e}")
 
@@ -16,6 +16,7 @@ from .fallback_manager import (
     FallbackManager, FallbackConfig, FallbackStrategy,
     ServiceLevel, FallbackExecution, ServiceHealth
 )
+from .result_cache import ResultCache, fingerprint_params
 from .stealth import (
     StealthManager, StealthLevel, UserAgentPool, TimingProfile, BrowserProfile
 )
@@ -23,7 +24,8 @@ from .stealth import (
 try:
     from .resource_manager import (
         ResourceMonitor, ResourceOptimizer, AdaptiveWorkerPool,
-        ConcurrencyThrottler, ResourceState, ScalingAction
+        ConcurrencyThrottler, ResourceState, ScalingAction,
+        QueueScalingController, ScalingDecision
     )
     RESOURCE_MANAGEMENT_AVAILABLE = True
 except ImportError:
@@ -44,6 +46,14 @@ except ImportError:
         def __init__(self, *args, **kwargs):
             pass
 
+    class QueueScalingController:
+        def __init__(self, *args, **kwargs):
+            pass
+
+    class ScalingDecision:
+        def __init__(self, *args, **kwargs):
+            pass
+
     class ResourceState:
         OPTIMAL = "optimal"
         HIGH = "high"
@@ -75,6 +85,7 @@ __all__ = [
     # Fallback Management
     'FallbackManager', 'FallbackConfig', 'FallbackStrategy',
     'ServiceLevel', 'FallbackExecution', 'ServiceHealth',
+    'ResultCache', 'fingerprint_params',
 
     # Stealth and Anti-Detection
     'StealthManager', 'StealthLevel', 'UserAgentPool', 'TimingProfile', 'BrowserProfile',
@@ -82,6 +93,7 @@ __all__ = [
     # Resource Management
     'ResourceMonitor', 'ResourceOptimizer', 'AdaptiveWorkerPool',
     'ConcurrencyThrottler', 'ResourceState', 'ScalingAction',
+    'QueueScalingController', 'ScalingDecision',
     
     # Error Handling
     'ErrorHandler', 'ErrorContext', 'EnhancedError',
@@ -34,6 +34,14 @@ class CircuitBreakerConfig:
     success_threshold: int = 2          # Successes before closing from half-open
     timeout: float = 30.0               # Request timeout in seconds
     reset_timeout: float = 300.0        # Reset failure count after this time
+    half_open_max_calls: int = 1        # Concurrent probe requests admitted while half-open
+
+    # Sliding window (count-based over the last N calls); 0 keeps consecutive-failure mode
+    window_size: int = 0
+    minimum_calls: int = 10             # Calls in the window before rates are evaluated
+    failure_rate_threshold: float = 50.0    # Percent of failed calls that opens the circuit
+    slow_call_duration: float = 0.0     # Calls slower than this (seconds) count as slow; 0 disables
+    slow_call_rate_threshold: float = 100.0  # Percent of slow calls that opens the circuit
 
 
 @dataclass
@@ -42,10 +50,11 @@ class CircuitMetrics:
     total_requests: int = 0
     total_successes: int = 0
     total_failures: int = 0
+    total_rejections: int = 0
     consecutive_failures: int = 0
     consecutive_successes: int = 0
-    last_failure_time: Optional[datetime] = None
-    last_success_time: Optional[datetime] = None
+    last_failure_time: Optional[float] = None   # wall-clock epoch seconds
+    last_success_time: Optional[float] = None   # wall-clock epoch seconds
     state_changes: List[Dict[str, Any]] = field(default_factory=list)
 
 
@@ -58,8 +67,55 @@ class CircuitBreakerError(Exception):
         self.state = state
 
 
+class SlidingWindow:
+    """Fixed-size ring of recent call outcomes with O(1) running failure/slow counts."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._failed = [False] * size
+        self._slow = [False] * size
+        self._next = 0
+        self.calls = 0
+        self.failures = 0
+        self.slow_calls = 0
+
+    def record(self, failed: bool, slow: bool) -> None:
+        i = self._next
+        if self.calls == self.size:
+            # Overwrite the oldest outcome
+            self.failures -= self._failed[i]
+            self.slow_calls -= self._slow[i]
+        else:
+            self.calls += 1
+        self._failed[i], self._slow[i] = failed, slow
+        self.failures += failed
+        self.slow_calls += slow
+        self._next = (i + 1) % self.size
+
+    def failure_rate(self) -> float:
+        return self.failures / self.calls * 100 if self.calls else 0.0
+
+    def slow_call_rate(self) -> float:
+        return self.slow_calls / self.calls * 100 if self.calls else 0.0
+
+    def clear(self) -> None:
+        self.__init__(self.size)
+
+
 class CircuitBreaker:
-    """Circuit breaker implementation for external service calls."""
+    """
+    Circuit breaker implementation for external service calls.
+
+    Admission and outcome recording never await, so on the event loop they run
+    atomically without a lock: the closed-state path is a single state check.
+    Transitions use the monotonic clock; wall-clock timestamps are only taken
+    for metrics. While half-open, at most ``half_open_max_calls`` probe
+    requests are in flight; everything else is rejected until they resolve.
+
+    With ``window_size`` set, a closed circuit opens on the failure rate or
+    slow-call rate over the last ``window_size`` calls (once ``minimum_calls``
+    have been seen) instead of on consecutive failures.
+    """
 
     def __init__(self,
                  name: str,
@@ -72,113 +128,154 @@ class CircuitBreaker:
         self.state = CircuitState.CLOSED
         self.metrics = CircuitMetrics()
         self.last_state_change = datetime.utcnow()
-        self._lock = asyncio.Lock()
+        self._state_changed_at = time.monotonic()
+        self._last_failure_at = 0.0
+        self._probes_in_flight = 0
+        # Bumped on every half-open transition so probes admitted in an
+        # earlier half-open period don't release slots of the current one
+        self._half_open_generation = 0
+        self.window = SlidingWindow(self.config.window_size) if self.config.window_size > 0 else None
 
     async def call(self, func: Callable, *args, **kwargs) -> Any:
         """Execute a function through the circuit breaker."""
-        async with self._lock:
-            # Check if we should allow the request
-            if not await self._should_allow_request():
-                self.metrics.total_requests += 1
-                raise CircuitBreakerError(
-                    f"Circuit breaker '{self.name}' is {self.state.value}",
-                    self.name,
-                    self.state
-                )
-
-        # Execute the request
         self.metrics.total_requests += 1
-        start_time = time.time()
+        is_probe = self._try_acquire()
+        if is_probe is None:
+            self.metrics.total_rejections += 1
+            raise CircuitBreakerError(
+                f"Circuit breaker '{self.name}' is {self.state.value}",
+                self.name,
+                self.state
+            )
+        generation = self._half_open_generation
 
+        start_time = time.monotonic()
         try:
             # Add timeout to the call
             result = await asyncio.wait_for(
                 func(*args, **kwargs),
                 timeout=self.config.timeout
             )
-
-            # Record success
-            execution_time = time.time() - start_time
-            await self._record_success(execution_time)
+            self._record_success(time.monotonic() - start_time)
             return result
 
         except asyncio.TimeoutError:
-            execution_time = time.time() - start_time
-            await self._record_failure("timeout", execution_time)
+            self._record_failure("timeout", time.monotonic() - start_time)
             raise
 
         except Exception as e:
-            execution_time = time.time() - start_time
-            await self._record_failure(str(type(e).__name__), execution_time)
+            self._record_failure(str(type(e).__name__), time.monotonic() - start_time)
             raise
 
-    async def _should_allow_request(self) -> bool:
-        """Determine if a request should be allowed based on circuit state."""
-        now = datetime.utcnow()
+        finally:
+            if is_probe and generation == self._half_open_generation:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
 
+    def _try_acquire(self) -> Optional[bool]:
+        """
+        Admit a request. Returns False for a normal admission, True for a
+        half-open probe (caller must release it) and None for a rejection.
+        """
         if self.state == CircuitState.CLOSED:
-            return True
-
-        elif self.state == CircuitState.OPEN:
-            # Check if we should transition to half-open
-            time_since_open = (now - self.last_state_change).total_seconds()
-            if time_since_open >= self.config.recovery_timeout:
-                await self._transition_to_half_open()
-                return True
             return False
 
-        elif self.state == CircuitState.HALF_OPEN:
-            # Allow limited requests to test service recovery
-            return True
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self._state_changed_at < self.config.recovery_timeout:
+                return None
+            self._transition_to_half_open()
 
-        return False
+        # Half-open: only a limited number of concurrent probes
+        if self._probes_in_flight >= self.config.half_open_max_calls:
+            return None
+        self._probes_in_flight += 1
+        return True
+
+    def is_call_permitted(self) -> bool:
+        """Non-consuming check whether a call would currently be admitted."""
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN:
+            return time.monotonic() - self._state_changed_at >= self.config.recovery_timeout
+        return self._probes_in_flight < self.config.half_open_max_calls
 
-    async def _record_success(self, execution_time: float) -> None:
+    def _record_success(self, execution_time: float) -> None:
         """Record a successful request."""
-        async with self._lock:
-            self.metrics.total_successes += 1
-            self.metrics.consecutive_successes += 1
-            self.metrics.consecutive_failures = 0
-            self.metrics.last_success_time = datetime.utcnow()
+        self.metrics.total_successes += 1
+        self.metrics.consecutive_successes += 1
+        self.metrics.consecutive_failures = 0
+        self.metrics.last_success_time = time.time()
 
-            # State transitions based on success
-            if self.state == CircuitState.HALF_OPEN:
-                if self.metrics.consecutive_successes >= self.config.success_threshold:
-                    await self._transition_to_closed()
+        # State transitions based on success
+        if self.state == CircuitState.HALF_OPEN:
+            if self.metrics.consecutive_successes >= self.config.success_threshold:
+                self._transition_to_closed()
+        elif self.state == CircuitState.CLOSED and self.window:
+            self.window.record(False, self._is_slow(execution_time))
+            self._check_window()
 
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
                 f"Circuit breaker '{self.name}' recorded success "
                 f"(execution_time: {execution_time:.3f}s, consecutive: {self.metrics.consecutive_successes})"
             )
 
-    async def _record_failure(self, error_type: str, execution_time: float) -> None:
+    def _record_failure(self, error_type: str, execution_time: float) -> None:
         """Record a failed request."""
-        async with self._lock:
-            self.metrics.total_failures += 1
-            self.metrics.consecutive_failures += 1
-            self.metrics.consecutive_successes = 0
-            self.metrics.last_failure_time = datetime.utcnow()
-
-            # State transitions based on failure
-            if self.state == CircuitState.CLOSED:
-                if self.metrics.consecutive_failures >= self.config.failure_threshold:
-                    await self._transition_to_open()
-
-            elif self.state == CircuitState.HALF_OPEN:
-                # Any failure in half-open state goes back to open
-                await self._transition_to_open()
-
-            self.logger.warning(
-                f"Circuit breaker '{self.name}' recorded failure "
-                f"(error: {error_type}, execution_time: {execution_time:.3f}s, "
-                f"consecutive: {self.metrics.consecutive_failures})"
-            )
+        now = time.monotonic()
+        # Isolated failures older than reset_timeout don't count towards opening
+        if self.config.reset_timeout and now - self._last_failure_at > self.config.reset_timeout:
+            self.metrics.consecutive_failures = 0
+        self._last_failure_at = now
 
-    async def _transition_to_open(self) -> None:
-        """Transition circuit breaker to open state."""
+        self.metrics.total_failures += 1
+        self.metrics.consecutive_failures += 1
+        self.metrics.consecutive_successes = 0
+        self.metrics.last_failure_time = time.time()
+
+        # State transitions based on failure
+        if self.state == CircuitState.CLOSED:
+            if self.window:
+                self.window.record(True, self._is_slow(execution_time))
+                self._check_window()
+            elif self.metrics.consecutive_failures >= self.config.failure_threshold:
+                self._transition_to_open()
+
+        elif self.state == CircuitState.HALF_OPEN:
+            # Any failure in half-open state goes back to open
+            self._transition_to_open()
+
+        self.logger.warning(
+            f"Circuit breaker '{self.name}' recorded failure "
+            f"(error: {error_type}, execution_time: {execution_time:.3f}s, "
+            f"consecutive: {self.metrics.consecutive_failures})"
+        )
+
+    def _is_slow(self, execution_time: float) -> bool:
+        return bool(self.config.slow_call_duration) and execution_time >= self.config.slow_call_duration
+
+    def _check_window(self) -> None:
+        """Open the circuit when the window's failure or slow-call rate crosses its threshold."""
+        if self.window.calls < self.config.minimum_calls:
+            return
+        failure_rate = self.window.failure_rate()
+        slow_rate = self.window.slow_call_rate()
+        if failure_rate >= self.config.failure_rate_threshold:
+            self.logger.error(f"Circuit breaker '{self.name}' failure rate {failure_rate:.0f}% over last {self.window.calls} calls")
+            self._transition_to_open()
+        elif self.config.slow_call_duration and slow_rate >= self.config.slow_call_rate_threshold:
+            self.logger.error(f"Circuit breaker '{self.name}' slow-call rate {slow_rate:.0f}% over last {self.window.calls} calls")
+            self._transition_to_open()
+
+    def _set_state(self, new_state: CircuitState) -> CircuitState:
         old_state = self.state
-        self.state = CircuitState.OPEN
+        self.state = new_state
+        self._state_changed_at = time.monotonic()
         self.last_state_change = datetime.utcnow()
+        return old_state
+
+    def _transition_to_open(self) -> None:
+        """Transition circuit breaker to open state."""
+        old_state = self._set_state(CircuitState.OPEN)
 
         self._record_state_change(old_state, CircuitState.OPEN)
         self.logger.error(
@@ -186,24 +283,24 @@ class CircuitBreaker:
             f"(consecutive failures: {self.metrics.consecutive_failures})"
         )
 
-    async def _transition_to_half_open(self) -> None:
+    def _transition_to_half_open(self) -> None:
         """Transition circuit breaker to half-open state."""
-        old_state = self.state
-        self.state = CircuitState.HALF_OPEN
-        self.last_state_change = datetime.utcnow()
+        old_state = self._set_state(CircuitState.HALF_OPEN)
         self.metrics.consecutive_successes = 0
+        self._probes_in_flight = 0
+        self._half_open_generation += 1
 
         self._record_state_change(old_state, CircuitState.HALF_OPEN)
         self.logger.info(
             f"Circuit breaker '{self.name}' half-opened (testing service recovery)"
         )
 
-    async def _transition_to_closed(self) -> None:
+    def _transition_to_closed(self) -> None:
         """Transition circuit breaker to closed state."""
-        old_state = self.state
-        self.state = CircuitState.CLOSED
-        self.last_state_change = datetime.utcnow()
+        old_state = self._set_state(CircuitState.CLOSED)
         self.metrics.consecutive_failures = 0
+        if self.window:
+            self.window.clear()
 
         self._record_state_change(old_state, CircuitState.CLOSED)
         self.logger.info(
@@ -224,13 +321,17 @@ class CircuitBreaker:
         if len(self.metrics.state_changes) > 50:
             self.metrics.state_changes.pop(0)
 
+    @staticmethod
+    def _iso(timestamp: Optional[float]) -> Optional[str]:
+        return datetime.utcfromtimestamp(timestamp).isoformat() if timestamp else None
+
     def get_metrics(self) -> Dict[str, Any]:
         """Get current circuit breaker metrics."""
         success_rate = 0.0
         if self.metrics.total_requests > 0:
             success_rate = self.metrics.total_successes / self.metrics.total_requests * 100
 
-        time_in_current_state = (datetime.utcnow() - self.last_state_change).total_seconds()
+        time_in_current_state = time.monotonic() - self._state_changed_at
 
         return {
             "name": self.name,
@@ -239,55 +340,101 @@ class CircuitBreaker:
             "total_requests": self.metrics.total_requests,
             "total_successes": self.metrics.total_successes,
             "total_failures": self.metrics.total_failures,
+            "total_rejections": self.metrics.total_rejections,
             "success_rate_percent": success_rate,
             "consecutive_failures": self.metrics.consecutive_failures,
             "consecutive_successes": self.metrics.consecutive_successes,
-            "last_failure": self.metrics.last_failure_time.isoformat() if self.metrics.last_failure_time else None,
-            "last_success": self.metrics.last_success_time.isoformat() if self.metrics.last_success_time else None,
+            "half_open_probes_in_flight": self._probes_in_flight,
+            "window": {
+                "calls": self.window.calls,
+                "failure_rate_percent": round(self.window.failure_rate(), 1),
+                "slow_call_rate_percent": round(self.window.slow_call_rate(), 1)
+            } if self.window else None,
+            "last_failure": self._iso(self.metrics.last_failure_time),
+            "last_success": self._iso(self.metrics.last_success_time),
             "config": {
                 "failure_threshold": self.config.failure_threshold,
                 "recovery_timeout": self.config.recovery_timeout,
                 "success_threshold": self.config.success_threshold,
-                "timeout": self.config.timeout
+                "timeout": self.config.timeout,
+                "half_open_max_calls": self.config.half_open_max_calls,
+                "window_size": self.config.window_size,
+                "minimum_calls": self.config.minimum_calls,
+                "failure_rate_threshold": self.config.failure_rate_threshold,
+                "slow_call_duration": self.config.slow_call_duration,
+                "slow_call_rate_threshold": self.config.slow_call_rate_threshold
             },
             "recent_state_changes": self.metrics.state_changes[-10:]  # Last 10 changes
         }
 
     async def reset(self) -> None:
         """Reset circuit breaker to closed state."""
-        async with self._lock:
-            old_state = self.state
-            self.state = CircuitState.CLOSED
-            self.last_state_change = datetime.utcnow()
-            self.metrics.consecutive_failures = 0
-            self.metrics.consecutive_successes = 0
+        old_state = self._set_state(CircuitState.CLOSED)
+        self.metrics.consecutive_failures = 0
+        self.metrics.consecutive_successes = 0
+        self._probes_in_flight = 0
+        self._half_open_generation += 1
+        if self.window:
+            self.window.clear()
 
-            self._record_state_change(old_state, CircuitState.CLOSED)
-            self.logger.info(f"Circuit breaker '{self.name}' manually reset")
+        self._record_state_change(old_state, CircuitState.CLOSED)
+        self.logger.info(f"Circuit breaker '{self.name}' manually reset")
 
 
 class CircuitBreakerManager:
-    """Manager for multiple circuit breakers."""
+    """
+    Manager for multiple circuit breakers.
+
+    Breakers may be scoped as ``<service>:<scope>`` (e.g. one per target
+    domain); scoped breakers are created on demand from the config registered
+    for ``<service>`` with ``register_template``. The number of scoped
+    breakers is bounded: the oldest idle closed ones are dropped first.
+    """
+
+    MAX_SCOPED_BREAKERS = 500
 
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
         self.breakers: Dict[str, CircuitBreaker] = {}
         self.default_config = CircuitBreakerConfig()
+        self.templates: Dict[str, CircuitBreakerConfig] = {}
+
+    def register_template(self, service: str, config: CircuitBreakerConfig) -> None:
+        """Config used for breakers named ``<service>:<scope>``."""
+        self.templates[service] = config
+
+    @staticmethod
+    def scoped_name(service: str, scope: Optional[str]) -> str:
+        return f"{service}:{scope}" if scope else service
 
     def get_or_create_breaker(self,
                              name: str,
                              config: Optional[CircuitBreakerConfig] = None) -> CircuitBreaker:
         """Get existing circuit breaker or create a new one."""
         if name not in self.breakers:
+            service = name.split(":", 1)[0]
+            if ":" in name:
+                self._evict_idle_scoped()
             self.breakers[name] = CircuitBreaker(
                 name=name,
-                config=config or self.default_config,
+                config=config or self.templates.get(service) or self.default_config,
                 logger=self.logger
             )
             self.logger.info(f"Created circuit breaker '{name}'")
 
         return self.breakers[name]
 
+    def _evict_idle_scoped(self) -> None:
+        scoped = [name for name in self.breakers if ":" in name]
+        if len(scoped) < self.MAX_SCOPED_BREAKERS:
+            return
+        # Insertion order approximates age; keep anything that is open, probing or failing
+        for name in scoped:
+            breaker = self.breakers[name]
+            if breaker.state == CircuitState.CLOSED and breaker.metrics.consecutive_failures == 0:
+                del self.breakers[name]
+                return
+
     async def call_with_breaker(self,
                                breaker_name: str,
                                func: Callable,
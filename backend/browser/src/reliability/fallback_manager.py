@@ -11,6 +11,7 @@ Phase 2.6 Implementation:
 from __future__ import annotations
 
 import asyncio
+import os
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -19,6 +20,12 @@ from enum import Enum
 import logging
 
 from .circuit_breaker import CircuitState, CircuitBreakerManager
+from .result_cache import ResultCache
+
+
+RESULT_CACHE_MAX_ENTRIES: int = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "500"))
+RESULT_CACHE_MAX_BYTES: int = int(os.getenv("RESULT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+RESULT_CACHE_REDIS_URL: str = os.getenv("RESULT_CACHE_REDIS_URL", "")
 
 
 class ServiceLevel(str, Enum):
@@ -45,6 +52,7 @@ class FallbackConfig:
     strategy: FallbackStrategy
     timeout_seconds: float = 10.0
     cache_ttl_seconds: float = 300.0  # 5 minutes
+    serve_cached_seconds: float = 0.0  # Serve identical jobs from cache before executing (0 = off)
     retry_delay_seconds: float = 5.0
     max_fallback_attempts: int = 3
     quality_reduction_factor: float = 0.5
@@ -90,7 +98,14 @@ class FallbackManager:
 
         # Fallback configurations
         self.fallback_configs: Dict[str, FallbackConfig] = {}
-        self.cache: Dict[str, Dict[str, Any]] = {}
+
+        # Results keyed by task name + normalised params
+        self.result_cache = ResultCache(
+            max_entries=RESULT_CACHE_MAX_ENTRIES,
+            max_bytes=RESULT_CACHE_MAX_BYTES,
+            redis_url=RESULT_CACHE_REDIS_URL or None,
+            logger=self.logger
+        )
 
         # Metrics
         self.fallback_metrics: Dict[str, List[FallbackExecution]] = {}
@@ -107,6 +122,7 @@ class FallbackManager:
             return
 
         self.monitoring_active = True
+        await self.result_cache.connect()
         self.health_check_task = asyncio.create_task(self._health_monitoring_loop())
         self.logger.info("Fallback manager health monitoring started")
 
@@ -119,6 +135,7 @@ class FallbackManager:
                 await self.health_check_task
             except asyncio.CancelledError:
                 pass
+        await self.result_cache.disconnect()
         self.logger.info("Fallback manager health monitoring stopped")
 
     def register_fallback(self, service_name: str, config: FallbackConfig) -> None:
@@ -126,6 +143,10 @@ class FallbackManager:
         self.fallback_configs[service_name] = config
         self.logger.info(f"Registered fallback strategy '{config.strategy}' for service '{service_name}'")
 
+    def _config_for(self, service_name: str) -> Optional[FallbackConfig]:
+        """Fallback config for a service; scoped names ("<service>:<scope>") use the service's."""
+        return self.fallback_configs.get(service_name) or self.fallback_configs.get(service_name.split(":", 1)[0])
+
     async def execute_with_fallback(self,
                                   service_name: str,
                                   primary_func: Callable,
@@ -222,7 +243,7 @@ class FallbackManager:
                               start_time: float,
                               primary_error: Optional[str] = None) -> FallbackExecution:
         """Execute the appropriate fallback strategy."""
-        config = self.fallback_configs.get(service_name)
+        config = self._config_for(service_name)
         if not config:
             # Default fallback - fail fast
             return FallbackExecution(
@@ -237,7 +258,7 @@ class FallbackManager:
 
         try:
             if config.strategy == FallbackStrategy.CACHED_RESPONSE:
-                return await self._fallback_cached_response(service_name, config, start_time, primary_error)
+                return await self._fallback_cached_response(service_name, config, fallback_data, start_time, primary_error)
 
             elif config.strategy == FallbackStrategy.REDUCED_QUALITY:
                 return await self._fallback_reduced_quality(service_name, config, fallback_data, start_time, primary_error)
@@ -277,28 +298,32 @@ class FallbackManager:
     async def _fallback_cached_response(self,
                                       service_name: str,
                                       config: FallbackConfig,
+                                      fallback_data: Optional[Dict[str, Any]],
                                       start_time: float,
                                       primary_error: Optional[str]) -> FallbackExecution:
-        """Return cached response if available."""
-        cached_data = self.cache.get(service_name)
+        """Return the cached result of an identical job (same task and params) if available."""
+        cached = None
+        if fallback_data and fallback_data.get("task_name"):
+            cached = await self.result_cache.get(
+                fallback_data["task_name"], fallback_data.get("params") or {},
+                max_age=config.cache_ttl_seconds
+            )
         response_time = (time.time() - start_time) * 1000
 
-        if cached_data:
-            # Check cache age
-            cache_age = time.time() - cached_data.get('timestamp', 0)
-            if cache_age <= config.cache_ttl_seconds:
-                return FallbackExecution(
-                    strategy_used=FallbackStrategy.CACHED_RESPONSE,
-                    success=True,
-                    response_time_ms=response_time,
-                    data=cached_data.get('data'),
-                    error=None,
-                    is_degraded=True,
-                    metadata={
-                        "cache_age_seconds": cache_age,
-                        "primary_error": primary_error
-                    }
-                )
+        if cached:
+            data, cache_age = cached
+            return FallbackExecution(
+                strategy_used=FallbackStrategy.CACHED_RESPONSE,
+                success=True,
+                response_time_ms=response_time,
+                data=data,
+                error=None,
+                is_degraded=True,
+                metadata={
+                    "cache_age_seconds": cache_age,
+                    "primary_error": primary_error
+                }
+            )
 
         # No valid cache available
         return FallbackExecution(
@@ -586,12 +611,29 @@ class FallbackManager:
             else:
                 self.logger.info(f"Service level changed: {old_level.value} -> {new_level.value} (availability: {availability:.1f}%)")
 
-    def update_cache(self, service_name: str, data: Dict[str, Any]) -> None:
-        """Update cache for a service."""
-        self.cache[service_name] = {
-            'data': data,
-            'timestamp': time.time()
-        }
+    async def store_result(self,
+                           service_name: str,
+                           task_name: str,
+                           params: Dict[str, Any],
+                           data: Dict[str, Any]) -> bool:
+        """Cache a successful (non-degraded) result under its task + params key."""
+        config = self._config_for(service_name)
+        if not config or not isinstance(data, dict) or data.get("_degraded"):
+            return False
+        return await self.result_cache.set(task_name, params, data, config.cache_ttl_seconds)
+
+    async def get_fresh_result(self,
+                               service_name: str,
+                               task_name: str,
+                               params: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Return ``(data, age_seconds)`` for an identical job cached within the
+        service's ``serve_cached_seconds`` window, letting callers skip execution.
+        """
+        config = self._config_for(service_name)
+        if not config or config.serve_cached_seconds <= 0 or (params or {}).get("no_cache"):
+            return None
+        return await self.result_cache.get(task_name, params, max_age=config.serve_cached_seconds)
 
     def get_health_summary(self) -> Dict[str, Any]:
         """Get overall health summary."""
@@ -642,6 +684,7 @@ class FallbackManager:
                 "total_fallback_executions": 0,
                 "success_rate": 0.0,
                 "strategies_used": {},
+                "result_cache": self.result_cache.get_stats(),
                 "services": {}
             }
 
@@ -660,6 +703,7 @@ class FallbackManager:
             "total_fallback_executions": total_fallbacks,
             "success_rate": (successful_fallbacks / total_fallbacks) * 100,
             "strategies_used": strategy_counts,
+            "result_cache": self.result_cache.get_stats(),
             "services": {
                 service: {
                     "total_fallbacks": len(executions),
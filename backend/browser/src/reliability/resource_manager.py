@@ -12,7 +12,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
+import random
 import time
+from collections import deque
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Callable
@@ -20,14 +24,9 @@ from enum import Enum
 import weakref
 
 from playwright.async_api import Browser, BrowserContext
+from prometheus_client import Counter, Gauge
 
-# Make psutil import optional for testing
-try:
-    import psutil
-    PSUTIL_AVAILABLE = True
-except ImportError:
-    psutil = None
-    PSUTIL_AVAILABLE = False
+from ..resource_sampler import get_resource_sampler
 
 
 class ResourceState(str, Enum):
@@ -54,10 +53,12 @@ class ResourceMetrics:
     memory_percent: float = 0.0
     memory_available_mb: float = 0.0
     disk_usage_percent: float = 0.0
+    browser_memory_mb: float = 0.0  # RSS of the browser processes we spawned
     active_workers: int = 0
     active_contexts: int = 0
     jobs_per_minute: float = 0.0
     queue_size: int = 0
+    sampled: bool = True  # False when the resource values are estimates (no sampler data)
 
 
 @dataclass
@@ -99,24 +100,21 @@ class ResourceMonitor:
                           queue_size: int = 0) -> ResourceMetrics:
         """Get current system resource metrics."""
 
-        if PSUTIL_AVAILABLE:
-            # CPU metrics
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-
-            # Memory metrics
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
-            memory_available_mb = memory.available / (1024 * 1024)
-
-            # Disk metrics
-            disk = psutil.disk_usage('/')
-            disk_usage_percent = disk.percent
+        # Read the background sampler's latest snapshot - never blocks the event loop
+        snapshot = get_resource_sampler().snapshot()
+        if snapshot.available:
+            cpu_percent = snapshot.cpu_percent
+            memory_percent = snapshot.memory_percent
+            memory_available_mb = snapshot.memory_available_bytes / (1024 * 1024)
+            disk_usage_percent = snapshot.disk_percent
+            browser_memory_mb = snapshot.browser_rss_bytes / (1024 * 1024)
         else:
             # Fallback values when psutil is not available
             cpu_percent = 25.0  # Conservative estimate
             memory_percent = 30.0  # Conservative estimate
             memory_available_mb = 1024.0  # 1GB estimate
             disk_usage_percent = 50.0  # Conservative estimate
+            browser_memory_mb = 0.0
 
         # Calculate jobs per minute from recent history
         jobs_per_minute = self._calculate_throughput()
@@ -126,10 +124,12 @@ class ResourceMonitor:
             memory_percent=memory_percent,
             memory_available_mb=memory_available_mb,
             disk_usage_percent=disk_usage_percent,
+            browser_memory_mb=browser_memory_mb,
             active_workers=active_workers,
             active_contexts=active_contexts,
             jobs_per_minute=jobs_per_minute,
-            queue_size=queue_size
+            queue_size=queue_size,
+            sampled=snapshot.available
         )
 
         # Store in history
@@ -322,14 +322,315 @@ class AdaptiveWorkerPool:
         return best_worker.worker_id
 
 
+AUTOSCALER_WORKERS = Gauge(
+    "browser_autoscaler_workers",
+    "Worker counts seen and chosen by the queue-driven autoscaler",
+    labelnames=["kind"],  # current, busy, desired, target, memory_limit
+)
+AUTOSCALER_QUEUE_DEPTH = Gauge("browser_autoscaler_queue_depth", "Queued jobs at the last scaling decision")
+AUTOSCALER_QUEUE_WAIT = Gauge(
+    "browser_autoscaler_queue_wait_seconds",
+    "Queue wait of recently started jobs",
+    labelnames=["quantile"],
+)
+AUTOSCALER_ARRIVAL_RATE = Gauge("browser_autoscaler_arrival_rate_per_minute", "Estimated job arrival rate")
+AUTOSCALER_JOB_DURATION = Gauge("browser_autoscaler_avg_job_duration_seconds", "Mix-weighted average job duration")
+AUTOSCALER_DECISIONS = Counter(
+    "browser_autoscaler_decisions_total",
+    "Scaling decisions taken by the autoscaler",
+    labelnames=["action"],
+)
+
+
+@dataclass
+class ScalingDecision:
+    """One autoscaler decision with the inputs that produced it."""
+    action: ScalingAction
+    current_workers: int
+    target_workers: int
+    new_workers: int
+    reason: str
+    inputs: Dict[str, Any]
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "action": self.action.value,
+            "current_workers": self.current_workers,
+            "target_workers": self.target_workers,
+            "new_workers": self.new_workers,
+            "reason": self.reason,
+            "inputs": self.inputs,
+        }
+
+
+class QueueScalingController:
+    """Latency-driven worker scaling.
+
+    The target worker count is the number of jobs expected in service by
+    Little's law (arrival rate x average duration of the current task mix)
+    plus the workers needed to drain the backlog within ``target_wait_seconds``.
+    It is capped by how many more browsers fit in the free memory, and the
+    pool moves towards it in bounded steps with separate up/down cooldowns.
+    """
+
+    DEFAULT_JOB_SECONDS = 60.0
+    DURATION_SMOOTHING = 0.2
+
+    def __init__(self,
+                 logger: logging.Logger,
+                 min_workers: int = 1,
+                 max_workers: int = 4,
+                 target_wait_seconds: float = 60.0,
+                 scale_up_step: int = 2,
+                 scale_down_step: int = 1,
+                 scale_up_cooldown_seconds: float = 20.0,
+                 scale_down_cooldown_seconds: float = 120.0,
+                 worker_memory_mb: float = 400.0,
+                 memory_reserve_mb: float = 1024.0,
+                 window_seconds: float = 300.0):
+        self.logger = logger
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.target_wait_seconds = target_wait_seconds
+        self.scale_up_step = scale_up_step
+        self.scale_down_step = scale_down_step
+        self.scale_up_cooldown_seconds = scale_up_cooldown_seconds
+        self.scale_down_cooldown_seconds = scale_down_cooldown_seconds
+        self.worker_memory_mb = worker_memory_mb
+        self.memory_reserve_mb = memory_reserve_mb
+        self.window_seconds = window_seconds
+
+        self._waits: deque = deque(maxlen=500)      # (monotonic ts, wait seconds)
+        self._starts: deque = deque(maxlen=5000)    # (monotonic ts, task name)
+        self._durations: Dict[str, float] = {}      # task -> smoothed duration
+        self._previous_queue: Optional[tuple] = None
+        self._last_scale_up = 0.0
+        self._last_scale_down = 0.0
+        self._created = time.monotonic()
+        self.decisions: deque = deque(maxlen=50)
+
+    # ───── observations (called by workers) ─────
+
+    def record_start(self, task_name: str, wait_seconds: Optional[float]) -> None:
+        now = time.monotonic()
+        self._starts.append((now, task_name))
+        if wait_seconds is not None:
+            self._waits.append((now, max(0.0, wait_seconds)))
+
+    def record_finish(self, task_name: str, duration_seconds: float) -> None:
+        previous = self._durations.get(task_name)
+        self._durations[task_name] = duration_seconds if previous is None else (
+            previous * (1 - self.DURATION_SMOOTHING) + duration_seconds * self.DURATION_SMOOTHING
+        )
+
+    # ───── derived inputs ─────
+
+    @staticmethod
+    def _percentile(values: List[float], q: float) -> float:
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def _recent(self, samples: deque, now: float) -> list:
+        cutoff = now - self.window_seconds
+        return [s for s in samples if s[0] >= cutoff]
+
+    def _average_duration(self, recent_starts: list) -> float:
+        """Average duration weighted by the task mix of recently started jobs."""
+        fallback = (sum(self._durations.values()) / len(self._durations)) if self._durations else self.DEFAULT_JOB_SECONDS
+        if not recent_starts:
+            return fallback
+        return sum(self._durations.get(task, fallback) for _, task in recent_starts) / len(recent_starts)
+
+    def _memory_limit(self, current_workers: int, busy_workers: int, metrics: ResourceMetrics) -> int:
+        """Most workers the free memory allows (each worker may hold a browser context)."""
+        if not metrics.sampled or not metrics.memory_available_mb:
+            # No real reading (e.g. psutil missing) - don't let an estimate cap the pool
+            return self.max_workers
+        per_worker_mb = self.worker_memory_mb
+        if metrics.browser_memory_mb and busy_workers:
+            per_worker_mb = max(per_worker_mb, metrics.browser_memory_mb / busy_workers)
+        spare = metrics.memory_available_mb - self.memory_reserve_mb
+        return max(self.min_workers, current_workers + math.floor(spare / per_worker_mb))
+
+    # ───── decision ─────
+
+    def decide(self,
+               current_workers: int,
+               busy_workers: int,
+               queue_depth: int,
+               metrics: ResourceMetrics) -> ScalingDecision:
+        now = time.monotonic()
+        recent_starts = self._recent(self._starts, now)
+        waits = [w for _, w in self._recent(self._waits, now)]
+        observed = min(self.window_seconds, max(1.0, now - self._created))
+
+        # Arrivals = jobs started + growth of the queue since the last decision
+        throughput = len(recent_starts) / observed
+        queue_growth = 0.0
+        if self._previous_queue:
+            prev_ts, prev_depth = self._previous_queue
+            queue_growth = (queue_depth - prev_depth) / max(1.0, now - prev_ts)
+        self._previous_queue = (now, queue_depth)
+        arrival_rate = max(0.0, throughput + queue_growth)
+
+        avg_duration = self._average_duration(recent_starts)
+        in_service = arrival_rate * avg_duration                      # Little's law: L = λW
+        backlog = queue_depth * avg_duration / self.target_wait_seconds
+        desired = math.ceil(in_service + backlog)
+        p50, p95 = self._percentile(waits, 0.5), self._percentile(waits, 0.95)
+
+        reason = f"λ={arrival_rate * 60:.1f}/min x {avg_duration:.0f}s + backlog {queue_depth}"
+        if queue_depth and p95 > self.target_wait_seconds and desired <= current_workers:
+            desired = current_workers + 1
+            reason = f"p95 wait {p95:.0f}s over {self.target_wait_seconds:.0f}s target"
+        # Never plan below the workers that are busy right now
+        desired = max(desired, busy_workers)
+
+        memory_limit = self._memory_limit(current_workers, busy_workers, metrics)
+        target = max(self.min_workers, min(desired, self.max_workers, memory_limit))
+        if target < desired and memory_limit < self.max_workers:
+            reason += f"; capped by memory headroom at {memory_limit}"
+
+        action, new_workers = ScalingAction.MAINTAIN, current_workers
+        if target > current_workers and now - self._last_scale_up >= self.scale_up_cooldown_seconds:
+            action, new_workers = ScalingAction.SCALE_UP, min(target, current_workers + self.scale_up_step)
+            self._last_scale_up = now
+        elif target < current_workers and now - self._last_scale_down >= self.scale_down_cooldown_seconds \
+                and now - self._last_scale_up >= self.scale_down_cooldown_seconds:
+            action, new_workers = ScalingAction.SCALE_DOWN, max(target, current_workers - self.scale_down_step)
+            self._last_scale_down = now
+
+        inputs = {
+            "queue_depth": queue_depth,
+            "busy_workers": busy_workers,
+            "queue_wait_p50_seconds": round(p50, 1),
+            "queue_wait_p95_seconds": round(p95, 1),
+            "arrival_rate_per_minute": round(arrival_rate * 60, 2),
+            "avg_job_duration_seconds": round(avg_duration, 1),
+            "desired_workers": desired,
+            "memory_limit_workers": memory_limit,
+            "memory_available_mb": round(metrics.memory_available_mb, 1),
+            "browser_memory_mb": round(metrics.browser_memory_mb, 1),
+        }
+        decision = ScalingDecision(action, current_workers, target, new_workers, reason, inputs)
+        if action != ScalingAction.MAINTAIN:
+            self.decisions.append(decision)
+        self._export(decision)
+        return decision
+
+    def _export(self, decision: ScalingDecision) -> None:
+        inputs = decision.inputs
+        AUTOSCALER_WORKERS.labels("current").set(decision.current_workers)
+        AUTOSCALER_WORKERS.labels("busy").set(inputs["busy_workers"])
+        AUTOSCALER_WORKERS.labels("desired").set(inputs["desired_workers"])
+        AUTOSCALER_WORKERS.labels("target").set(decision.target_workers)
+        AUTOSCALER_WORKERS.labels("memory_limit").set(inputs["memory_limit_workers"])
+        AUTOSCALER_QUEUE_DEPTH.set(inputs["queue_depth"])
+        AUTOSCALER_QUEUE_WAIT.labels("0.5").set(inputs["queue_wait_p50_seconds"])
+        AUTOSCALER_QUEUE_WAIT.labels("0.95").set(inputs["queue_wait_p95_seconds"])
+        AUTOSCALER_ARRIVAL_RATE.set(inputs["arrival_rate_per_minute"])
+        AUTOSCALER_JOB_DURATION.set(inputs["avg_job_duration_seconds"])
+        AUTOSCALER_DECISIONS.labels(decision.action.value).inc()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "min_workers": self.min_workers,
+            "max_workers": self.max_workers,
+            "target_wait_seconds": self.target_wait_seconds,
+            "task_durations_seconds": {task: round(d, 1) for task, d in self._durations.items()},
+            "recent_decisions": [d.to_dict() for d in list(self.decisions)[-10:]],
+        }
+
+
+class TokenBucket:
+    """Token bucket with O(1) lazy refill. Tokens can be reserved ahead of time
+    (the balance goes negative) so each caller learns exactly how long to wait."""
+
+    def __init__(self, rate_per_second: float, capacity: float):
+        self.rate = rate_per_second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self) -> float:
+        """Take one token and return the seconds until it is actually available."""
+        self._refill()
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def available(self) -> float:
+        self._refill()
+        return self.tokens
+
+
+class _ServiceLimiter:
+    """Concurrency cap + token bucket for one service (or one service scope)."""
+
+    def __init__(self, limits: Dict[str, Any]):
+        self.limits = limits
+        self.semaphore = asyncio.Semaphore(limits["max_concurrent"])
+        # asyncio.Lock wakes waiters in FIFO order; only its holder waits on the
+        # semaphore and bucket, so callers are admitted strictly first come, first served
+        self.admission = asyncio.Lock()
+        self.bucket = TokenBucket(limits["rate_limit_per_minute"] / 60.0, limits["burst_allowance"])
+
+        self.active = 0
+        self.waiting = 0
+        self.total_acquired = 0
+        self.total_wait_seconds = 0.0
+        self.last_used = time.monotonic()
+        # Fixed one-minute windows; the previous window is weighted in for a sliding estimate
+        self._window = 0
+        self._window_count = 0
+        self._previous_window_count = 0
+
+    def _count_request(self) -> None:
+        window = int(time.time() // 60)
+        if window != self._window:
+            self._previous_window_count = self._window_count if window == self._window + 1 else 0
+            self._window = window
+            self._window_count = 0
+        self._window_count += 1
+
+    def requests_last_minute(self) -> int:
+        now = time.time()
+        window = int(now // 60)
+        if window == self._window:
+            weight = 1 - (now % 60) / 60
+            return int(self._window_count + self._previous_window_count * weight)
+        if window == self._window + 1:
+            return int(self._window_count * (1 - (now % 60) / 60))
+        return 0
+
+
 class ConcurrencyThrottler:
-    """Intelligent concurrency throttling for external services."""
+    """Intelligent concurrency throttling for external services.
 
-    def __init__(self, logger: logging.Logger):
+    Each service gets a concurrency cap and a token bucket (``rate_limit_per_minute``
+    with ``burst_allowance`` tokens of burst). Callers wait for a slot with
+    ``async with throttler.slot(name)`` and are admitted in FIFO order. Scoped
+    names (``"<service>:<scope>"``, e.g. one per target domain) get their own
+    limiter built from the service's limits. With a Redis URL, per-minute rates
+    are additionally enforced across all pods.
+    """
+
+    MAX_SCOPED_LIMITERS = 500
+
+    def __init__(self, logger: logging.Logger, redis_url: Optional[str] = None):
         self.logger = logger
+        self.redis_url = redis_url
+        self.redis_client = None
         self.service_limits: Dict[str, Dict[str, Any]] = {}
-        self.active_requests: Dict[str, int] = {}
-        self.request_times: Dict[str, List[float]] = {}
+        self._limiters: Dict[str, _ServiceLimiter] = {}
 
     def add_service_limit(self,
                          service_name: str,
@@ -344,69 +645,149 @@ class ConcurrencyThrottler:
             "burst_allowance": burst_allowance,
             "last_reset": time.time()
         }
-        self.active_requests[service_name] = 0
-        self.request_times[service_name] = []
-
-    async def acquire_slot(self, service_name: str) -> bool:
-        """Acquire a concurrency slot for a service."""
-
-        if service_name not in self.service_limits:
+        self._limiters[service_name] = _ServiceLimiter(self.service_limits[service_name])
+
+    async def connect(self) -> None:
+        """Enable cluster-wide rate limits if a Redis URL is configured."""
+        if not self.redis_url:
+            return
+        try:
+            import redis.asyncio as redis
+            self.redis_client = redis.from_url(self.redis_url, decode_responses=True)
+            await self.redis_client.ping()
+            self.logger.info("Throttling rate limits shared through Redis")
+        except Exception as e:
+            self.logger.warning(f"Throttler Redis unavailable ({e}) - limits are per process")
+            self.redis_client = None
+
+    async def disconnect(self) -> None:
+        if self.redis_client:
+            await self.redis_client.close()
+            self.redis_client = None
+
+    def _limiter_for(self, service_name: str) -> Optional[_ServiceLimiter]:
+        limiter = self._limiters.get(service_name)
+        if limiter:
+            return limiter
+        base = service_name.split(":", 1)[0]
+        if base == service_name or base not in self.service_limits:
+            return None
+        if len(self._limiters) >= len(self.service_limits) + self.MAX_SCOPED_LIMITERS:
+            self._evict_idle_scoped()
+        limiter = self._limiters[service_name] = _ServiceLimiter(self.service_limits[base])
+        return limiter
+
+    def _evict_idle_scoped(self) -> None:
+        idle = sorted(
+            (l.last_used, name) for name, l in self._limiters.items()
+            if ":" in name and l.active == 0 and l.waiting == 0
+        )
+        for _, name in idle[:max(1, len(idle) // 4)]:
+            del self._limiters[name]
+
+    async def _admit_globally(self, service_name: str, limit: int) -> None:
+        """Fixed-window per-minute counter in Redis; waits for the next window when full."""
+        while True:
+            now = time.time()
+            key = f"throttle:{service_name}:{int(now // 60)}"
+            try:
+                count = await self.redis_client.incr(key)
+                if count == 1:
+                    await self.redis_client.expire(key, 120)
+            except Exception as e:
+                # Fail open: a Redis outage must not stall every job
+                self.logger.debug(f"Global throttle check failed for {service_name}: {e}")
+                return
+            if count <= limit:
+                return
+            await asyncio.sleep(60 - now % 60 + random.uniform(0, 1))
+
+    async def _acquire(self, service_name: str, limiter: _ServiceLimiter) -> None:
+        started = time.monotonic()
+        limiter.waiting += 1
+        try:
+            async with limiter.admission:
+                await limiter.semaphore.acquire()
+                delay = limiter.bucket.reserve()
+        finally:
+            limiter.waiting -= 1
+
+        try:
+            if delay:
+                await asyncio.sleep(delay)
+            if self.redis_client:
+                await self._admit_globally(service_name, limiter.limits["rate_limit_per_minute"])
+        except BaseException:
+            limiter.semaphore.release()
+            raise
+
+        limiter.active += 1
+        limiter.total_acquired += 1
+        limiter.total_wait_seconds += time.monotonic() - started
+        limiter.last_used = time.monotonic()
+        limiter._count_request()
+
+    async def acquire_slot(self, service_name: str, timeout: Optional[float] = None) -> bool:
+        """Wait (up to ``timeout`` seconds) for a slot; False if none became free in time."""
+        limiter = self._limiter_for(service_name)
+        if not limiter:
             # No limits configured, allow
             return True
-
-        limits = self.service_limits[service_name]
-
-        # Check concurrent limit
-        if self.active_requests[service_name] >= limits["max_concurrent"]:
-            return False
-
-        # Check rate limit
-        current_time = time.time()
-        request_times = self.request_times[service_name]
-
-        # Clean old requests (older than 1 minute)
-        request_times[:] = [t for t in request_times if current_time - t < 60]
-
-        if len(request_times) >= limits["rate_limit_per_minute"]:
+        try:
+            await asyncio.wait_for(self._acquire(service_name, limiter), timeout)
+            return True
+        except asyncio.TimeoutError:
             return False
 
-        # Acquire slot
-        self.active_requests[service_name] += 1
-        request_times.append(current_time)
-
-        return True
-
     def release_slot(self, service_name: str):
         """Release a concurrency slot for a service."""
-
-        if service_name in self.active_requests:
-            self.active_requests[service_name] = max(
-                0,
-                self.active_requests[service_name] - 1
-            )
+        limiter = self._limiters.get(service_name)
+        if limiter and limiter.active > 0:
+            limiter.active -= 1
+            limiter.last_used = time.monotonic()
+            limiter.semaphore.release()
+
+    @asynccontextmanager
+    async def slot(self, service_name: str, timeout: Optional[float] = None):
+        """Hold a slot for the duration of the block; raises asyncio.TimeoutError on timeout."""
+        if not await self.acquire_slot(service_name, timeout):
+            raise asyncio.TimeoutError(f"No throttling slot for '{service_name}' within {timeout}s")
+        try:
+            yield
+        finally:
+            self.release_slot(service_name)
+
+    def _limiter_status(self, limiter: _ServiceLimiter) -> Dict[str, Any]:
+        limits = limiter.limits
+        return {
+            "active_requests": limiter.active,
+            "waiting_requests": limiter.waiting,
+            "max_concurrent": limits["max_concurrent"],
+            "requests_last_minute": limiter.requests_last_minute(),
+            "rate_limit": limits["rate_limit_per_minute"],
+            "tokens_available": round(max(0.0, limiter.bucket.available()), 2),
+            "avg_wait_ms": round(limiter.total_wait_seconds / limiter.total_acquired * 1000, 1)
+            if limiter.total_acquired else 0.0,
+            "utilization_percent": limiter.active / limits["max_concurrent"] * 100
+        }
 
     def get_service_status(self, service_name: str) -> Dict[str, Any]:
-        """Get current status for a service."""
+        """Get current status for a service (including its scoped limiters)."""
 
         if service_name not in self.service_limits:
             return {"error": "Service not configured"}
 
-        limits = self.service_limits[service_name]
-        current_time = time.time()
-
-        # Clean old request times
-        request_times = self.request_times[service_name]
-        recent_requests = [t for t in request_times if current_time - t < 60]
-
-        return {
-            "active_requests": self.active_requests[service_name],
-            "max_concurrent": limits["max_concurrent"],
-            "requests_last_minute": len(recent_requests),
-            "rate_limit": limits["rate_limit_per_minute"],
-            "utilization_percent": (
-                self.active_requests[service_name] / limits["max_concurrent"] * 100
-            )
+        status = self._limiter_status(self._limiters[service_name])
+        prefix = f"{service_name}:"
+        scopes = {
+            name[len(prefix):]: self._limiter_status(limiter)
+            for name, limiter in self._limiters.items()
+            if name.startswith(prefix)
         }
+        if scopes:
+            status["scopes"] = scopes
+        status["shared_across_pods"] = self.redis_client is not None
+        return status
 
 
 class ResourceOptimizer:
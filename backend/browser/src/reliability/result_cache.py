@@ -0,0 +1,189 @@
+"""Keyed task result cache for fallback and deduplication.
+
+Results are keyed by task name plus a hash of the normalised job params, so
+two identical searches share an entry and different ones never collide. The
+local tier is an LRU bounded by entry count and serialised size with a TTL per
+entry; an optional Redis tier shares results across pods.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# Optional Redis dependency with graceful fallback
+try:
+    import redis.asyncio as redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+
+# Params that change how a job runs but not what it returns
+TRANSPORT_PARAMS = {"proxy", "user_agent", "no_cache"}
+
+
+def _normalise(key: str, value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _normalise(k, v) for k, v in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        return [_normalise(key, v) for v in value]
+    if isinstance(value, str):
+        value = value.strip()
+        lowered = key.lower()
+        if "token" in lowered or "secret" in lowered or "password" in lowered:
+            # Keep secrets out of keys while still separating results per credential
+            return "sha256:" + hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
+        if "url" in lowered:
+            return value
+        if value.lstrip("-").isdigit():
+            return int(value)
+        return value.casefold()
+    return value
+
+
+def fingerprint_params(task_name: str, params: Dict[str, Any]) -> str:
+    """
+    Canonical fingerprint of a job: task name + sorted params with whitespace,
+    case and numeric strings normalised; transport-only and private (``_``)
+    params are ignored.
+    """
+    relevant = {
+        k: _normalise(k, v)
+        for k, v in sorted((params or {}).items())
+        if k not in TRANSPORT_PARAMS and not k.startswith("_")
+    }
+    canonical = json.dumps([task_name, relevant], sort_keys=True, default=str, separators=(",", ":"))
+    return f"{task_name}:{hashlib.sha256(canonical.encode('utf-8')).hexdigest()}"
+
+
+class ResultCache:
+    """LRU + TTL result cache with an optional shared Redis tier."""
+
+    def __init__(self,
+                 max_entries: int = 500,
+                 max_bytes: int = 64 * 1024 * 1024,
+                 redis_url: Optional[str] = None,
+                 key_prefix: str = "result_cache:",
+                 logger: Optional[logging.Logger] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.redis_url = redis_url
+        self.key_prefix = key_prefix
+        self.logger = logger or logging.getLogger(__name__)
+        self.redis_client = None
+
+        # key -> (stored_at, expires_at, size, data)
+        self._entries: "OrderedDict[str, Tuple[float, float, int, Any]]" = OrderedDict()
+        self._bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "redis_hits": 0, "stores": 0, "evictions": 0, "expired": 0}
+
+    async def connect(self) -> None:
+        """Connect the shared Redis tier if configured; local-only otherwise."""
+        if not self.redis_url:
+            return
+        if not REDIS_AVAILABLE:
+            self.logger.warning("Redis not available - result cache is local only")
+            return
+        try:
+            self.redis_client = redis.from_url(self.redis_url, decode_responses=True)
+            await self.redis_client.ping()
+            self.logger.info("Result cache shared through Redis")
+        except Exception as e:
+            self.logger.warning(f"Result cache Redis connection failed ({e}) - local only")
+            self.redis_client = None
+
+    async def disconnect(self) -> None:
+        if self.redis_client:
+            await self.redis_client.close()
+            self.redis_client = None
+
+    # ───── local tier ─────
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry:
+            self._bytes -= entry[2]
+
+    def _put_local(self, key: str, stored_at: float, expires_at: float, size: int, data: Any) -> None:
+        self._drop(key)
+        self._entries[key] = (stored_at, expires_at, size, data)
+        self._bytes += size
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.stats["evictions"] += 1
+
+    # ───── public API ─────
+
+    async def get(self, task_name: str, params: Dict[str, Any],
+                  max_age: Optional[float] = None) -> Optional[Tuple[Any, float]]:
+        """Return ``(data, age_seconds)`` for a live entry no older than ``max_age``."""
+        key = fingerprint_params(task_name, params)
+        now = time.time()
+
+        entry = self._entries.get(key)
+        if entry and entry[1] <= now:
+            self._drop(key)
+            self.stats["expired"] += 1
+            entry = None
+
+        if not entry and self.redis_client:
+            try:
+                raw = await self.redis_client.get(self.key_prefix + key)
+                if raw:
+                    payload = json.loads(raw)
+                    entry = (payload["stored_at"], payload["expires_at"], len(raw), payload["data"])
+                    self._put_local(key, *entry)
+                    self.stats["redis_hits"] += 1
+            except Exception as e:
+                self.logger.debug(f"Result cache Redis read failed: {e}")
+
+        if not entry:
+            self.stats["misses"] += 1
+            return None
+
+        age = now - entry[0]
+        if max_age is not None and age > max_age:
+            self.stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry[3], age
+
+    async def set(self, task_name: str, params: Dict[str, Any], data: Any, ttl_seconds: float) -> bool:
+        """Store a result for ``ttl_seconds``; results that can't be serialised are skipped."""
+        if ttl_seconds <= 0:
+            return False
+        key = fingerprint_params(task_name, params)
+        now = time.time()
+        try:
+            raw = json.dumps({"stored_at": now, "expires_at": now + ttl_seconds, "data": data}, default=str)
+        except (TypeError, ValueError):
+            return False
+
+        self._put_local(key, now, now + ttl_seconds, len(raw), data)
+        self.stats["stores"] += 1
+
+        if self.redis_client:
+            try:
+                await self.redis_client.set(self.key_prefix + key, raw, ex=int(ttl_seconds) or 1)
+            except Exception as e:
+                self.logger.debug(f"Result cache Redis write failed: {e}")
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hit_rate_percent": round(self.stats["hits"] / lookups * 100, 1) if lookups else 0.0,
+            "shared": self.redis_client is not None
+        }
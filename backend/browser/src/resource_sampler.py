@@ -0,0 +1,206 @@
+"""Background system resource sampling shared by monitors and probes.
+
+``psutil.cpu_percent(interval=...)`` sleeps for the interval, so calling it
+from a coroutine blocks the event loop (for a full second in the observability
+monitor). Instead one daemon thread samples CPU, memory, disk, open file
+descriptors and the RSS of the browser processes spawned by this service,
+and publishes an immutable ``ResourceSnapshot``. Readers just take the latest
+reference, with no locks and no waiting.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# Make psutil import optional for testing
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    psutil = None
+    PSUTIL_AVAILABLE = False
+
+
+RESOURCE_SAMPLE_INTERVAL: float = float(os.getenv("RESOURCE_SAMPLE_INTERVAL", "2"))
+RESOURCE_SAMPLE_HISTORY: int = int(os.getenv("RESOURCE_SAMPLE_HISTORY", "150"))
+
+# Child process names that belong to the browser (Playwright driver included)
+BROWSER_PROCESS_MARKERS = ("chrom", "headless_shell", "firefox", "webkit", "node")
+MAX_REPORTED_PROCESSES = 20
+
+
+@dataclass(frozen=True)
+class ResourceSnapshot:
+    """One resource sample; never mutated after publication."""
+    timestamp: float
+    available: bool = False  # False when psutil is missing or sampling failed
+    cpu_percent: float = 0.0
+    memory_percent: float = 0.0
+    memory_used_bytes: int = 0
+    memory_available_bytes: int = 0
+    disk_percent: float = 0.0
+    disk_free_bytes: int = 0
+    process_rss_bytes: int = 0
+    browser_rss_bytes: int = 0
+    browser_process_count: int = 0
+    open_fds: int = 0
+    browser_processes: Tuple[Dict[str, Any], ...] = field(default_factory=tuple)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": self.timestamp,
+            "available": self.available,
+            "cpu_percent": self.cpu_percent,
+            "memory_percent": self.memory_percent,
+            "memory_used_mb": round(self.memory_used_bytes / (1024 * 1024), 1),
+            "memory_available_mb": round(self.memory_available_bytes / (1024 * 1024), 1),
+            "disk_percent": self.disk_percent,
+            "disk_free_gb": round(self.disk_free_bytes / (1024 ** 3), 2),
+            "process_rss_mb": round(self.process_rss_bytes / (1024 * 1024), 1),
+            "browser_rss_mb": round(self.browser_rss_bytes / (1024 * 1024), 1),
+            "browser_process_count": self.browser_process_count,
+            "open_fds": self.open_fds,
+            "browser_processes": list(self.browser_processes),
+        }
+
+
+class ResourceSampler:
+    """Daemon thread publishing a rolling window of ``ResourceSnapshot``s."""
+
+    def __init__(self,
+                 interval_seconds: float = RESOURCE_SAMPLE_INTERVAL,
+                 history_size: int = RESOURCE_SAMPLE_HISTORY,
+                 disk_path: Optional[str] = None,
+                 logger: Optional[logging.Logger] = None):
+        self.interval_seconds = interval_seconds
+        self.disk_path = disk_path or os.getenv("DATA_ROOT") or "/"
+        if not os.path.exists(self.disk_path):
+            self.disk_path = "/"
+        self.logger = logger or logging.getLogger("browser.resource_sampler")
+
+        self._latest: Optional[ResourceSnapshot] = None
+        self._history: Deque[ResourceSnapshot] = deque(maxlen=history_size)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._process = psutil.Process() if PSUTIL_AVAILABLE else None
+
+        if PSUTIL_AVAILABLE:
+            # Prime the counter: the first non-blocking cpu_percent() call always returns 0.0
+            psutil.cpu_percent(interval=None)
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval_seconds + 1)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._publish(self._sample())
+            self._stop.wait(self.interval_seconds)
+
+    def _publish(self, snapshot: ResourceSnapshot) -> None:
+        # Reference assignment is atomic; readers see either the old or the new snapshot
+        self._history.append(snapshot)
+        self._latest = snapshot
+
+    def _sample(self) -> ResourceSnapshot:
+        now = time.time()
+        if not PSUTIL_AVAILABLE:
+            return ResourceSnapshot(timestamp=now)
+
+        try:
+            memory = psutil.virtual_memory()
+            disk = psutil.disk_usage(self.disk_path)
+            process = self._process
+
+            browser: List[Dict[str, Any]] = []
+            for child in process.children(recursive=True):
+                try:
+                    name = child.name()
+                    if any(marker in name.lower() for marker in BROWSER_PROCESS_MARKERS):
+                        browser.append({"pid": child.pid, "name": name, "rss_bytes": child.memory_info().rss})
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    continue
+
+            try:
+                open_fds = process.num_fds()
+            except (AttributeError, psutil.Error):
+                open_fds = 0  # num_fds() is Unix-only
+
+            browser.sort(key=lambda p: p["rss_bytes"], reverse=True)
+            return ResourceSnapshot(
+                timestamp=now,
+                available=True,
+                cpu_percent=psutil.cpu_percent(interval=None),
+                memory_percent=memory.percent,
+                memory_used_bytes=memory.used,
+                memory_available_bytes=memory.available,
+                disk_percent=disk.percent,
+                disk_free_bytes=disk.free,
+                process_rss_bytes=process.memory_info().rss,
+                browser_rss_bytes=sum(p["rss_bytes"] for p in browser),
+                browser_process_count=len(browser),
+                open_fds=open_fds,
+                browser_processes=tuple(
+                    {"pid": p["pid"], "name": p["name"], "rss_mb": round(p["rss_bytes"] / (1024 * 1024), 1)}
+                    for p in browser[:MAX_REPORTED_PROCESSES]
+                ),
+            )
+        except Exception as e:
+            self.logger.debug(f"Resource sampling failed: {e}")
+            return ResourceSnapshot(timestamp=now)
+
+    # ───── readers ─────
+
+    @property
+    def latest(self) -> Optional[ResourceSnapshot]:
+        return self._latest
+
+    def snapshot(self) -> ResourceSnapshot:
+        """Latest snapshot; before the first sample, take one (non-blocking) inline."""
+        snapshot = self._latest
+        if snapshot is None:
+            snapshot = self._sample()
+            self._publish(snapshot)
+        return snapshot
+
+    def history(self, window_seconds: Optional[float] = None) -> List[ResourceSnapshot]:
+        samples = list(self._history)
+        if window_seconds is None:
+            return samples
+        cutoff = time.time() - window_seconds
+        return [s for s in samples if s.timestamp >= cutoff]
+
+
+_sampler: Optional[ResourceSampler] = None
+
+
+def get_resource_sampler() -> ResourceSampler:
+    """Return the process-wide sampler, starting its thread on first use."""
+    global _sampler
+    if _sampler is None:
+        _sampler = ResourceSampler()
+        _sampler.start()
+    return _sampler
+
+
+def stop_resource_sampler() -> None:
+    """Stop the sampler thread (service shutdown)."""
+    global _sampler
+    if _sampler is not None:
+        _sampler.stop()
+        _sampler = None
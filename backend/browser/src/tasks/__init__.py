@@ -1,5 +1,5 @@
 # Task modules for browser automation
-from typing import Dict, Any, Callable, Awaitable
+from typing import Dict, Any, Callable, Awaitable, Optional
 import logging
 from playwright.async_api import Browser
 
@@ -47,8 +47,9 @@ async def website(*, browser: Browser, params: Dict[str, Any], job_output_dir: s
     return await WebsiteTask.run(browser=browser, params=params, job_output_dir=job_output_dir, logger=logger)
 
 @_registry.register("saudi")
-async def saudi(*, browser: Browser, params: Dict[str, Any], job_output_dir: str, logger: logging.Logger) -> Dict[str, Any]:
-    return await SaudiTask.run(browser=browser, params=params, job_output_dir=job_output_dir, logger=logger)
+async def saudi(*, browser: Browser, params: Dict[str, Any], job_output_dir: str, logger: logging.Logger,
+                progress: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None) -> Dict[str, Any]:
+    return await SaudiTask.run(browser=browser, params=params, job_output_dir=job_output_dir, logger=logger, progress=progress)
 
 @_registry.register("github")
 async def github(*, browser: Browser, params: Dict[str, Any], job_output_dir: str, logger: logging.Logger) -> Dict[str, Any]:
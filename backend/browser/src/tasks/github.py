@@ -6,17 +6,146 @@ Collects code, metadata, discussions, community insights, and repository health
 """
 
 import asyncio
+import hashlib
 import logging
 import json
+import os
+import time
 import urllib.parse
 import pathlib
 import base64
 import re
-from typing import Any, Dict, List, Optional, Tuple
-from datetime import datetime
+import tarfile
+import tempfile
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
 import httpx
 
 from .base import _log
+from ..http_cache import ResponseCache, get_response_cache
+from ..http_pool import get_http_pool
+from ..utils import save_json_atomic
+
+
+class GithubRateBudget:
+    """
+    Rate-limit budget for one GitHub token, shared by every job using it.
+
+    The budget is refreshed from ``X-RateLimit-*`` response headers. Calls run
+    with bounded concurrency; once the remaining budget drops below
+    ``LOW_WATERMARK`` of the limit they are spaced out over the time left until
+    the reset, and when it is exhausted they wait for the reset (up to
+    ``MAX_RESET_WAIT``) or are refused.
+    """
+
+    LOW_WATERMARK = 0.1
+    MAX_PACING_INTERVAL = 5.0
+    MAX_RESET_WAIT = 90.0
+
+    def __init__(self, key: str, concurrency: int = 4):
+        self.key = key
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.requests = 0
+        self.refused = 0
+        self.throttled_seconds = 0.0
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._next_slot = 0.0
+
+    def _interval(self, now: float) -> float:
+        """Minimum spacing between calls for the current budget."""
+        if self.remaining is None or not self.limit or not self.reset_at:
+            return 0.0
+        if self.remaining > self.limit * self.LOW_WATERMARK:
+            return 0.0
+        window = max(0.0, self.reset_at - now)
+        return min(self.MAX_PACING_INTERVAL, window / max(1, self.remaining))
+
+    def reset_wait(self) -> float:
+        """Seconds until the budget resets (0 when unknown or already reset)."""
+        return max(0.0, self.reset_at - time.time()) if self.reset_at else 0.0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[bool]:
+        """Reserve a call; yields False when the budget is exhausted for too long."""
+        async with self._semaphore:
+            now = time.time()
+            if self.reset_at and now >= self.reset_at:
+                self.remaining, self.reset_at = self.limit, None
+
+            if self.remaining is not None and self.remaining <= 0:
+                wait = self.reset_wait()
+                if wait > self.MAX_RESET_WAIT:
+                    self.refused += 1
+                    yield False
+                    return
+                self.throttled_seconds += wait
+                await asyncio.sleep(wait)
+                now = time.time()
+
+            # Reserve the next free slot so concurrent callers queue without a lock
+            start = max(now, self._next_slot)
+            self._next_slot = start + self._interval(now)
+            if start > now:
+                self.throttled_seconds += start - now
+                await asyncio.sleep(start - now)
+
+            if self.remaining is not None:
+                self.remaining = max(0, self.remaining - 1)
+            self.requests += 1
+            yield True
+
+    def update(self, headers: httpx.Headers) -> None:
+        """Refresh the budget from response headers."""
+        try:
+            remaining = headers.get("x-ratelimit-remaining")
+            if remaining is None:
+                return
+            limit = int(headers.get("x-ratelimit-limit", 0)) or self.limit
+            reset_at = float(headers.get("x-ratelimit-reset", 0)) or None
+            remaining = int(remaining)
+
+            # Responses can arrive out of order within one window: keep the lower count
+            if self.reset_at == reset_at and self.remaining is not None:
+                remaining = min(remaining, self.remaining)
+            self.limit, self.remaining, self.reset_at = limit, remaining, reset_at
+        except (TypeError, ValueError):
+            pass
+
+    def retry_delay(self, response: httpx.Response) -> Optional[float]:
+        """Delay before retrying a 403/429, or None if it is not a rate limit."""
+        retry_after = response.headers.get("retry-after")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                return None
+        if response.headers.get("x-ratelimit-remaining") == "0":
+            return self.reset_wait()
+        return None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "token": self.key,
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "reset_at": datetime.fromtimestamp(self.reset_at, timezone.utc).isoformat() if self.reset_at else None,
+            "requests": self.requests,
+            "refused": self.refused,
+            "throttled_seconds": round(self.throttled_seconds, 2)
+        }
+
+
+# Process-wide budgets keyed by token fingerprint (GitHub limits are per token)
+_rate_budgets: Dict[str, GithubRateBudget] = {}
+
+GITHUB_STATE_ROOT: str = os.getenv("GITHUB_STATE_ROOT", "")
+
+# Response cache for the running job; set in GithubTask.run, inherited by gathered sections
+_response_cache: ContextVar[Optional[ResponseCache]] = ContextVar("github_response_cache", default=None)
 
 
 class GithubTask:
@@ -34,6 +163,12 @@ class GithubTask:
     - Structured RAG-ready output
     """
 
+    # Repository archive (tarball) limits
+    ARCHIVE_MAX_BYTES = 300 * 1024 * 1024       # give up on the archive beyond this
+    ARCHIVE_SPOOL_BYTES = 32 * 1024 * 1024      # keep archive in memory up to this, then spill to disk
+    ARCHIVE_MAX_MEMBER_BYTES = 1024 * 1024      # same per-file ceiling as the contents API
+    INCREMENTAL_ARCHIVE_MIN_FILES = 20          # fewer changed files than this: use the contents API
+
     # ═══════════════════════════════════════════════════════════════════════
     # URL PARSING
     # ═══════════════════════════════════════════════════════════════════════
@@ -64,22 +199,99 @@ class GithubTask:
         headers: Dict[str, str],
         params: Optional[Dict[str, Any]] = None
     ) -> Tuple[bool, Optional[Any], Optional[str]]:
-        """Make GitHub API request with error handling."""
+        """
+        Make GitHub API request with error handling and rate-limit pacing.
+        Cached responses are revalidated with conditional requests; a 304 reuses
+        the stored body and does not count against the rate limit.
+        """
+        budget = GithubTask._rate_budget(headers)
+        cache = _response_cache.get()
         try:
             url = f"https://api.github.com/{endpoint.lstrip('/')}"
-            response = await client.get(url, headers=headers, params=params or {})
 
-            if response.status_code == 200:
-                return True, response.json(), None
-            elif response.status_code == 403:
+            cache_key = cache.key_for(url, params, budget.key) if cache else None
+            cached = cache.get(cache_key) if cache else None
+            if cached and cache.is_fresh(cached):
+                cache.stats["fresh_hits"] += 1
+                return True, cached["body"], None
+            if cache and not cached:
+                cache.stats["misses"] += 1
+            request_headers = {**headers, **ResponseCache.conditional_headers(cached)}
+
+            for attempt in range(2):
+                async with budget.slot() as allowed:
+                    if not allowed:
+                        return False, None, "api_rate_limit"
+                    response = await client.get(url, headers=request_headers, params=params or {})
+                budget.update(response.headers)
+
+                if response.status_code == 304 and cached:
+                    cache.revalidated(cache_key, cached)
+                    return True, cached["body"], None
+                elif response.status_code == 200:
+                    data = response.json()
+                    if cache:
+                        cache.put(cache_key, url, response.headers, data)
+                    return True, data, None
+                elif response.status_code in (403, 429):
+                    # Primary (remaining=0) or secondary (Retry-After) limit: wait once if short
+                    delay = budget.retry_delay(response)
+                    if attempt == 0 and delay is not None and delay <= GithubRateBudget.MAX_RESET_WAIT:
+                        budget.throttled_seconds += delay
+                        await asyncio.sleep(delay)
+                        continue
+                    return False, None, "api_rate_limit"
+                elif response.status_code == 404:
+                    return False, None, "not_found"
+                else:
+                    return False, None, f"api_error_{response.status_code}"
+            return False, None, "api_rate_limit"
+        except Exception as e:
+            return False, None, f"request_failed_{type(e).__name__}"
+
+    @staticmethod
+    async def _graphql_request(
+        client: httpx.AsyncClient,
+        query: str,
+        variables: Dict[str, Any],
+        headers: Dict[str, str]
+    ) -> Tuple[bool, Optional[Any], Optional[str]]:
+        """Run a GraphQL query (requires a token); paced by the token's GraphQL budget."""
+        budget = GithubTask._rate_budget(headers, resource="graphql")
+        try:
+            async with budget.slot() as allowed:
+                if not allowed:
+                    return False, None, "api_rate_limit"
+                response = await client.post(
+                    "https://api.github.com/graphql",
+                    headers=headers,
+                    json={"query": query, "variables": variables}
+                )
+            budget.update(response.headers)
+
+            if response.status_code in (403, 429):
                 return False, None, "api_rate_limit"
-            elif response.status_code == 404:
-                return False, None, "not_found"
-            else:
+            elif response.status_code != 200:
                 return False, None, f"api_error_{response.status_code}"
+
+            payload = response.json()
+            if payload.get("errors"):
+                return False, None, f"graphql_error_{payload['errors'][0].get('type', 'unknown')}"
+            return True, payload.get("data"), None
         except Exception as e:
             return False, None, f"request_failed_{type(e).__name__}"
 
+    @staticmethod
+    def _rate_budget(headers: Dict[str, str], resource: str = "core") -> GithubRateBudget:
+        """Return the shared budget for the token in ``headers`` (never stores the token)."""
+        auth = headers.get("Authorization", "")
+        key = f"token:{hashlib.sha256(auth.encode()).hexdigest()[:12]}" if auth else "anonymous"
+        if resource != "core":
+            key = f"{key}:{resource}"
+        if key not in _rate_budgets:
+            _rate_budgets[key] = GithubRateBudget(key)
+        return _rate_budgets[key]
+
     # ═══════════════════════════════════════════════════════════════════════
     # REPOSITORY METADATA
     # ═══════════════════════════════════════════════════════════════════════
@@ -139,10 +351,19 @@ class GithubTask:
         headers: Dict[str, str],
         logger: logging.Logger,
         max_files: int = 500,
-        output_dir: pathlib.Path = None
+        output_dir: pathlib.Path = None,
+        use_archive: bool = True,
+        max_archive_bytes: Optional[int] = None,
+        previous: Optional[Dict[str, Any]] = None
     ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """
         Get repository file contents with smart prioritization.
+
+        With ``use_archive`` the repository tarball is downloaded once and the
+        prioritized files are read from it; per-file contents API calls are only
+        made when the archive is unavailable or a file is missing from it.
+        With ``previous`` analysis state, files whose blob SHA is unchanged are
+        read from the previous job's output instead of being downloaded.
         Returns: (files_metadata, code_structure_analysis)
         """
         # Get repository tree
@@ -157,9 +378,36 @@ class GithubTask:
         # Categorize files by priority
         files_by_priority = GithubTask._categorize_files(tree_data.get("tree", []))
 
+        # Unchanged blobs from the previous analysis are reused from its output directory
+        reusable = GithubTask._reusable_files(tree_data.get("tree", []), previous)
+
+        # Read prioritized files from the repository archive in one download
+        archive_contents: Dict[str, str] = {}
+        archive_seen: set = set()
+        archive_bytes = 0
+        archive_ok = False
+        ordered = [
+            item.get("path", "")
+            for priority in ["critical", "high", "medium", "low"]
+            for item in files_by_priority.get(priority, [])
+        ]
+        # A little slack for files that turn out empty or unreadable
+        wanted = {path for path in ordered[:max_files + max(20, max_files // 5)] if path not in reusable}
+        # Only a few changed files: per-file calls are cheaper than the whole archive
+        if previous and len(wanted) < GithubTask.INCREMENTAL_ARCHIVE_MIN_FILES:
+            use_archive = False
+        if use_archive and wanted:
+            archive_ok, archive_contents, archive_seen, archive_bytes = await GithubTask._get_archive_contents(
+                client, owner, repo, headers, logger, wanted,
+                max_archive_bytes or GithubTask.ARCHIVE_MAX_BYTES
+            )
+
         # Collect files based on priority
         files_collected = []
         files_metadata = []
+        api_fetches = 0
+        archive_hits = 0
+        reused = 0
 
         for priority in ["critical", "high", "medium", "low"]:
             if len(files_collected) >= max_files:
@@ -171,10 +419,22 @@ class GithubTask:
 
                 path = file_info.get("path", "")
 
-                # Download file content
-                content = await GithubTask._get_file_content(
-                    client, owner, repo, path, headers, logger
-                )
+                if path in reusable:
+                    try:
+                        content = reusable[path].read_text(encoding="utf-8")
+                        reused += 1
+                    except Exception:
+                        content = await GithubTask._get_file_content(client, owner, repo, path, headers, logger)
+                        api_fetches += 1
+                elif archive_ok and path in archive_seen:
+                    content = archive_contents.get(path)
+                    archive_hits += 1 if content else 0
+                else:
+                    # Download file content
+                    api_fetches += 1
+                    content = await GithubTask._get_file_content(
+                        client, owner, repo, path, headers, logger
+                    )
 
                 if content:
                     # Save file to disk if output_dir provided
@@ -192,19 +452,131 @@ class GithubTask:
 
                     files_collected.append({
                         "path": path,
+                        "sha": file_info.get("sha"),
                         "filename": path.split("/")[-1],
                         "content": content[:50000],  # Limit content size
                         "priority": priority,
                         **file_metadata
                     })
 
-        _log(logger, "info", f"Collected {len(files_collected)} repository files")
+        _log(logger, "info", f"Collected {len(files_collected)} repository files "
+                             f"({reused} unchanged, {archive_hits} from archive, {api_fetches} API calls)")
 
         # Analyze code structure
         code_structure = GithubTask._analyze_code_structure(files_collected, tree_data.get("tree", []))
+        code_structure["tree_sha"] = tree_data.get("sha")
+        code_structure["file_source"] = {
+            "mode": "archive" if archive_ok else "contents_api",
+            "archive_bytes": archive_bytes,
+            "contents_api_calls": api_fetches,
+            "reused_unchanged": reused
+        }
 
         return files_collected, code_structure
 
+    @staticmethod
+    def _reusable_files(tree: List[Dict[str, Any]], previous: Optional[Dict[str, Any]]) -> Dict[str, pathlib.Path]:
+        """Paths whose blob SHA matches the previous analysis and whose saved copy still exists."""
+        if not previous or not previous.get("files_dir"):
+            return {}
+        prev_dir = pathlib.Path(previous["files_dir"])
+        prev_blobs = previous.get("blobs", {})
+        reusable = {}
+        for item in tree:
+            path = item.get("path", "")
+            if item.get("type") == "blob" and prev_blobs.get(path) == item.get("sha"):
+                saved = prev_dir / path
+                if saved.is_file():
+                    reusable[path] = saved
+        return reusable
+
+    @staticmethod
+    async def _get_archive_contents(
+        client: httpx.AsyncClient,
+        owner: str,
+        repo: str,
+        headers: Dict[str, str],
+        logger: logging.Logger,
+        wanted: set,
+        max_bytes: int
+    ) -> Tuple[bool, Dict[str, str], set, int]:
+        """
+        Download the default-branch tarball and read the ``wanted`` paths from it.
+        Returns: (ok, {path: content}, paths present in the archive, archive size)
+        """
+        url = f"https://api.github.com/repos/{owner}/{repo}/tarball"
+        spool = tempfile.SpooledTemporaryFile(max_size=GithubTask.ARCHIVE_SPOOL_BYTES)
+        try:
+            size = 0
+            async with GithubTask._rate_budget(headers).slot() as allowed:
+                if not allowed:
+                    _log(logger, "warning", "GitHub rate limit exhausted, skipping repository archive")
+                    return False, {}, set(), 0
+
+            # The API redirects to codeload.github.com; the Authorization header is dropped there
+            async with client.stream(
+                "GET", url, headers=headers, follow_redirects=True,
+                timeout=httpx.Timeout(120.0, connect=10.0)
+            ) as response:
+                if response.status_code != 200:
+                    _log(logger, "warning", f"Repository archive unavailable (HTTP {response.status_code}), using contents API")
+                    return False, {}, set(), 0
+
+                async for chunk in response.aiter_bytes():
+                    size += len(chunk)
+                    if size > max_bytes:
+                        _log(logger, "warning", f"Repository archive exceeds {max_bytes // (1024 * 1024)}MB, using contents API")
+                        return False, {}, set(), 0
+                    spool.write(chunk)
+
+            spool.seek(0)
+            contents, seen = await asyncio.to_thread(
+                GithubTask._read_archive_members, spool, wanted, GithubTask.ARCHIVE_MAX_MEMBER_BYTES
+            )
+            _log(logger, "info", f"Read {len(contents)} files from repository archive ({size // 1024}KB)")
+            return True, contents, seen, size
+
+        except Exception as e:
+            _log(logger, "warning", f"Repository archive failed ({type(e).__name__}: {e}), using contents API")
+            return False, {}, set(), 0
+        finally:
+            spool.close()
+
+    @staticmethod
+    def _read_archive_members(archive_file, wanted: set, max_member_bytes: int) -> Tuple[Dict[str, str], set]:
+        """Stream through a .tar.gz and decode only the wanted members."""
+        contents: Dict[str, str] = {}
+        seen: set = set()
+
+        with tarfile.open(fileobj=archive_file, mode="r|gz") as tar:
+            for member in tar:
+                if not member.isfile():
+                    continue
+
+                # Members are prefixed with "<owner>-<repo>-<sha>/"
+                parts = member.name.split("/", 1)
+                if len(parts) < 2 or parts[1] not in wanted:
+                    continue
+
+                path = parts[1]
+                seen.add(path)
+                if member.size > max_member_bytes:
+                    continue
+
+                fileobj = tar.extractfile(member)
+                if fileobj is None:
+                    continue
+
+                content = fileobj.read().decode("utf-8", errors="ignore")
+                if len(content) > 100000:  # 100KB limit, as in _get_file_content
+                    content = content[:100000] + "\n... (truncated)"
+                contents[path] = content
+
+                if len(seen) == len(wanted):
+                    break
+
+        return contents, seen
+
     @staticmethod
     def _categorize_files(tree: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """Categorize files by priority for smart collection."""
@@ -382,9 +754,10 @@ class GithubTask:
         repo: str,
         headers: Dict[str, str],
         logger: logging.Logger,
-        max_prs: int = 50
+        max_prs: int = 50,
+        since: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Get pull requests with discussions and context."""
+        """Get pull requests with discussions and context (only those updated after ``since``, if given)."""
         success, data, error = await GithubTask._github_api_request(
             client, f"repos/{owner}/{repo}/pulls",
             headers,
@@ -397,6 +770,9 @@ class GithubTask:
 
         prs = []
         for pr in data[:max_prs]:
+            # Sorted by update time: everything after this is older than the last run
+            if since and (pr.get("updated_at") or "") < since:
+                break
             pr_data = {
                 "number": pr.get("number"),
                 "title": pr.get("title"),
@@ -481,9 +857,10 @@ class GithubTask:
         owner: str,
         repo: str,
         headers: Dict[str, str],
-        logger: logging.Logger
+        logger: logging.Logger,
+        prefetched: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
-        """Extract and analyze project dependencies."""
+        """Extract and analyze project dependencies (reusing already collected files)."""
         dependencies = {
             "production": {},
             "development": {},
@@ -503,9 +880,12 @@ class GithubTask:
         ]
 
         for filename, package_manager in dep_files:
-            content = await GithubTask._get_file_content(
-                client, owner, repo, filename, headers, logger
-            )
+            if prefetched and filename in prefetched:
+                content = prefetched[filename]
+            else:
+                content = await GithubTask._get_file_content(
+                    client, owner, repo, filename, headers, logger
+                )
 
             if content:
                 dependencies["dependency_files"].append(filename)
@@ -619,13 +999,17 @@ class GithubTask:
         repo: str,
         headers: Dict[str, str],
         logger: logging.Logger,
-        max_issues: int = 50
+        max_issues: int = 50,
+        since: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Get repository issues."""
+        """Get repository issues (only those updated after ``since``, if given)."""
+        query = {"state": "all", "per_page": max_issues, "sort": "updated"}
+        if since:
+            query["since"] = since
         success, data, error = await GithubTask._github_api_request(
             client, f"repos/{owner}/{repo}/issues",
             headers,
-            {"state": "all", "per_page": max_issues, "sort": "updated"}
+            query
         )
 
         if not success:
@@ -694,6 +1078,218 @@ class GithubTask:
         _log(logger, "info", f"Collected {len(releases)} releases")
         return releases
 
+    # ═══════════════════════════════════════════════════════════════════════
+    # GRAPHQL BATCH COLLECTION (PRS, ISSUES, RELEASES)
+    # ═══════════════════════════════════════════════════════════════════════
+
+    GRAPHQL_PRS = """
+    query($owner: String!, $name: String!, $first: Int!, $comments: Int!) {
+      repository(owner: $owner, name: $name) {
+        pullRequests(first: $first, orderBy: {field: UPDATED_AT, direction: DESC}) {
+          nodes {
+            number title state body url merged
+            createdAt updatedAt closedAt mergedAt
+            author { login }
+            labels(first: 20) { nodes { name } }
+            commits { totalCount }
+            reviewThreads { totalCount }
+            comments(first: $comments) { totalCount nodes { author { login } body createdAt } }
+          }
+        }
+      }
+    }"""
+
+    GRAPHQL_ISSUES = """
+    query($owner: String!, $name: String!, $first: Int!, $comments: Int!, $since: DateTime) {
+      repository(owner: $owner, name: $name) {
+        issues(first: $first, orderBy: {field: UPDATED_AT, direction: DESC}, filterBy: {since: $since}) {
+          nodes {
+            number title state body url
+            createdAt updatedAt closedAt
+            author { login }
+            labels(first: 20) { nodes { name } }
+            comments(first: $comments) { totalCount nodes { author { login } body createdAt } }
+          }
+        }
+      }
+    }"""
+
+    GRAPHQL_RELEASES = """
+    query($owner: String!, $name: String!, $first: Int!) {
+      repository(owner: $owner, name: $name) {
+        releases(first: $first, orderBy: {field: CREATED_AT, direction: DESC}) {
+          nodes { tagName name description url createdAt publishedAt isPrerelease isDraft }
+        }
+      }
+    }"""
+
+    @staticmethod
+    def _graphql_comments(node: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "user": (c.get("author") or {}).get("login"),
+                "body": (c.get("body") or "")[:1000],
+                "created_at": c.get("createdAt")
+            }
+            for c in (node.get("comments") or {}).get("nodes", [])
+        ]
+
+    @staticmethod
+    async def _get_discussions_graphql(
+        client: httpx.AsyncClient,
+        owner: str,
+        repo: str,
+        headers: Dict[str, str],
+        logger: logging.Logger,
+        max_prs: int = 50,
+        max_issues: int = 50,
+        max_releases: int = 20,
+        max_comments: int = 10,
+        since: Optional[str] = None
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[List[Dict[str, Any]]], Optional[List[Dict[str, Any]]]]:
+        """
+        Collect PRs (with comments), issues (with comments) and releases in three
+        GraphQL queries, in the same shape as the REST collectors. A section is
+        None when its query failed so the caller can fall back to REST.
+        """
+        variables = {"owner": owner, "name": repo, "comments": max_comments}
+        (pr_ok, pr_data, pr_err), (issue_ok, issue_data, issue_err), (rel_ok, rel_data, rel_err) = await asyncio.gather(
+            GithubTask._graphql_request(client, GithubTask.GRAPHQL_PRS, {**variables, "first": max_prs}, headers),
+            GithubTask._graphql_request(client, GithubTask.GRAPHQL_ISSUES, {**variables, "first": max_issues, "since": since}, headers),
+            GithubTask._graphql_request(client, GithubTask.GRAPHQL_RELEASES, {**variables, "first": max_releases}, headers)
+        )
+
+        prs = None
+        if pr_ok:
+            prs = []
+            for pr in ((pr_data or {}).get("repository") or {}).get("pullRequests", {}).get("nodes", []):
+                if since and (pr.get("updatedAt") or "") < since:
+                    break
+                prs.append({
+                    "number": pr.get("number"),
+                    "title": pr.get("title"),
+                    "state": "open" if pr.get("state") == "OPEN" else "closed",
+                    "body": (pr.get("body") or "")[:2000],  # Limit body length
+                    "created_at": pr.get("createdAt"),
+                    "updated_at": pr.get("updatedAt"),
+                    "closed_at": pr.get("closedAt"),
+                    "merged_at": pr.get("mergedAt"),
+                    "merged": pr.get("merged", False),
+                    "user": (pr.get("author") or {}).get("login"),
+                    "labels": [label.get("name") for label in (pr.get("labels") or {}).get("nodes", [])],
+                    "comments_count": (pr.get("comments") or {}).get("totalCount", 0),
+                    "review_comments_count": (pr.get("reviewThreads") or {}).get("totalCount", 0),
+                    "commits_count": (pr.get("commits") or {}).get("totalCount", 0),
+                    "url": pr.get("url"),
+                    "comments": GithubTask._graphql_comments(pr)
+                })
+            _log(logger, "info", f"Collected {len(prs)} pull requests (GraphQL)")
+        else:
+            _log(logger, "warning", f"GraphQL pull requests failed: {pr_err}")
+
+        issues = None
+        if issue_ok:
+            issues = []
+            for issue in ((issue_data or {}).get("repository") or {}).get("issues", {}).get("nodes", []):
+                issues.append({
+                    "number": issue.get("number"),
+                    "title": issue.get("title"),
+                    "body": (issue.get("body") or "")[:2000],  # Limit body length
+                    "state": (issue.get("state") or "").lower(),
+                    "created_at": issue.get("createdAt"),
+                    "updated_at": issue.get("updatedAt"),
+                    "closed_at": issue.get("closedAt"),
+                    "labels": [label.get("name") for label in (issue.get("labels") or {}).get("nodes", [])],
+                    "comments": (issue.get("comments") or {}).get("totalCount", 0),
+                    "user": (issue.get("author") or {}).get("login"),
+                    "url": issue.get("url"),
+                    "discussion": GithubTask._graphql_comments(issue)
+                })
+            _log(logger, "info", f"Collected {len(issues)} issues (GraphQL)")
+        else:
+            _log(logger, "warning", f"GraphQL issues failed: {issue_err}")
+
+        releases = None
+        if rel_ok:
+            releases = []
+            for release in ((rel_data or {}).get("repository") or {}).get("releases", {}).get("nodes", []):
+                releases.append({
+                    "tag_name": release.get("tagName"),
+                    "name": release.get("name"),
+                    "body": (release.get("description") or "")[:2000],  # Limit body length
+                    "created_at": release.get("createdAt"),
+                    "published_at": release.get("publishedAt"),
+                    "prerelease": release.get("isPrerelease"),
+                    "draft": release.get("isDraft"),
+                    "url": release.get("url")
+                })
+            _log(logger, "info", f"Collected {len(releases)} releases (GraphQL)")
+        else:
+            _log(logger, "warning", f"GraphQL releases failed: {rel_err}")
+
+        return prs, issues, releases
+
+    @staticmethod
+    async def _collect_discussions(
+        client: httpx.AsyncClient,
+        owner: str,
+        repo: str,
+        headers: Dict[str, str],
+        logger: logging.Logger,
+        max_prs: int,
+        max_issues: int,
+        max_releases: int,
+        use_graphql: bool,
+        since: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """PRs, issues and releases via GraphQL when enabled, REST for anything it could not fetch."""
+        prs = issues = releases = None
+        if use_graphql:
+            prs, issues, releases = await GithubTask._get_discussions_graphql(
+                client, owner, repo, headers, logger, max_prs, max_issues, max_releases, since=since
+            )
+
+        async def _keep(value):
+            return value
+
+        return await asyncio.gather(
+            _keep(prs) if prs is not None else
+            GithubTask._get_pull_requests(client, owner, repo, headers, logger, max_prs, since),
+            _keep(issues) if issues is not None else
+            GithubTask._get_issues(client, owner, repo, headers, logger, max_issues, since),
+            _keep(releases) if releases is not None else
+            GithubTask._get_releases(client, owner, repo, headers, logger, max_releases)
+        )
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # INCREMENTAL STATE
+    # ═══════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _state_path(output_dir: pathlib.Path, owner: str, repo: str) -> pathlib.Path:
+        """Per-repository state, kept at ``<data_root>/_github_state`` unless GITHUB_STATE_ROOT is set."""
+        root = pathlib.Path(GITHUB_STATE_ROOT) if GITHUB_STATE_ROOT else \
+            output_dir.resolve().parent.parent / "_github_state"
+        return root / f"{owner}__{repo}.json"
+
+    @staticmethod
+    def _load_state(path: pathlib.Path, logger: logging.Logger) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            _log(logger, "warning", f"Ignoring unreadable analysis state {path.name}: {e}")
+            return None
+
+    @staticmethod
+    def _merge_updated(previous: List[Dict[str, Any]], fresh: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+        """Overlay items updated since the last run on the previous list, newest first."""
+        merged = {item.get("number"): item for item in previous}
+        merged.update({item.get("number"): item for item in fresh})
+        return sorted(merged.values(), key=lambda item: item.get("updated_at") or "", reverse=True)[:limit]
+
     # ═══════════════════════════════════════════════════════════════════════
     # MAIN ENTRY POINT
     # ═══════════════════════════════════════════════════════════════════════
@@ -711,6 +1307,11 @@ class GithubTask:
         - max_prs: Maximum number of pull requests (default: 50)
         - max_releases: Maximum number of releases (default: 20)
         - max_contributors: Maximum number of contributors (default: 30)
+        - fetch_mode: "archive" (default, one tarball download) or "contents" (per-file API calls)
+        - max_archive_mb: Largest tarball to download before falling back (default: 300)
+        - use_cache: Revalidate API responses against the persistent ETag cache (default: True)
+        - use_graphql: Batch PRs, issues and releases through GraphQL when a token is given (default: True)
+        - incremental: Reuse unchanged files and PRs/issues from the last analysis of this repository (default: False)
 
         Output Structure:
         - files/: Actual code files organized by directory
@@ -741,6 +1342,10 @@ class GithubTask:
         max_prs = min(100, max(10, int(params.get("max_prs", 50))))
         max_releases = min(50, max(5, int(params.get("max_releases", 20))))
         max_contributors = min(50, max(5, int(params.get("max_contributors", 30))))
+        use_archive = str(params.get("fetch_mode", "archive")).lower() != "contents"
+        max_archive_bytes = max(1, int(params.get("max_archive_mb", 300))) * 1024 * 1024
+        use_graphql = bool(github_token) and params.get("use_graphql", True)
+        incremental = bool(params.get("incremental", False))
 
         # Setup headers
         headers = {
@@ -761,8 +1366,51 @@ class GithubTask:
         _log(logger, "info", f"Starting RAG-optimized GitHub analysis: {owner}/{repo}")
         _log(logger, "info", f"Max files: {max_files}, Max PRs: {max_prs}, Max issues: {max_issues}")
 
+        # Persistent ETag cache shared across jobs (conditional requests)
+        cache = get_response_cache(job_output_dir, "github", logger) if params.get("use_cache", True) else None
+        cache_token = _response_cache.set(cache)
+
+        try:
+            return await GithubTask._analyze(
+                url, owner, repo, headers, output_dir, logger,
+                max_files=max_files, max_prs=max_prs, max_issues=max_issues,
+                max_releases=max_releases, max_contributors=max_contributors,
+                use_archive=use_archive, max_archive_bytes=max_archive_bytes,
+                use_graphql=use_graphql, incremental=incremental
+            )
+        finally:
+            _response_cache.reset(cache_token)
+
+    @staticmethod
+    async def _analyze(
+        url: str,
+        owner: str,
+        repo: str,
+        headers: Dict[str, str],
+        output_dir: pathlib.Path,
+        logger: logging.Logger,
+        *,
+        max_files: int,
+        max_prs: int,
+        max_issues: int,
+        max_releases: int,
+        max_contributors: int,
+        use_archive: bool,
+        max_archive_bytes: int,
+        use_graphql: bool = False,
+        incremental: bool = False
+    ) -> Dict[str, Any]:
+        """Collect, analyse and save all repository sections."""
+        # State of the last analysis is always written; it is only read in incremental mode
+        state_path = GithubTask._state_path(output_dir, owner, repo)
+        previous = GithubTask._load_state(state_path, logger) if incremental else None
+        since = previous.get("analysed_at") if previous else None
+        started_at = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        if previous:
+            _log(logger, "info", f"Incremental analysis against tree {str(previous.get('tree_sha'))[:12]} (since {since})")
+
         timeout = httpx.Timeout(30.0, connect=10.0)
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        async with get_http_pool().client(timeout=timeout, follow_redirects=False) as client:
 
             # Collect all data
             _log(logger, "info", "Fetching repository metadata...")
@@ -771,11 +1419,25 @@ class GithubTask:
             if "error" in metadata:
                 raise ValueError(f"Repository access failed: {metadata['error']}")
 
-            _log(logger, "info", "Collecting repository files with smart prioritization...")
-            files, code_structure = await GithubTask._get_repo_contents(
-                client, owner, repo, headers, logger, max_files, output_dir
+            # Independent sections run concurrently; the shared rate budget paces the calls
+            _log(logger, "info", "Collecting files, pull requests, contributors, issues and releases...")
+            (files, code_structure), contributors_data, (prs, issues, releases) = await asyncio.gather(
+                GithubTask._get_repo_contents(
+                    client, owner, repo, headers, logger, max_files, output_dir,
+                    use_archive=use_archive, max_archive_bytes=max_archive_bytes, previous=previous
+                ),
+                GithubTask._get_contributors(client, owner, repo, headers, logger, max_contributors),
+                GithubTask._collect_discussions(
+                    client, owner, repo, headers, logger, max_prs, max_issues, max_releases, use_graphql, since
+                )
             )
 
+            if previous:
+                updated_prs, updated_issues = len(prs), len(issues)
+                prs = GithubTask._merge_updated(previous.get("pull_requests", []), prs, max_prs)
+                issues = GithubTask._merge_updated(previous.get("issues", []), issues, max_issues)
+                _log(logger, "info", f"Merged {updated_prs} updated PRs and {updated_issues} updated issues into previous results")
+
             # Save per-file metadata
             _log(logger, "info", "Generating per-file metadata...")
             for file_data in files:
@@ -799,20 +1461,11 @@ class GithubTask:
                 except Exception as e:
                     _log(logger, "debug", f"Could not save metadata for {file_data.get('path')}: {e}")
 
-            _log(logger, "info", "Fetching pull requests...")
-            prs = await GithubTask._get_pull_requests(client, owner, repo, headers, logger, max_prs)
-
-            _log(logger, "info", "Fetching contributors and community data...")
-            contributors_data = await GithubTask._get_contributors(client, owner, repo, headers, logger, max_contributors)
-
             _log(logger, "info", "Extracting dependencies...")
-            dependencies = await GithubTask._extract_dependencies(client, owner, repo, headers, logger)
-
-            _log(logger, "info", "Fetching issues...")
-            issues = await GithubTask._get_issues(client, owner, repo, headers, logger, max_issues)
-
-            _log(logger, "info", "Fetching releases...")
-            releases = await GithubTask._get_releases(client, owner, repo, headers, logger, max_releases)
+            dependencies = await GithubTask._extract_dependencies(
+                client, owner, repo, headers, logger,
+                prefetched={f["path"]: f["content"] for f in files}
+            )
 
             _log(logger, "info", "Calculating repository health metrics...")
             health_metrics = GithubTask._calculate_health_metrics(
@@ -894,6 +1547,22 @@ class GithubTask:
             _log(logger, "info", f"✅ Analysis complete: {len(files)} files, {len(prs)} PRs, {len(issues)} issues, {len(releases)} releases")
             _log(logger, "info", f"Repository health: {health_metrics['health_rating']} ({health_metrics['overall_health_score']})")
 
+            if code_structure.get("tree_sha"):
+                save_json_atomic(state_path, {
+                    "repository": f"{owner}/{repo}",
+                    "tree_sha": code_structure["tree_sha"],
+                    "analysed_at": started_at,
+                    "files_dir": str((output_dir / "files").resolve()),
+                    "blobs": {f["path"]: f.get("sha") for f in files},
+                    "pull_requests": prs,
+                    "issues": issues
+                })
+
+            rate_limit = GithubTask._rate_budget(headers).snapshot()
+            cache = _response_cache.get()
+            _log(logger, "info", f"GitHub API budget: {rate_limit['remaining']}/{rate_limit['limit']} remaining "
+                                 f"({rate_limit['throttled_seconds']}s throttled)")
+
             return {
                 "repository": f"{owner}/{repo}",
                 "url": url,
@@ -905,6 +1574,16 @@ class GithubTask:
                 "primary_language": code_structure.get("primary_language"),
                 "health_rating": health_metrics["health_rating"],
                 "health_score": health_metrics["overall_health_score"],
+                "rate_limit": rate_limit,
+                "incremental": {
+                    "enabled": incremental,
+                    "previous_tree_sha": previous.get("tree_sha") if previous else None,
+                    "tree_sha": code_structure.get("tree_sha"),
+                    "unchanged_files_reused": code_structure.get("file_source", {}).get("reused_unchanged", 0),
+                    "since": since
+                },
+                "graphql_rate_limit": GithubTask._rate_budget(headers, resource="graphql").snapshot() if use_graphql else None,
+                "api_cache": cache.get_stats() if cache else None,
                 "output_files": {
                     "summary": "repository_summary.json",
                     "code_structure": "code_structure.json",
@@ -15,12 +15,14 @@ import random
 import re
 import time
 import urllib.parse
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
-import httpx
 from playwright.async_api import Browser, BrowserContext, Page, TimeoutError
 
 from .base import _log
+from ..http_pool import get_http_pool
+from ..utils import HostRateLimiter, SNIFF_BYTES, stream_to_part_file
 
 
 def safe_name(s: str) -> str:
@@ -93,6 +95,29 @@ def classify_payload(head: bytes, content_type: str = None) -> str:
     return "binary_unknown"
 
 
+@dataclass
+class _RunLimits:
+    """Concurrency limits and per-host pacing shared by every dataset in one run."""
+    datasets: asyncio.Semaphore
+    metadata: asyncio.Semaphore
+    downloads: asyncio.Semaphore
+    hosts: HostRateLimiter
+    cookie_lock: asyncio.Lock
+
+    @classmethod
+    def from_params(cls, params: Dict[str, Any]) -> "_RunLimits":
+        def _bounded(key: str, default: int) -> int:
+            return min(16, max(1, int(params.get(key, default))))
+
+        return cls(
+            datasets=asyncio.Semaphore(_bounded("dataset_concurrency", 4)),
+            metadata=asyncio.Semaphore(_bounded("metadata_concurrency", 4)),
+            downloads=asyncio.Semaphore(_bounded("download_concurrency", 6)),
+            hosts=HostRateLimiter(min_interval=float(params.get("host_min_interval", 0.3)), jitter=0.3),
+            cookie_lock=asyncio.Lock(),
+        )
+
+
 class SaudiTask:
     BASE = "https://open.data.gov.sa"
 
@@ -137,21 +162,8 @@ class SaudiTask:
         return "file"
 
     @staticmethod
-    def _validate_and_save(
-        dst_dir: pathlib.Path,
-        suggested: str,
-        body: bytes,
-        content_type: str | None,
-        resource: Optional[dict] = None,
-    ) -> Tuple[bool, str, Dict[str, Any]]:
-        """Return (ok, filename, meta). Reject HTML interstitials."""
-        head = body[:2048]
-        kind = classify_payload(head, content_type)
-        if kind == "html_interstitial":
-            (dst_dir / "blocked.html").write_bytes(body)
-            return False, "", {"reason": "html_interstitial"}
-
-        # Ensure filename has a base + reasonable extension
+    def _choose_filename(suggested: str, kind: str, content_type: str | None, resource: Optional[dict]) -> str:
+        """Ensure filename has a base + reasonable extension."""
         name = safe_name(suggested)
         root, ext = os.path.splitext(name)
 
@@ -185,7 +197,24 @@ class SaudiTask:
                 }.get(kind, "")
             ext = chosen or ext
 
-        final_name = safe_name(root + ext)
+        return safe_name(root + ext)
+
+    @staticmethod
+    def _validate_and_save(
+        dst_dir: pathlib.Path,
+        suggested: str,
+        body: bytes,
+        content_type: str | None,
+        resource: Optional[dict] = None,
+    ) -> Tuple[bool, str, Dict[str, Any]]:
+        """Return (ok, filename, meta). Reject HTML interstitials."""
+        head = body[:SNIFF_BYTES]
+        kind = classify_payload(head, content_type)
+        if kind == "html_interstitial":
+            (dst_dir / "blocked.html").write_bytes(body)
+            return False, "", {"reason": "html_interstitial"}
+
+        final_name = SaudiTask._choose_filename(suggested, kind, content_type, resource)
 
         tmp = (dst_dir / final_name).with_suffix((dst_dir / final_name).suffix + ".part")
         with open(tmp, "wb") as f:
@@ -199,6 +228,39 @@ class SaudiTask:
         sha = hashlib.sha256(body).hexdigest()
         return True, final.name, {"size": final.stat().st_size, "sha256": sha, "kind": kind}
 
+    @staticmethod
+    def _finalize_part(
+        dst_dir: pathlib.Path,
+        suggested: str,
+        part_path: pathlib.Path,
+        stream_meta: Dict[str, Any],
+        resource: Optional[dict] = None,
+    ) -> Tuple[bool, str, Dict[str, Any]]:
+        """Streaming counterpart of _validate_and_save: classify from the first chunk, then rename."""
+        content_type = stream_meta.get("content_type")
+        kind = classify_payload(stream_meta.get("head", b""), content_type)
+        if kind == "html_interstitial":
+            os.replace(part_path, dst_dir / "blocked.html")
+            return False, "", {"reason": "html_interstitial"}
+
+        if stream_meta.get("size", 0) == 0:
+            part_path.unlink(missing_ok=True)
+            return False, "", {"reason": "empty"}
+
+        final = dst_dir / SaudiTask._choose_filename(suggested, kind, content_type, resource)
+        os.replace(part_path, final)
+        return True, final.name, {
+            "size": stream_meta["size"],
+            "sha256": stream_meta["sha256"],
+            "kind": kind,
+            "resumed": stream_meta.get("resumed", False),
+        }
+
+    @staticmethod
+    def _part_path(dst_dir: pathlib.Path, url: str) -> pathlib.Path:
+        """Stable partial-download path per URL so restarted jobs can resume it."""
+        return dst_dir / f".dl_{hashlib.sha1(url.encode()).hexdigest()[:16]}.part"
+
     # ───── playwright context helpers ─────
     @staticmethod
     async def _new_ctx(browser: Browser, head: dict, proxy: Optional[str]) -> BrowserContext:
@@ -263,14 +325,18 @@ class SaudiTask:
 
     # ───── metadata (resources and dataset info) ─────
     @staticmethod
-    async def _get_dataset_metadata(ctx: BrowserContext, dsid: str, head: dict, log: logging.Logger) -> dict:
+    async def _get_dataset_metadata(ctx: BrowserContext, dsid: str, head: dict, log: logging.Logger,
+                                    limits: Optional[_RunLimits] = None) -> dict:
         """Get dataset metadata using the official API."""
         url = f"https://open.data.gov.sa/data/api/datasets?version=-1&dataset={dsid}"
+        limits = limits or _RunLimits.from_params({})
         start_time = time.time()
         
         try:
             _log(log, "debug", f"🌐 {dsid}: requesting dataset metadata from API")
-            r = await ctx.request.get(url, headers={"accept": "application/json"}, timeout=45_000)
+            async with limits.metadata:
+                await limits.hosts.wait(url)
+                r = await ctx.request.get(url, headers={"accept": "application/json"}, timeout=45_000)
             api_time = time.time() - start_time
             
             if r.status != 200:
@@ -293,14 +359,18 @@ class SaudiTask:
             raise
 
     @staticmethod
-    async def _resources_via_api(ctx: BrowserContext, dsid: str, head: dict, log: logging.Logger) -> List[dict]:
+    async def _resources_via_api(ctx: BrowserContext, dsid: str, head: dict, log: logging.Logger,
+                                 limits: Optional[_RunLimits] = None) -> List[dict]:
         """Get dataset resources using the official API."""
         url = f"https://open.data.gov.sa/data/api/datasets/resources?version=-1&dataset={dsid}"
+        limits = limits or _RunLimits.from_params({})
         start_time = time.time()
         
         try:
             _log(log, "debug", f"🗂️  {dsid}: requesting resources metadata from API")
-            r = await ctx.request.get(url, headers={"accept": "application/json"}, timeout=45_000)
+            async with limits.metadata:
+                await limits.hosts.wait(url)
+                r = await ctx.request.get(url, headers={"accept": "application/json"}, timeout=45_000)
             api_time = time.time() - start_time
             
             if r.status != 200:
@@ -330,17 +400,20 @@ class SaudiTask:
     # ───── download strategies ─────
     @staticmethod
     async def _ctx_v1_download(ctx: BrowserContext, dsid: str, rid: str, resource: dict,
-                              out_dir: pathlib.Path, head: dict, log: logging.Logger) -> Dict[str, Any]:
+                              out_dir: pathlib.Path, head: dict, log: logging.Logger,
+                              hosts: Optional[HostRateLimiter] = None) -> Dict[str, Any]:
         """Download using browser context with v1 API."""
         url = f"https://open.data.gov.sa/data/api/v1/datasets/{dsid}/resources/{rid}/download"
         try:
-            r = await ctx.request.get(url, headers=SaudiOpenDataTask._dl_headers(head), timeout=90_000)
+            if hosts:
+                await hosts.wait(url)
+            r = await ctx.request.get(url, headers=SaudiTask._dl_headers(head), timeout=90_000)
             if r.status != 200:
                 return {"stage": "ctx(v1)", "status": "error", "reason": f"http_{r.status}"}
             
             body = await r.body()
-            suggested = SaudiOpenDataTask._derive_name(resource, url, r.headers, r.headers.get("content-type"))
-            ok, fname, meta = SaudiOpenDataTask._validate_and_save(out_dir, suggested, body, r.headers.get("content-type"), resource)
+            suggested = SaudiTask._derive_name(resource, url, r.headers, r.headers.get("content-type"))
+            ok, fname, meta = SaudiTask._validate_and_save(out_dir, suggested, body, r.headers.get("content-type"), resource)
             
             if not ok:
                 return {"stage": "ctx(v1)", "status": "error", **meta}
@@ -352,24 +425,53 @@ class SaudiTask:
             return {"stage": "ctx(v1)", "status": "error", "reason": str(e)}
 
     @staticmethod
-    async def _httpx_download(url: str, resource: dict, out_dir: pathlib.Path, head: dict) -> Dict[str, Any]:
-        """Download using httpx client."""
+    async def _stream_download(url: str, stage: str, resource: dict, out_dir: pathlib.Path, head: dict,
+                               hosts: Optional[HostRateLimiter] = None,
+                               cookie_header: Optional[str] = None) -> Dict[str, Any]:
+        """Stream a resource to disk (resumable .part file, incremental sha256)."""
         try:
-            async with httpx.AsyncClient(follow_redirects=True, timeout=90) as cl:
-                r = await cl.get(url, headers=SaudiOpenDataTask._dl_headers(head))
-                if r.status_code != 200:
-                    return {"stage": "httpx", "status": "error", "reason": f"http_{r.status_code}"}
-                
-                body = r.content
-                suggested = SaudiOpenDataTask._derive_name(resource, url, dict(r.headers), r.headers.get("content-type"))
-                ok, fname, meta = SaudiOpenDataTask._validate_and_save(out_dir, suggested, body, r.headers.get("content-type"), resource)
-                
-                if not ok:
-                    return {"stage": "httpx", "status": "error", **meta}
-                return {"stage": "httpx", "status": "ok", "file": fname, **meta}
-                
+            request_headers = SaudiTask._dl_headers(head)
+            if cookie_header:
+                request_headers["cookie"] = cookie_header
+            part = SaudiTask._part_path(out_dir, url)
+
+            async with get_http_pool().client(timeout=90) as cl:
+                if hosts:
+                    await hosts.wait(url)
+                ok, reason, meta = await stream_to_part_file(cl, url, part, headers=request_headers, timeout=90)
+
+            if not ok:
+                return {"stage": stage, "status": "error", "reason": reason,
+                        **({"partial_bytes": meta["partial_bytes"]} if meta.get("partial_bytes") else {})}
+
+            suggested = SaudiTask._derive_name(resource, url, meta["headers"], meta.get("content_type"))
+            ok, fname, fmeta = SaudiTask._finalize_part(out_dir, suggested, part, meta, resource)
+
+            if not ok:
+                return {"stage": stage, "status": "error", **fmeta}
+            return {"stage": stage, "status": "ok", "file": fname, **fmeta}
+
         except Exception as e:
-            return {"stage": "httpx", "status": "error", "reason": str(e)}
+            return {"stage": stage, "status": "error", "reason": str(e)}
+
+    @staticmethod
+    async def _ctx_v1_stream(ctx: BrowserContext, dsid: str, rid: str, resource: dict,
+                             out_dir: pathlib.Path, head: dict,
+                             hosts: Optional[HostRateLimiter] = None) -> Dict[str, Any]:
+        """Stream the v1 download endpoint with the browser context's cookies."""
+        url = f"https://open.data.gov.sa/data/api/v1/datasets/{dsid}/resources/{rid}/download"
+        try:
+            cookies = await ctx.cookies(url)
+        except Exception:
+            cookies = []
+        cookie_header = "; ".join(f"{c['name']}={c['value']}" for c in cookies) or None
+        return await SaudiTask._stream_download(url, "stream(v1)", resource, out_dir, head, hosts, cookie_header)
+
+    @staticmethod
+    async def _httpx_download(url: str, resource: dict, out_dir: pathlib.Path, head: dict,
+                              hosts: Optional[HostRateLimiter] = None) -> Dict[str, Any]:
+        """Download using httpx client (streamed to disk)."""
+        return await SaudiTask._stream_download(url, "httpx", resource, out_dir, head, hosts)
 
     @staticmethod
     def _dl_headers(base: dict) -> dict:
@@ -381,39 +483,50 @@ class SaudiTask:
 
     @staticmethod
     async def _download_resource(ctx: BrowserContext, dsid: str, resource: dict,
-                                out_dir: pathlib.Path, head: dict, log: logging.Logger) -> Dict[str, Any]:
+                                out_dir: pathlib.Path, head: dict, log: logging.Logger,
+                                limits: Optional[_RunLimits] = None) -> Dict[str, Any]:
         """Try multiple download strategies with anti-bot protection."""
         rid = resource.get("resourceID") or resource.get("id") or ""
         link = resource.get("downloadUrl") or resource.get("url") or ""
+        limits = limits or _RunLimits.from_params({})
         
         attempts = []
         
-        # Strategy 1: ctx(v1) via browser context
+        # Strategy 1: v1 endpoint streamed to disk with the context's cookies
         if rid:
-            r1 = await SaudiOpenDataTask._ctx_v1_download(ctx, dsid, rid, resource, out_dir, head, log)
+            r1 = await SaudiTask._ctx_v1_stream(ctx, dsid, rid, resource, out_dir, head, limits.hosts)
             if r1["status"] == "ok":
                 return r1
             attempts.append(r1)
 
         # Strategy 2: httpx direct download
         if link:
-            r2 = await SaudiOpenDataTask._httpx_download(link, resource, out_dir, head)
+            r2 = await SaudiTask._httpx_download(link, resource, out_dir, head, limits.hosts)
             if r2["status"] == "ok":
                 return r2
             attempts.append(r2)
 
-        # Strategy 3: Use interstitial cookies then retry ctx(v1)
+        # Strategy 3: Use interstitial cookies then retry the streamed v1 download
         if rid:
             try:
-                await SaudiOpenDataTask._ensure_interstitial_cookies(ctx, dsid, log)
+                # The context (and its cookie jar) is shared across datasets; warm it one at a time
+                async with limits.cookie_lock:
+                    await SaudiTask._ensure_interstitial_cookies(ctx, dsid, log)
                 await asyncio.sleep(random.uniform(0.5, 1.0))
-                r3 = await SaudiOpenDataTask._ctx_v1_download(ctx, dsid, rid, resource, out_dir, head, log)
+                r3 = await SaudiTask._ctx_v1_stream(ctx, dsid, rid, resource, out_dir, head, limits.hosts)
                 if r3["status"] == "ok":
                     return r3
                 attempts.append(r3)
             except Exception as e:
                 attempts.append({"stage": "ctx(v1+cookies)", "status": "error", "reason": str(e)})
 
+        # Strategy 4: ctx(v1) through the browser's own request stack (buffers the body in memory)
+        if rid:
+            r4 = await SaudiTask._ctx_v1_download(ctx, dsid, rid, resource, out_dir, head, log, limits.hosts)
+            if r4["status"] == "ok":
+                return r4
+            attempts.append(r4)
+
         # All strategies failed
         return {
             "status": "error",
@@ -424,18 +537,26 @@ class SaudiTask:
 
     # ───── one dataset ─────
     @staticmethod
-    async def _run_dataset(browser: Browser, dsid: str, head: dict, out_root: pathlib.Path, logger: logging.Logger) -> Dict[str, Any]:
-        import urllib.parse, json, random, asyncio, pathlib
+    async def _run_dataset(browser: Browser, dsid: str, head: dict, out_root: pathlib.Path, logger: logging.Logger,
+                           ctx: Optional[BrowserContext] = None, limits: Optional[_RunLimits] = None) -> Dict[str, Any]:
+        """Fetch metadata and download all resources of one dataset.
+
+        When ``ctx`` is given it is shared with other datasets (cookies included) and left open.
+        """
+        import urllib.parse, json, asyncio, pathlib
 
         out_dir = out_root / dsid
         (out_dir / "downloads").mkdir(parents=True, exist_ok=True)
+        limits = limits or _RunLimits.from_params({})
 
-        ctx = await SaudiOpenDataTask._new_ctx(browser, head, proxy=None)
+        own_ctx = ctx is None
+        if own_ctx:
+            ctx = await SaudiTask._new_ctx(browser, head, proxy=None)
         try:
             # Get dataset metadata first
             _log(logger, "debug", f"📊 {dsid}: fetching dataset metadata")
             try:
-                dataset_metadata = await SaudiOpenDataTask._get_dataset_metadata(ctx, dsid, head, logger)
+                dataset_metadata = await SaudiTask._get_dataset_metadata(ctx, dsid, head, logger, limits)
                 (out_dir / "dataset_metadata.json").write_text(json.dumps(dataset_metadata, indent=2, ensure_ascii=False), "utf-8")
                 _log(logger, "debug", f"💾 {dsid}: dataset metadata saved")
             except Exception as e:
@@ -446,7 +567,7 @@ class SaudiTask:
             # Get resources metadata
             _log(logger, "debug", f"📋 {dsid}: fetching resources metadata")
             try:
-                resources = await SaudiOpenDataTask._resources_via_api(ctx, dsid, head, logger)
+                resources = await SaudiTask._resources_via_api(ctx, dsid, head, logger, limits)
                 _log(logger, "info", f"📝 {dsid}: starting download of {len(resources)} resources")
             except Exception as e:
                 _log(logger, "error", f"❌ {dsid}: resources metadata failed – {e}")
@@ -470,33 +591,33 @@ class SaudiTask:
             (out_dir / "resources.json").write_text(json.dumps(resources, indent=2, ensure_ascii=False), "utf-8")
 
             # --- download phase with retries/cookie reuse handled inside _download_resource ---
-            results: List[Dict[str, Any]] = []
+            # Resources download concurrently, bounded by the run-wide download limit and host pacing
             download_start_time = time.time()
-            
-            for idx, r in enumerate(resources, 1):
+
+            async def _download_one(idx: int, r: dict) -> Dict[str, Any]:
                 resource_name = r.get("name") or r.get("titleEn") or r.get("titleAr") or f"Resource {idx}"
                 resource_format = r.get("format", "unknown")
-                
-                _log(logger, "debug", f"📥 {dsid}: downloading [{idx}/{len(resources)}] {resource_name} ({resource_format})")
-                
-                resource_start_time = time.time()
-                item = await SaudiOpenDataTask._download_resource(ctx, dsid, r, out_dir / "downloads", head, logger.getChild("dl"))
-                resource_time = time.time() - resource_start_time
-                
+
+                async with limits.downloads:
+                    _log(logger, "debug", f"📥 {dsid}: downloading [{idx}/{len(resources)}] {resource_name} ({resource_format})")
+                    resource_start_time = time.time()
+                    item = await SaudiTask._download_resource(ctx, dsid, r, out_dir / "downloads", head, logger.getChild("dl"), limits)
+                    resource_time = time.time() - resource_start_time
+
                 item["resource_name"] = resource_name
                 item["download_time_seconds"] = round(resource_time, 2)
-                results.append(item)
-                
+
                 # Log download result
                 if item.get("status") == "ok":
                     file_size = item.get("size", 0)
                     _log(logger, "info", f"✅ {dsid}: [{idx}/{len(resources)}] downloaded {resource_name} ({file_size} bytes) in {resource_time:.2f}s")
                 else:
                     _log(logger, "warning", f"❌ {dsid}: [{idx}/{len(resources)}] failed {resource_name} - {item.get('reason', 'unknown error')}")
-                
-                # Conservative delay between downloads
-                delay = random.uniform(0.5, 1.2)
-                await asyncio.sleep(delay)
+                return item
+
+            results: List[Dict[str, Any]] = list(await asyncio.gather(
+                *(_download_one(idx, r) for idx, r in enumerate(resources, 1))
+            ))
             
             download_total_time = time.time() - download_start_time
             downloaded_count = sum(1 for x in results if x.get("status") == "ok")
@@ -519,13 +640,17 @@ class SaudiTask:
             }
 
         finally:
-            await ctx.close()
+            if own_ctx:
+                await ctx.close()
 
     # ───── list datasets by publisher ─────
     @staticmethod
-    async def _get_organization_metadata(browser: Browser, pub_id: str, head: dict, logger: logging.Logger) -> dict:
+    async def _get_organization_metadata(browser: Browser, pub_id: str, head: dict, logger: logging.Logger,
+                                         ctx: Optional[BrowserContext] = None) -> dict:
         """Get organization metadata and datasets list using official API."""
-        ctx = await SaudiOpenDataTask._new_ctx(browser, head, proxy=None)
+        own_ctx = ctx is None
+        if own_ctx:
+            ctx = await SaudiTask._new_ctx(browser, head, proxy=None)
         try:
             url = f"https://open.data.gov.sa/data/api/organizations?version=-1&organization={pub_id}"
             r = await ctx.request.get(url, headers={"accept": "application/json"}, timeout=45_000)
@@ -550,20 +675,29 @@ class SaudiTask:
             _log(logger, "warning", f"org API error: {e}")
             return {"datasets": []}
         finally:
-            await ctx.close()
+            if own_ctx:
+                await ctx.close()
 
     @staticmethod
     async def _list_datasets_for_publisher(browser: Browser, pub_id: str, head: dict, logger: logging.Logger) -> List[dict]:
         """Get datasets list from organization metadata."""
-        org_data = await SaudiOpenDataTask._get_organization_metadata(browser, pub_id, head, logger)
+        org_data = await SaudiTask._get_organization_metadata(browser, pub_id, head, logger)
         return org_data.get("datasets", [])
 
     # ───── main entrypoint ─────
     @staticmethod
-    async def run(*, browser: Browser, params: Dict[str, Any], job_output_dir: str, logger: logging.Logger) -> Dict[str, Any]:
-        """Main task entrypoint."""
-        import time
-
+    async def run(*, browser: Browser, params: Dict[str, Any], job_output_dir: str, logger: logging.Logger,
+                  progress: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None) -> Dict[str, Any]:
+        """
+        Main task entrypoint.
+
+        Publisher runs process datasets concurrently over one shared browser context:
+        - dataset_concurrency: datasets in flight at once (default: 4)
+        - metadata_concurrency: concurrent metadata API calls (default: 4)
+        - download_concurrency: concurrent file downloads across all datasets (default: 6)
+        - host_min_interval: minimum seconds between requests to the same host (default: 0.3)
+        Progress and ETA are reported through ``progress`` (the job record) when provided.
+        """
         HEAD = {
             "user-agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -573,11 +707,12 @@ class SaudiTask:
 
         out_root = pathlib.Path(job_output_dir)
         out_root.mkdir(parents=True, exist_ok=True)
+        limits = _RunLimits.from_params(params)
 
         # Single dataset mode
         if dsid := params.get("dataset_id"):
             _log(logger, "info", f"{dsid}: single dataset flow")
-            res = await SaudiOpenDataTask._run_dataset(browser, dsid, HEAD, out_root, logger)
+            res = await SaudiTask._run_dataset(browser, dsid, HEAD, out_root, logger, limits=limits)
             return res
 
         # Publisher mode
@@ -588,13 +723,28 @@ class SaudiTask:
         # Create publisher folder structure: /job_output_dir/publisher_id/
         publisher_root = out_root / pub_id
         publisher_root.mkdir(parents=True, exist_ok=True)
-        
+
+        # One context for the whole run so WAF/interstitial cookies are earned once and reused
+        ctx = await SaudiTask._new_ctx(browser, HEAD, proxy=None)
+        try:
+            return await SaudiTask._run_publisher(
+                browser, ctx, pub_id, params, HEAD, publisher_root, logger, limits, progress
+            )
+        finally:
+            await ctx.close()
+
+    @staticmethod
+    async def _run_publisher(browser: Browser, ctx: BrowserContext, pub_id: str, params: Dict[str, Any],
+                             head: dict, publisher_root: pathlib.Path, logger: logging.Logger,
+                             limits: _RunLimits,
+                             progress: Optional[Callable[[Dict[str, Any]], Awaitable[None]]]) -> Dict[str, Any]:
+        """Process all datasets of a publisher with bounded concurrency."""
         # Get organization metadata and save it
         _log(logger, "info", f"📊 {pub_id}: fetching organization metadata")
         start_time = time.time()
         
         try:
-            org_metadata = await SaudiOpenDataTask._get_organization_metadata(browser, pub_id, HEAD, logger)
+            org_metadata = await SaudiTask._get_organization_metadata(browser, pub_id, head, logger, ctx=ctx)
             metadata_time = time.time() - start_time
             _log(logger, "info", f"✅ {pub_id}: organization metadata retrieved in {metadata_time:.2f}s")
             
@@ -622,75 +772,93 @@ class SaudiTask:
 
         _log(logger, "info", f"🚀 {pub_id}: starting processing of {len(all_items)} dataset(s)")
 
-        # Process each dataset with comprehensive logging and monitoring
-        per_dataset: List[Dict[str, Any]] = []
-        success_count = 0
-        error_count = 0
+        # Process datasets concurrently; results keep the publisher's dataset order
+        total = len(all_items)
+        per_dataset: List[Optional[Dict[str, Any]]] = [None] * total
+        counters = {"completed": 0, "succeeded": 0, "failed": 0, "in_flight": 0}
         total_start_time = time.time()
         
         # Track performance metrics for monitoring
-        processing_times = []
-        
-        for i, item in enumerate(all_items):
+        processing_times: List[float] = []
+
+        async def _report(phase: str) -> None:
+            elapsed = time.time() - total_start_time
+            done = counters["completed"]
+            # Throughput-based ETA accounts for datasets running in parallel
+            eta = (total - done) * (elapsed / done) if done else None
+            snapshot = {
+                "phase": phase,
+                "publisher_id": pub_id,
+                "total": total,
+                **counters,
+                "elapsed_seconds": round(elapsed, 1),
+                "avg_seconds_per_dataset": round(sum(processing_times) / len(processing_times), 2) if processing_times else None,
+                "eta_seconds": round(eta, 1) if eta is not None else None,
+                "percent": round(done / total * 100, 1) if total else 100.0,
+            }
+            if progress:
+                await progress(snapshot)
+            if phase == "running" and done and done % 5 == 0:
+                _log(logger, "info", f"📈 Progress: {done}/{total} | Success: {counters['succeeded']} | Errors: {counters['failed']} | In flight: {counters['in_flight']} | ETA: {(eta or 0)/60:.1f}m")
+
+        async def _process(i: int, item: dict) -> None:
             dsid = item.get("id") or item.get("dataset_id") or ""
             title = item.get("titleEn") or item.get("title") or item.get("name") or "Untitled"
             url = f"https://open.data.gov.sa/en/datasets/view/{dsid}/resources"
-            
-            dataset_start_time = time.time()
-            _log(logger, "info", f"📦 [{i+1}/{len(all_items)}] Starting: {dsid} – {title[:60]}{'...' if len(title) > 60 else ''}")
-            
-            try:
-                # Process dataset in publisher folder
-                res = await SaudiOpenDataTask._run_dataset(browser, dsid, HEAD, publisher_root, logger)
-                dataset_time = time.time() - dataset_start_time
-                processing_times.append(dataset_time)
-                
-                res.update({
-                    "dataset_id": dsid,
-                    "dataset_title": title,
-                    "dataset_url": url,
-                    "processing_time_seconds": round(dataset_time, 2),
-                })
-                per_dataset.append(res)
-                success_count += 1
-                
-                _log(logger, "info", f"✅ [{i+1}/{len(all_items)}] Completed: {dsid} in {dataset_time:.2f}s (downloaded: {res.get('downloaded', 0)} files)")
-                
-            except Exception as e:
-                dataset_time = time.time() - dataset_start_time
-                error_count += 1
-                
-                _log(logger, "error", f"❌ [{i+1}/{len(all_items)}] Failed: {dsid} after {dataset_time:.2f}s - {e}")
-                per_dataset.append({
-                    "dataset_id": dsid,
-                    "dataset_title": title,
-                    "dataset_url": url,
-                    "status": "error",
-                    "error": str(e),
-                    "processing_time_seconds": round(dataset_time, 2),
-                })
-                
-                # Safety check: if too many consecutive errors, something might be wrong
-                if error_count > 0 and error_count >= max(3, len(all_items) // 2):
-                    _log(logger, "warning", f"⚠️  High error rate detected ({error_count}/{i+1}). Continuing with increased caution.")
-
-            # Conservative delay to avoid any blocking
-            delay = random.uniform(0.8, 1.5)
-            _log(logger, "debug", f"😴 Waiting {delay:.1f}s before next dataset...")
-            await asyncio.sleep(delay)
-            
-            # Progress update every 5 datasets
-            if (i + 1) % 5 == 0:
-                elapsed = time.time() - total_start_time
-                avg_time = sum(processing_times[-5:]) / min(5, len(processing_times)) if processing_times else 0
-                remaining = len(all_items) - (i + 1)
-                eta = remaining * avg_time if avg_time > 0 else 0
-                _log(logger, "info", f"📈 Progress: {i+1}/{len(all_items)} | Success: {success_count} | Errors: {error_count} | Avg: {avg_time:.1f}s/dataset | ETA: {eta/60:.1f}m")
+
+            async with limits.datasets:
+                counters["in_flight"] += 1
+                dataset_start_time = time.time()
+                _log(logger, "info", f"📦 [{i+1}/{total}] Starting: {dsid} – {title[:60]}{'...' if len(title) > 60 else ''}")
+
+                try:
+                    # Process dataset in publisher folder
+                    res = await SaudiTask._run_dataset(browser, dsid, head, publisher_root, logger, ctx=ctx, limits=limits)
+                    dataset_time = time.time() - dataset_start_time
+                    processing_times.append(dataset_time)
+
+                    res.update({
+                        "dataset_id": dsid,
+                        "dataset_title": title,
+                        "dataset_url": url,
+                        "processing_time_seconds": round(dataset_time, 2),
+                    })
+                    per_dataset[i] = res
+                    counters["succeeded"] += 1
+
+                    _log(logger, "info", f"✅ [{i+1}/{total}] Completed: {dsid} in {dataset_time:.2f}s (downloaded: {res.get('downloaded', 0)} files)")
+
+                except Exception as e:
+                    dataset_time = time.time() - dataset_start_time
+                    counters["failed"] += 1
+
+                    _log(logger, "error", f"❌ [{i+1}/{total}] Failed: {dsid} after {dataset_time:.2f}s - {e}")
+                    per_dataset[i] = {
+                        "dataset_id": dsid,
+                        "dataset_title": title,
+                        "dataset_url": url,
+                        "status": "error",
+                        "error": str(e),
+                        "processing_time_seconds": round(dataset_time, 2),
+                    }
+
+                    # Safety check: if too many errors, something might be wrong
+                    if counters["failed"] >= max(3, total // 2):
+                        _log(logger, "warning", f"⚠️  High error rate detected ({counters['failed']}/{counters['completed'] + 1}). Continuing with increased caution.")
+                finally:
+                    counters["in_flight"] -= 1
+                    counters["completed"] += 1
+
+            await _report("running")
+
+        await _report("starting")
+        await asyncio.gather(*(_process(i, item) for i, item in enumerate(all_items)))
+        await _report("finished")
 
         # Final statistics
         total_time = time.time() - total_start_time
         avg_processing_time = sum(processing_times) / len(processing_times) if processing_times else 0
-        _log(logger, "info", f"🏁 Processing complete! Total: {total_time:.1f}s | Success: {success_count} | Errors: {error_count} | Avg: {avg_processing_time:.1f}s/dataset")
+        _log(logger, "info", f"🏁 Processing complete! Total: {total_time:.1f}s | Success: {counters['succeeded']} | Errors: {counters['failed']} | Avg: {avg_processing_time:.1f}s/dataset")
 
         # Save results in publisher folder
         (publisher_root / "publisher_results.json").write_text(json.dumps(per_dataset, indent=2, ensure_ascii=False), "utf-8")
@@ -698,13 +866,14 @@ class SaudiTask:
         result = {
             "publisher_id": pub_id,
             "status": "success",
-            "total_datasets": len(all_items),
+            "total_datasets": total,
             "datasets_succeeded": sum(1 for x in per_dataset if x.get("status") == "success"),
             "datasets_failed": sum(1 for x in per_dataset if x.get("status") != "success"),
             "total_files_ok": sum(x.get("downloaded", 0) for x in per_dataset if isinstance(x.get("downloaded"), int)),
             "total_files_failed": sum(x.get("failed", 0) for x in per_dataset if isinstance(x.get("failed"), int)),
+            "total_time_seconds": round(total_time, 1),
             "details_file": "publisher_results.json",
             "organization_metadata_file": "organization_metadata.json",
         }
 
-        return result
\ No newline at end of file
+        return result
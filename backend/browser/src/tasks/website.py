@@ -19,6 +19,8 @@ import httpx
 from bs4 import BeautifulSoup
 
 from .base import _log
+from ..assets import AssetStore, get_asset_store
+from ..http_pool import get_http_pool
 
 
 class WebsiteTask:
@@ -283,9 +285,10 @@ class WebsiteTask:
         current_url: str,
         images_dir: pathlib.Path,
         client: httpx.AsyncClient,
-        logger: logging.Logger
+        logger: logging.Logger,
+        asset_store: Optional[AssetStore] = None
     ) -> List[Dict[str, Any]]:
-        """Extract images and download them to images/ directory."""
+        """Extract images and download them to images/ directory (via the shared asset store if given)."""
         images_metadata = []
         img_tags = soup.find_all('img')
 
@@ -302,17 +305,26 @@ class WebsiteTask:
                 continue
 
             try:
-                # Download image
-                response = await client.get(img_url, timeout=10.0)
-                response.raise_for_status()
-
-                # Generate filename
                 img_ext = pathlib.Path(urllib.parse.urlparse(img_url).path).suffix or '.jpg'
-                img_filename = f"img_{idx}_{hashlib.md5(img_url.encode()).hexdigest()[:8]}{img_ext}"
-                img_path = images_dir / img_filename
 
-                # Save image
-                img_path.write_bytes(response.content)
+                if asset_store:
+                    # Content-addressed: identical images share one stored object and one filename
+                    asset = await asset_store.fetch(client, img_url, timeout=10.0)
+                    img_filename = f"img_{asset['sha256'][:16]}{img_ext}"
+                    asset_store.link_into(asset["sha256"], images_dir / img_filename)
+                    size_bytes = asset["size"]
+                else:
+                    # Download image
+                    response = await client.get(img_url, timeout=10.0)
+                    response.raise_for_status()
+
+                    # Generate filename
+                    img_filename = f"img_{idx}_{hashlib.md5(img_url.encode()).hexdigest()[:8]}{img_ext}"
+
+                    # Save image
+                    (images_dir / img_filename).write_bytes(response.content)
+                    size_bytes = len(response.content)
+                    asset = {}
 
                 # Extract metadata
                 img_meta = {
@@ -320,8 +332,11 @@ class WebsiteTask:
                     "original_url": img_url,
                     "alt": img.get('alt', '').strip(),
                     "title": img.get('title', '').strip(),
-                    "size_bytes": len(response.content)
+                    "size_bytes": size_bytes
                 }
+                if asset:
+                    img_meta["sha256"] = asset["sha256"]
+                    img_meta["cached"] = asset["cached"]
 
                 images_metadata.append(img_meta)
 
@@ -341,9 +356,10 @@ class WebsiteTask:
         current_url: str,
         resources_dir: pathlib.Path,
         client: httpx.AsyncClient,
-        logger: logging.Logger
+        logger: logging.Logger,
+        asset_store: Optional[AssetStore] = None
     ) -> List[Dict[str, Any]]:
-        """Download linked resources (PDFs, docs, etc.)."""
+        """Download linked resources (PDFs, docs, etc.), via the shared asset store if given."""
         resources_metadata = []
         links = soup.find_all('a', href=True)
 
@@ -360,10 +376,6 @@ class WebsiteTask:
                 continue
 
             try:
-                # Download resource
-                response = await client.get(resource_url, timeout=30.0)
-                response.raise_for_status()
-
                 # Generate filename
                 resource_filename = pathlib.Path(urllib.parse.urlparse(resource_url).path).name
                 if not resource_filename:
@@ -371,20 +383,39 @@ class WebsiteTask:
 
                 resource_path = resources_dir / resource_filename
 
-                # Save resource
-                resource_path.write_bytes(response.content)
+                if asset_store:
+                    asset = await asset_store.fetch(client, resource_url, timeout=30.0)
+                    asset_store.link_into(asset["sha256"], resource_path)
+                    content_type = asset.get("content_type", "application/octet-stream")
+                    size_bytes = asset["size"]
+                else:
+                    # Download resource
+                    response = await client.get(resource_url, timeout=30.0)
+                    response.raise_for_status()
+
+                    # Save resource
+                    resource_path.write_bytes(response.content)
+                    content_type = response.headers.get('content-type', 'application/octet-stream')
+                    size_bytes = len(response.content)
+                    asset = {}
 
                 # Extract metadata
                 resource_meta = {
                     "filename": resource_filename,
                     "original_url": resource_url,
-                    "type": response.headers.get('content-type', 'application/octet-stream'),
-                    "size_bytes": len(response.content),
+                    "type": content_type,
+                    "size_bytes": size_bytes,
                     "anchor_text": link.get_text(strip=True)
                 }
+                if asset:
+                    resource_meta["sha256"] = asset["sha256"]
+                    resource_meta["cached"] = asset["cached"]
 
                 resources_metadata.append(resource_meta)
-                _log(logger, "info", f"Downloaded resource: {resource_filename} ({len(response.content)} bytes)")
+                if asset.get("cached"):
+                    _log(logger, "info", f"Reused cached resource: {resource_filename} ({size_bytes} bytes)")
+                else:
+                    _log(logger, "info", f"Downloaded resource: {resource_filename} ({size_bytes} bytes)")
 
             except Exception as e:
                 _log(logger, "warning", f"Failed to download resource {resource_url}: {e}")
@@ -554,7 +585,9 @@ class WebsiteTask:
         use_browser: bool,
         headers: Dict[str, str],
         out_dir: pathlib.Path,
-        logger: logging.Logger
+        logger: logging.Logger,
+        asset_store: Optional[AssetStore] = None,
+        proxy: Optional[str] = None
     ) -> Dict[str, Any]:
         """Execute the main scraping logic with full RAG data collection."""
         # Basic domain extraction
@@ -583,10 +616,10 @@ class WebsiteTask:
         total_content_size = 0
         link_graph = {}  # URL -> {internal: [...], external: [...]}
 
-        # HTTP client for standard requests
+        # HTTP client for standard requests (borrowed from the shared connection pool)
         timeout = httpx.Timeout(20.0, connect=10.0)
 
-        async with httpx.AsyncClient(follow_redirects=True, timeout=timeout) as client:
+        async with get_http_pool().client(proxy=proxy, timeout=timeout) as client:
             while url_queue and (max_pages is None or len(successful_pages) < max_pages):
                 current_url = url_queue.pop(0)
 
@@ -633,12 +666,12 @@ class WebsiteTask:
 
                 # Download images
                 images_metadata = await WebsiteTask._extract_and_download_images(
-                    soup, current_url, images_dir, client, logger
+                    soup, current_url, images_dir, client, logger, asset_store
                 )
 
                 # Download resources
                 resources_metadata = await WebsiteTask._download_resources(
-                    soup, current_url, resources_dir, client, logger
+                    soup, current_url, resources_dir, client, logger, asset_store
                 )
 
                 # Save HTML with readable filename
@@ -699,6 +732,9 @@ class WebsiteTask:
                 # Rate limiting
                 await asyncio.sleep(random.uniform(1.0, 2.5))
 
+        if asset_store:
+            asset_store.flush()
+
         # Save link graph
         link_graph_file = out_dir / "link_graph.json"
         try:
@@ -719,7 +755,8 @@ class WebsiteTask:
             "average_quality_score": sum(p["quality_score"] for p in successful_pages) / len(successful_pages) if successful_pages else 0,
             "crawled_at": datetime.utcnow().isoformat() + "Z",
             "pages": successful_pages,
-            "failures": failed_pages[:50]  # Limit failure details
+            "failures": failed_pages[:50],  # Limit failure details
+            "asset_store": asset_store.get_stats() if asset_store else None
         }
 
         # Save summary files
@@ -758,6 +795,8 @@ class WebsiteTask:
         - max_pages: Maximum pages to scrape (optional, default: unlimited)
         - use_browser: Force browser rendering for all pages (optional, default: false)
         - user_agent: Custom user agent (optional)
+        - dedupe_assets: Store images/resources in the shared content-addressed
+          asset store and hardlink them into the job (optional, default: true)
 
         Output Structure:
         - raw_html/: Original HTML files
@@ -800,6 +839,9 @@ class WebsiteTask:
         _log(logger, "info", f"Starting RAG-optimized website scrape: {start_url}")
         _log(logger, "info", f"Max pages: {max_pages or 'unlimited'}, Browser mode: {use_browser}")
 
+        # Shared asset store (content-addressed, survives across pages and jobs)
+        asset_store = get_asset_store(job_output_dir, logger) if params.get("dedupe_assets", True) else None
+
         try:
             result = await WebsiteTask._scrape_website(
                 browser=browser,
@@ -808,7 +850,9 @@ class WebsiteTask:
                 use_browser=use_browser,
                 headers=headers,
                 out_dir=out_dir,
-                logger=logger
+                logger=logger,
+                asset_store=asset_store,
+                proxy=params.get("proxy")
             )
 
             _log(logger, "info", f"Scrape completed: {result['pages_scraped']} pages, {result['total_images']} images, {result['total_resources']} resources")
@@ -7,6 +7,7 @@ import pathlib
 import random
 import re
 import tempfile
+import time
 import urllib.parse
 from typing import Any, Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
@@ -124,6 +125,29 @@ def extract_domain(url: str) -> str:
         return ""
 
 
+# ───────── Per-host request pacing ─────────
+
+class HostRateLimiter:
+    """
+    Space out requests to the same host by at least ``min_interval`` seconds
+    (plus random jitter). Callers reserve the next free slot, so concurrent
+    coroutines queue up fairly without a lock.
+    """
+
+    def __init__(self, min_interval: float = 0.5, jitter: float = 0.3):
+        self.min_interval = min_interval
+        self.jitter = jitter
+        self._next_slot: Dict[str, float] = {}
+
+    async def wait(self, url: str) -> None:
+        host = extract_domain(url)
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(host, 0.0))
+        self._next_slot[host] = slot + self.min_interval + random.uniform(0, self.jitter)
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
 # ───────── HTTP utilities with retry logic ─────────
 
 async def fetch_with_retry(
@@ -173,6 +197,7 @@ async def save_content_atomic(
 ) -> Tuple[bool, Optional[str], Dict[str, Any]]:
     """
     Save content atomically using .part files.
+    For large downloads prefer stream_to_part_file, which never buffers the body.
     Returns: (success, error_reason, metadata)
     """
     try:
@@ -202,6 +227,113 @@ async def save_content_atomic(
         return False, str(e), {}
 
 
+SNIFF_BYTES = 2048
+
+
+async def stream_to_part_file(
+    client: httpx.AsyncClient,
+    url: str,
+    part_path: pathlib.Path,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 90.0,
+    max_retries: int = 3,
+    chunk_size: int = 64 * 1024,
+) -> Tuple[bool, Optional[str], Dict[str, Any]]:
+    """
+    Stream a response body into ``part_path`` chunk by chunk, never holding the
+    whole payload in memory. An existing partial file is resumed with an HTTP
+    Range request guarded by If-Range on the saved ETag/Last-Modified, both
+    across retries here and across job restarts; without a saved validator the
+    download restarts from zero. The sha256 is computed
+    incrementally and the first SNIFF_BYTES are kept for content sniffing.
+
+    The caller renames ``part_path`` once it has validated the payload; on
+    failure the partial file is left in place so the next attempt can resume.
+    Returns: (success, error_reason, metadata)
+    """
+    part_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path = part_path.with_suffix(part_path.suffix + ".json")
+    delay = 1.0
+    last_error = None
+
+    for attempt in range(max_retries + 1):
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        request_headers = dict(headers or {})
+        if offset:
+            try:
+                validator = json.loads(state_path.read_text(encoding="utf-8")).get("validator")
+            except Exception:
+                validator = None
+            if validator:
+                request_headers["range"] = f"bytes={offset}-"
+                request_headers["if-range"] = validator
+            else:
+                # Without a validator a changed file would be spliced onto the old bytes
+                part_path.unlink(missing_ok=True)
+                offset = 0
+
+        try:
+            async with client.stream("GET", url, headers=request_headers, timeout=timeout) as response:
+                if response.status_code == 416 and offset:
+                    # Partial file no longer matches the remote resource; start over
+                    part_path.unlink(missing_ok=True)
+                    last_error = "range_not_satisfiable"
+                    continue
+                if response.status_code not in (200, 206):
+                    return False, f"http_{response.status_code}", {
+                        "status_code": response.status_code,
+                        "headers": dict(response.headers),
+                    }
+
+                resumed = response.status_code == 206 and offset > 0
+                digest = hashlib.sha256()
+                head = b""
+                if resumed:
+                    # Hash the bytes already on disk so the digest covers the whole file
+                    with open(part_path, "rb") as f:
+                        head = f.read(SNIFF_BYTES)
+                        f.seek(0)
+                        for block in iter(lambda: f.read(1024 * 1024), b""):
+                            digest.update(block)
+
+                validator = response.headers.get("etag") or response.headers.get("last-modified")
+                if validator:
+                    save_json_atomic(state_path, {"url": url, "validator": validator})
+
+                with open(part_path, "ab" if resumed else "wb") as f:
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        if len(head) < SNIFF_BYTES:
+                            head += chunk[:SNIFF_BYTES - len(head)]
+                        digest.update(chunk)
+                        f.write(chunk)
+
+                state_path.unlink(missing_ok=True)
+                return True, None, {
+                    "size": part_path.stat().st_size,
+                    "sha256": digest.hexdigest(),
+                    "head": head,
+                    "content_type": response.headers.get("content-type"),
+                    "headers": dict(response.headers),
+                    "status_code": response.status_code,
+                    "resumed": resumed,
+                    "resumed_from": offset if resumed else 0,
+                }
+
+        except (httpx.TimeoutException, httpx.ConnectTimeout, httpx.ReadTimeout):
+            last_error = "timeout"
+        except httpx.RequestError as e:
+            last_error = f"request_error_{e.__class__.__name__}"
+        except Exception as e:
+            return False, f"exception_{type(e).__name__}", {}
+
+        if attempt < max_retries:
+            await asyncio.sleep(delay + random.uniform(0, 0.3))
+            delay *= 1.5
+
+    partial = part_path.stat().st_size if part_path.exists() else 0
+    return False, last_error, {"partial_bytes": partial}
+
+
 # ───────── Link extraction utilities ─────────
 
 def extract_links_from_html(html: str, base_url: str) -> List[str]:
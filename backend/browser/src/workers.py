@@ -22,12 +22,13 @@ import contextlib
 from playwright.async_api import Browser, BrowserContext, Page
 
 from .jobs import JobStore, JobRecord, JobStatus, JobManager
+from .utils import extract_domain
 from .reliability import (
     ErrorHandler, ErrorContext, EnhancedError,
     NetworkError, BrowserError, TimeoutError,
     ErrorSeverity, RecoveryStrategy, ErrorCategory,
     ResourceMonitor, AdaptiveWorkerPool, ConcurrencyThrottler,
-    ResourceOptimizer, ResourceState, ScalingAction,
+    ResourceOptimizer, ResourceState, ScalingAction, QueueScalingController,
     CircuitBreakerManager, CircuitBreakerConfig, CircuitBreakerError,
     FallbackManager, FallbackConfig, FallbackStrategy, ServiceLevel
 )
@@ -36,6 +37,20 @@ from .reliability import (
 TaskFunc = Callable[..., Awaitable[Dict[str, Any]]]
 
 
+def circuit_breaker_name_for(task_name: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Map a job to its circuit breaker. Twitter shares one breaker; other tasks get
+    a breaker per target domain (from the ``url`` param) or, for tasks that
+    always hit one site (booking, airbnb, ...), per task name, so one failing
+    upstream does not trip the breaker for healthy ones.
+    """
+    if task_name.startswith("twitter"):
+        return "twitter_navigation"
+    url = (params or {}).get("url")
+    scope = extract_domain(url) if isinstance(url, str) and url else ""
+    return CircuitBreakerManager.scoped_name("browser_navigation", scope or task_name)
+
+
 class WorkerError(Exception):
     """Base exception for worker-related errors."""
     pass
@@ -129,6 +144,9 @@ class BrowserContextManager:
 class Worker:
     """Enhanced worker with proper resource management and error handling."""
 
+    # How long a dequeued job may wait for a throttling slot before it is requeued
+    SLOT_WAIT_SECONDS = 5.0
+
     def __init__(
         self,
         worker_id: str,
@@ -141,7 +159,10 @@ class Worker:
         heartbeat_interval: int = 30,
         circuit_breaker_manager: Optional[CircuitBreakerManager] = None,
         fallback_manager: Optional[FallbackManager] = None,
-        stealth_manager=None
+        stealth_manager=None,
+        throttler: Optional[ConcurrencyThrottler] = None,
+        scaling_controller: Optional[QueueScalingController] = None,
+        lanes: Optional[List[str]] = None
     ):
         self.worker_id = worker_id
         self.job_store = job_store
@@ -163,20 +184,40 @@ class Worker:
         # Phase 2.6: Fallback manager support
         self.fallback_manager = fallback_manager
 
+        # Per-service/per-domain concurrency and rate limits
+        self.throttler = throttler
+
+        # Queue wait / duration observations for the autoscaler
+        self.scaling_controller = scaling_controller
+
+        # Queue lanes this worker takes jobs from (None = all lanes, weighted)
+        self.lanes = lanes
+
         self._heartbeat_task: Optional[asyncio.Task] = None
         self._current_job: Optional[JobRecord] = None
+        self._held_slot: Optional[str] = None
         self._shutdown_event = asyncio.Event()
         self._consecutive_failures = 0
 
         # Phase 4.2a: Initialize _last_success to fix health monitor attribute error
         self._last_success = datetime.datetime.utcnow()
 
-    def _get_circuit_breaker_name(self, task_name: str) -> str:
+    def _get_circuit_breaker_name(self, task_name: str, params: Optional[Dict[str, Any]] = None) -> str:
         """Map task names to appropriate circuit breakers."""
-        if task_name.startswith("twitter"):
-            return "twitter_navigation"
-        else:
-            return "browser_navigation"
+        return circuit_breaker_name_for(task_name, params)
+
+    def _throttle_service(self, job: JobRecord) -> Optional[str]:
+        """Throttler service for the job's target (same scoping as its circuit breaker)."""
+        if not self.throttler:
+            return None
+        circuit_breaker_name = self._get_circuit_breaker_name(job.task_name, job.params)
+        return "twitter" if circuit_breaker_name == "twitter_navigation" else circuit_breaker_name
+
+    def _release_slot(self) -> None:
+        """Release the throttling slot taken for the current job, if still held."""
+        if self._held_slot:
+            self.throttler.release_slot(self._held_slot)
+            self._held_slot = None
 
     async def start(self) -> None:
         """Start the worker."""
@@ -208,12 +249,27 @@ class Worker:
         await self.context_manager.cleanup_all_contexts()
         self.logger.info(f"Worker {self.worker_id} stopped")
 
+    async def drain(self) -> None:
+        """Stop taking jobs, let the current one finish, then stop."""
+        self._shutdown_event.set()
+        if self._task:
+            await asyncio.gather(self._task, return_exceptions=True)
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            await asyncio.gather(self._heartbeat_task, return_exceptions=True)
+        await self.context_manager.cleanup_all_contexts()
+        self.logger.info(f"Worker {self.worker_id} drained and stopped")
+
+    @property
+    def is_busy(self) -> bool:
+        return self._current_job is not None
+
     async def _run_loop(self) -> None:
         """Main worker loop."""
         while not self._shutdown_event.is_set():
             try:
                 # Get next job
-                job_id = await self.job_store.get_next_job()
+                job_id = await self.job_store.get_next_job(self.lanes)
                 if not job_id:
                     await asyncio.sleep(1)  # No jobs available
                     continue
@@ -224,23 +280,51 @@ class Worker:
                     self.logger.warning(f"Job {job_id} not found in store")
                     continue
 
-                # Mark job as running
-                await self.job_store.mark_job_running(job_id, self.worker_id)
-                self._current_job = job
+                # Take a throttling slot for the job's target before claiming the job.
+                # A saturated target sends the job back to the queue instead of parking
+                # this worker (and eating into the job's timeout) while jobs for other
+                # targets wait behind it
+                service = self._throttle_service(job)
+                if service and not await self.throttler.acquire_slot(service, timeout=self.SLOT_WAIT_SECONDS):
+                    self.logger.debug(f"No throttling slot for '{service}' - requeueing job {job_id}")
+                    await self.job_store.requeue_job(job_id)
+                    continue
+                self._held_slot = service
 
-                # Process the job with timeout
                 try:
-                    await asyncio.wait_for(
-                        self._process_job(job),
-                        timeout=job.timeout_seconds
-                    )
-                except asyncio.TimeoutError:
-                    await self.job_store.mark_job_failed(
-                        job_id,
-                        f"Job timed out after {job.timeout_seconds} seconds",
-                        should_retry=True
-                    )
-                    self.logger.error(f"Job {job_id} timed out")
+                    # Mark job as running
+                    await self.job_store.mark_job_running(job_id, self.worker_id)
+                    self._current_job = job
+
+                    if self.scaling_controller:
+                        # Retries keep the original created_at, so only first attempts measure queue wait
+                        wait_seconds = (
+                            (datetime.datetime.utcnow() - job.created_at).total_seconds()
+                            if job.retry_count == 0 else None
+                        )
+                        self.scaling_controller.record_start(job.task_name, wait_seconds)
+                    job_started = asyncio.get_running_loop().time()
+
+                    # Process the job with timeout
+                    try:
+                        await asyncio.wait_for(
+                            self._process_job(job),
+                            timeout=job.timeout_seconds
+                        )
+                    except asyncio.TimeoutError:
+                        await self.job_store.mark_job_failed(
+                            job_id,
+                            f"Job timed out after {job.timeout_seconds} seconds",
+                            should_retry=True
+                        )
+                        self.logger.error(f"Job {job_id} timed out")
+                    finally:
+                        if self.scaling_controller:
+                            self.scaling_controller.record_finish(
+                                job.task_name, asyncio.get_running_loop().time() - job_started
+                            )
+                finally:
+                    self._release_slot()
 
             except asyncio.CancelledError:
                 break
@@ -284,7 +368,7 @@ class Worker:
             job_logger.info(f"✅ WORKER: Task function found: {task_fn.__name__ if hasattr(task_fn, '__name__') else 'unknown'}")
 
             # Phase 2.5: Execute task through circuit breaker (including browser context creation)
-            circuit_breaker_name = self._get_circuit_breaker_name(job.task_name)
+            circuit_breaker_name = self._get_circuit_breaker_name(job.task_name, job.params)
             job_logger.info(f"⏳ WORKER: Setting up circuit breaker: {circuit_breaker_name}")
 
             async def execute_task():
@@ -302,6 +386,16 @@ class Worker:
                     job_logger.info("⏳ WORKER: Invoking task function...")
                     import inspect
                     sig = inspect.signature(task_fn)
+                    extra_kwargs: Dict[str, Any] = {}
+                    if 'progress' in sig.parameters:
+                        # Let long-running tasks publish progress/ETA on the job record
+                        async def report_progress(progress: Dict[str, Any]) -> None:
+                            try:
+                                await self.job_store.update_progress(job_id, progress)
+                            except Exception as e:
+                                self.logger.debug(f"Could not record progress for job {job_id}: {e}")
+                        extra_kwargs["progress"] = report_progress
+
                     if 'context' in sig.parameters:
                         # New context-aware task function
                         job_logger.info("⏳ WORKER: Calling task with context parameter...")
@@ -311,6 +405,7 @@ class Worker:
                             params=job.params,
                             job_output_dir=job_output_dir,
                             logger=job_logger,
+                            **extra_kwargs,
                         )
                         job_logger.info("✅ WORKER: Task function completed")
                         return result
@@ -322,6 +417,7 @@ class Worker:
                             params=job.params,
                             job_output_dir=job_output_dir,
                             logger=job_logger,
+                            **extra_kwargs,
                         )
                         job_logger.info("✅ WORKER: Task function completed")
                         return result
@@ -333,58 +429,76 @@ class Worker:
                 # Fallback manager has bugs with sequential jobs and aggressive caching
                 use_fallback = self.fallback_manager and circuit_breaker_name != "twitter_navigation"
 
+                fresh = None
                 if use_fallback:
-                    job_logger.info("⏳ WORKER: Using fallback manager...")
-                    # Prepare fallback data
-                    fallback_data = {
-                        "task_name": job.task_name,
-                        "params": job.params,
-                        "worker_id": self.worker_id,
-                        "job_id": job_id
-                    }
-
-                    # Execute with fallback mechanisms
-                    fallback_execution = await self.fallback_manager.execute_with_fallback(
-                        service_name=circuit_breaker_name,
-                        primary_func=execute_task,
-                        fallback_data=fallback_data
+                    # Identical job (same task + normalised params) finished recently - reuse its result
+                    fresh = await self.fallback_manager.get_fresh_result(
+                        circuit_breaker_name, job.task_name, job.params
                     )
 
-                    if not fallback_execution.success:
-                        # Fallback also failed - raise error
-                        raise EnhancedError(
-                            f"Task execution failed: {fallback_execution.error}",
-                            category=ErrorCategory.EXTERNAL_SERVICE,
-                            severity=ErrorSeverity.HIGH,
-                            recovery_strategy=RecoveryStrategy.EXPONENTIAL_BACKOFF
+                # The run loop took the target's throttling slot before claiming the job;
+                # give it back as soon as the work is done rather than after error handling
+                try:
+                    if fresh:
+                        result, cache_age = fresh
+                        job_logger.info(f"✅ WORKER: Served from result cache (age {cache_age:.0f}s)")
+
+                    elif use_fallback:
+                        job_logger.info("⏳ WORKER: Using fallback manager...")
+                        # Prepare fallback data
+                        fallback_data = {
+                            "task_name": job.task_name,
+                            "params": job.params,
+                            "worker_id": self.worker_id,
+                            "job_id": job_id
+                        }
+
+                        # Execute with fallback mechanisms
+                        fallback_execution = await self.fallback_manager.execute_with_fallback(
+                            service_name=circuit_breaker_name,
+                            primary_func=execute_task,
+                            fallback_data=fallback_data
                         )
 
-                    # Use fallback result
-                    result = fallback_execution.data
-
-                    # Log degradation information
-                    if fallback_execution.is_degraded:
-                        self.logger.warning(
-                            f"Job {job_id} completed with degraded service "
-                            f"(strategy: {fallback_execution.strategy_used}, "
-                            f"response_time: {fallback_execution.response_time_ms:.1f}ms)"
-                        )
+                        if not fallback_execution.success:
+                            # Fallback also failed - raise error
+                            raise EnhancedError(
+                                f"Task execution failed: {fallback_execution.error}",
+                                category=ErrorCategory.EXTERNAL_SERVICE,
+                                severity=ErrorSeverity.HIGH,
+                                recovery_strategy=RecoveryStrategy.EXPONENTIAL_BACKOFF
+                            )
 
-                    # Update cache if successful
-                    if fallback_execution.success and result:
-                        self.fallback_manager.update_cache(circuit_breaker_name, result)
+                        # Use fallback result
+                        result = fallback_execution.data
 
-                elif self.circuit_breaker_manager:
-                    # Only circuit breaker available
-                    job_logger.info("⏳ WORKER: Using circuit breaker...")
-                    result = await self.circuit_breaker_manager.call_with_breaker(
-                        circuit_breaker_name,
-                        execute_task
-                    )
-                else:
-                    # Direct execution fallback
-                    job_logger.info("⏳ WORKER: Direct execution (no circuit breaker)...")
-                    result = await execute_task()
+                        # Log degradation information
+                        if fallback_execution.is_degraded:
+                            self.logger.warning(
+                                f"Job {job_id} completed with degraded service "
+                                f"(strategy: {fallback_execution.strategy_used}, "
+                                f"response_time: {fallback_execution.response_time_ms:.1f}ms)"
+                            )
+
+                        # Cache genuine results under this job's task + params
+                        if result and not fallback_execution.is_degraded:
+                            await self.fallback_manager.store_result(
+                                circuit_breaker_name, job.task_name, job.params, result
+                            )
+
+                    elif self.circuit_breaker_manager:
+                        # Only circuit breaker available
+                        job_logger.info("⏳ WORKER: Using circuit breaker...")
+                        result = await self.circuit_breaker_manager.call_with_breaker(
+                            circuit_breaker_name,
+                            execute_task
+                        )
+                    else:
+                        # Direct execution fallback
+                        job_logger.info("⏳ WORKER: Direct execution (no circuit breaker)...")
+                        result = await execute_task()
+                finally:
+                    self._release_slot()
 
             except CircuitBreakerError as e:
                 # Circuit breaker is open - try fallback if available
@@ -561,6 +675,7 @@ class Worker:
         """Get enhanced worker status information."""
         return {
             "worker_id": self.worker_id,
+            "lanes": self.lanes or ["*"],
             "current_job": self._current_job.job_id if self._current_job else None,
             "current_task": self._current_job.task_name if self._current_job else None,
             "active_contexts": self.context_manager.get_active_context_count(),
@@ -584,7 +699,11 @@ class WorkerPool:
         data_root: str,
         logger: logging.Logger,
         max_workers: int = 2,
-        browser_runtime = None  # Optional reference to BrowserRuntime for restart capability
+        browser_runtime = None,  # Optional reference to BrowserRuntime for restart capability
+        min_workers: Optional[int] = None,
+        target_queue_wait_seconds: float = 60.0,
+        worker_memory_mb: float = 400.0,
+        lane_reservations: Optional[Dict[str, int]] = None
     ):
         self.job_store = job_store
         self.browser = browser
@@ -593,16 +712,41 @@ class WorkerPool:
         self.data_root = data_root
         self.logger = logger
         self.max_workers = max_workers
+        # Without a minimum the pool stays at max_workers (no autoscaling headroom)
+        self.min_workers = max(1, min(min_workers or max_workers, max_workers))
+
+        # Workers dedicated to one lane; at least one shared worker always remains
+        self.lane_reservations = {
+            lane: count for lane, count in (lane_reservations or {}).items()
+            if count > 0 and lane in job_store.lanes
+        }
+        for lane in set(lane_reservations or {}) - set(job_store.lanes):
+            logger.warning(f"Ignoring worker reservation for unknown lane '{lane}'")
+        reserved = sum(self.lane_reservations.values())
+        if reserved >= max_workers:
+            logger.warning(f"Lane reservations ({reserved}) leave no shared worker with max_workers={max_workers}")
+        self.min_workers = min(max(self.min_workers, reserved + 1), max_workers)
 
         self._workers: Dict[str, Worker] = {}
+        self._draining: Dict[str, asyncio.Task] = {}
+        self._next_worker_index = 0
+        self._autoscale_task: Optional[asyncio.Task] = None
+        self.autoscale_interval_seconds = 10
         self._health_monitor_task: Optional[asyncio.Task] = None
         self._shutdown_event = asyncio.Event()
 
         # Phase 2.3: Resource management components
         self.resource_monitor = ResourceMonitor(logger)
         self.adaptive_pool = AdaptiveWorkerPool(self.resource_monitor, logger)
-        self.throttler = ConcurrencyThrottler(logger)
+        self.throttler = ConcurrencyThrottler(logger, redis_url=os.getenv("THROTTLE_REDIS_URL") or None)
         self.resource_optimizer: Optional[ResourceOptimizer] = None
+        self.scaling_controller = QueueScalingController(
+            logger,
+            min_workers=self.min_workers,
+            max_workers=self.max_workers,
+            target_wait_seconds=target_queue_wait_seconds,
+            worker_memory_mb=worker_memory_mb
+        )
 
         # Phase 2.5: Circuit breaker management
         self.circuit_breaker_manager = CircuitBreakerManager(logger)
@@ -633,14 +777,21 @@ class WorkerPool:
             )
         )
 
-        # General browser navigation circuit breaker
-        self.circuit_breaker_manager.get_or_create_breaker(
+        # Browser navigation breakers, created per target domain/task on first use
+        # ("browser_navigation:<domain or task>"), tripping on the failure rate.
+        # No slow-call threshold: the breaker times the whole job (context setup,
+        # navigation and extraction), whose duration says nothing about the target's health
+        self.circuit_breaker_manager.register_template(
             "browser_navigation",
             CircuitBreakerConfig(
                 failure_threshold=5,      # More tolerant for general navigation
                 recovery_timeout=60.0,
                 success_threshold=3,
-                timeout=30.0
+                timeout=30.0,
+                half_open_max_calls=1,
+                window_size=20,           # Judge the last 20 calls...
+                minimum_calls=5,          # ...once at least 5 have completed
+                failure_rate_threshold=50.0
             )
         )
 
@@ -660,11 +811,10 @@ class WorkerPool:
     def _setup_fallback_strategies(self) -> None:
         """Configure fallback strategies for services."""
         # Twitter fallback strategy - fail fast without caching
-        # Caching causes all jobs to return same result since cache key is service_name only
         twitter_fallback = FallbackConfig(
             strategy=FallbackStrategy.FAIL_FAST,
             timeout_seconds=5.0,
-            cache_ttl_seconds=0,  # No caching to avoid wrong results
+            cache_ttl_seconds=0,  # Timelines go stale too quickly to cache
             mock_response_template={
                 "status": "failed",
                 "message": "Twitter service temporarily unavailable",
@@ -690,6 +840,20 @@ class WorkerPool:
         )
         self.fallback_manager.register_fallback("browser_navigation", browser_fallback)
 
+        # Hotel/stay searches - identical searches within 10 minutes are served from
+        # the result cache; while the site is failing, results up to 6 hours old are
+        # returned as a degraded response
+        for site in ("booking", "airbnb"):
+            self.fallback_manager.register_fallback(
+                f"browser_navigation:{site}",
+                FallbackConfig(
+                    strategy=FallbackStrategy.CACHED_RESPONSE,
+                    timeout_seconds=10.0,
+                    cache_ttl_seconds=6 * 3600,
+                    serve_cached_seconds=600
+                )
+            )
+
         # External API fallback - fail fast
         api_fallback = FallbackConfig(
             strategy=FallbackStrategy.FAIL_FAST,
@@ -699,20 +863,19 @@ class WorkerPool:
 
         self.logger.info("🔄 Fallback strategies configured for services")
 
-    def _get_circuit_breaker_name(self, task_name: str) -> str:
+    def _get_circuit_breaker_name(self, task_name: str, params: Optional[Dict[str, Any]] = None) -> str:
         """Map task names to appropriate circuit breakers."""
-        if task_name.startswith("twitter"):
-            return "twitter_navigation"
-        else:
-            return "browser_navigation"
+        return circuit_breaker_name_for(task_name, params)
 
     async def start(self) -> None:
         """Start the enhanced worker pool with resource optimization."""
-        self.logger.info(f"Starting enhanced worker pool with {self.max_workers} workers")
+        self.logger.info(
+            f"Starting enhanced worker pool with {self.min_workers} workers (autoscaling up to {self.max_workers})"
+        )
 
-        # Start initial workers
-        for i in range(self.max_workers):
-            await self._start_worker(f"worker-{i}")
+        # Start initial workers; the autoscaler adds more as the queue requires
+        for _ in range(self.min_workers):
+            await self._start_worker(self._new_worker_id())
 
         # Start resource optimizer
         self.resource_optimizer = ResourceOptimizer(
@@ -726,8 +889,12 @@ class WorkerPool:
         # Start fallback manager monitoring
         await self.fallback_manager.start_monitoring()
 
-        # Start enhanced health monitor
+        # Share throttling rate limits across pods when configured
+        await self.throttler.connect()
+
+        # Start enhanced health monitor and queue-driven autoscaler
         self._health_monitor_task = asyncio.create_task(self._enhanced_health_monitor_loop())
+        self._autoscale_task = asyncio.create_task(self._autoscale_loop())
 
         self.logger.info(f"✅ Enhanced worker pool started with {len(self._workers)} workers")
         self.logger.info("🚀 Resource optimization and dynamic scaling enabled")
@@ -744,20 +911,43 @@ class WorkerPool:
 
         # Stop fallback manager monitoring
         await self.fallback_manager.stop_monitoring()
+        await self.throttler.disconnect()
 
-        # Stop health monitor
+        # Stop health monitor and autoscaler
         if self._health_monitor_task:
             self._health_monitor_task.cancel()
+        if self._autoscale_task:
+            self._autoscale_task.cancel()
 
-        # Stop all workers
+        # Stop all workers (including ones still draining after a scale-down)
+        for task in self._draining.values():
+            task.cancel()
         stop_tasks = [worker.stop() for worker in self._workers.values()]
-        await asyncio.gather(*stop_tasks, return_exceptions=True)
+        await asyncio.gather(*stop_tasks, *self._draining.values(), return_exceptions=True)
+        self._draining.clear()
 
         self._workers.clear()
         self.logger.info("Enhanced worker pool stopped")
 
+    def _new_worker_id(self) -> str:
+        worker_id = f"worker-{self._next_worker_index}"
+        self._next_worker_index += 1
+        return worker_id
+
+    def _unfilled_lane(self, replacing: Optional[str] = None) -> Optional[str]:
+        """A lane whose worker reservation isn't met yet (ignoring a worker being replaced)."""
+        for lane, count in self.lane_reservations.items():
+            assigned = sum(
+                1 for worker_id, worker in self._workers.items()
+                if worker_id != replacing and worker.lanes == [lane]
+            )
+            if assigned < count:
+                return lane
+        return None
+
     async def _start_worker(self, worker_id: str) -> None:
-        """Start a single worker."""
+        """Start a single worker, dedicating it to a lane while reservations are unfilled."""
+        lane = self._unfilled_lane(replacing=worker_id)
         worker = Worker(
             worker_id=worker_id,
             job_store=self.job_store,
@@ -767,12 +957,15 @@ class WorkerPool:
             logger=self.logger,
             circuit_breaker_manager=self.circuit_breaker_manager,
             fallback_manager=self.fallback_manager,
-            stealth_manager=self.stealth_manager
+            stealth_manager=self.stealth_manager,
+            throttler=self.throttler,
+            scaling_controller=self.scaling_controller,
+            lanes=[lane] if lane else None
         )
 
         await worker.start()
         self._workers[worker_id] = worker
-        self.logger.info(f"Started worker {worker_id}")
+        self.logger.info(f"Started worker {worker_id}" + (f" (reserved for lane '{lane}')" if lane else ""))
 
     async def _restart_worker(self, worker_id: str) -> None:
         """Restart a failed worker."""
@@ -807,7 +1000,8 @@ class WorkerPool:
                     for worker in self._workers.values()
                 )
 
-                current_metrics = self.resource_monitor.get_current_metrics(
+                # Records a sample in the monitor's history (used for its trends)
+                self.resource_monitor.get_current_metrics(
                     active_workers=active_workers,
                     active_contexts=total_contexts,
                     queue_size=queue_stats.get('total_queued', 0)
@@ -822,16 +1016,6 @@ class WorkerPool:
                         'consecutive_failures': worker_status.get('consecutive_failures', 0)
                     })
 
-                # Check scaling decisions
-                scaling_action = self.adaptive_pool.should_scale(current_metrics)
-
-                if scaling_action == ScalingAction.SCALE_UP:
-                    await self._scale_up()
-                elif scaling_action == ScalingAction.SCALE_DOWN:
-                    await self._scale_down()
-                elif scaling_action == ScalingAction.THROTTLE:
-                    await self._apply_throttling()
-
                 # Traditional health checks
                 await self._check_worker_health()
 
@@ -850,6 +1034,7 @@ class WorkerPool:
             if self.browser_runtime:
                 try:
                     # Stop all workers first
+                    restart_count = len(self._workers)
                     self.logger.info("Stopping all workers for browser restart...")
                     for worker in list(self._workers.values()):
                         try:
@@ -866,8 +1051,8 @@ class WorkerPool:
 
                     # Restart workers with new browser
                     self.logger.info("🔄 Restarting workers with new browser...")
-                    for i in range(self.max_workers):
-                        await self._start_worker(f"worker-{i}")
+                    for _ in range(max(self.min_workers, restart_count)):
+                        await self._start_worker(self._new_worker_id())
 
                     self.logger.info("✅ Browser and workers restarted successfully!")
                     return
@@ -887,7 +1072,7 @@ class WorkerPool:
                 return
 
         # Check if we have the minimum number of workers
-        if len(self._workers) < max(1, self.max_workers // 2):
+        if len(self._workers) < self.min_workers:
             self.logger.warning(f"Worker count critically low: {len(self._workers)}")
 
         # Check worker health
@@ -908,39 +1093,72 @@ class WorkerPool:
         for worker_id in unhealthy_workers:
             await self._restart_worker(worker_id)
 
-    async def _scale_up(self):
-        """Scale up worker pool."""
-        if len(self._workers) >= self.max_workers:
-            return
+    async def _autoscale_loop(self) -> None:
+        """Move the worker count towards the queue-driven target."""
+        while not self._shutdown_event.is_set():
+            try:
+                await asyncio.sleep(self.autoscale_interval_seconds)
 
-        new_worker_id = f"worker-{len(self._workers)}"
-        await self._start_worker(new_worker_id)
-        self.logger.info(f"🔼 Scaled up: Added worker {new_worker_id}")
+                queue_stats = await self.job_store.get_queue_stats()
+                busy = sum(1 for worker in self._workers.values() if worker.is_busy)
+                metrics = self.resource_monitor.get_current_metrics(
+                    active_workers=len(self._workers),
+                    queue_size=queue_stats.get('total_queued', 0)
+                )
+                decision = self.scaling_controller.decide(
+                    current_workers=len(self._workers),
+                    busy_workers=busy,
+                    queue_depth=queue_stats.get('total_queued', 0),
+                    metrics=metrics
+                )
 
-    async def _scale_down(self):
-        """Scale down worker pool."""
-        if len(self._workers) <= 1:
-            return
+                if decision.action == ScalingAction.SCALE_UP:
+                    self.logger.info(f"🔼 Autoscaler: {decision.current_workers} -> {decision.new_workers} ({decision.reason})")
+                    await self._scale_up(decision.new_workers - decision.current_workers)
+                elif decision.action == ScalingAction.SCALE_DOWN:
+                    self.logger.info(f"🔽 Autoscaler: {decision.current_workers} -> {decision.new_workers} ({decision.reason})")
+                    await self._scale_down(decision.current_workers - decision.new_workers)
 
-        # Find the least efficient worker to remove
-        least_efficient_id = None
-        lowest_score = float('inf')
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.logger.error(f"Error in autoscaler: {e}")
 
-        for worker_id in self._workers:
-            if worker_id in self.adaptive_pool.worker_metrics:
-                score = self.adaptive_pool.worker_metrics[worker_id].efficiency_score
-                if score < lowest_score:
-                    lowest_score = score
-                    least_efficient_id = worker_id
+    async def _scale_up(self, count: int = 1):
+        """Scale up worker pool."""
+        for _ in range(count):
+            if len(self._workers) >= self.max_workers:
+                return
+            new_worker_id = self._new_worker_id()
+            await self._start_worker(new_worker_id)
+            self.logger.info(f"🔼 Scaled up: Added worker {new_worker_id}")
+
+    async def _scale_down(self, count: int = 1):
+        """Scale down worker pool by retiring idle workers (busy ones are never interrupted)."""
+        for _ in range(count):
+            if len(self._workers) <= self.min_workers:
+                return
 
-        if least_efficient_id:
-            await self._stop_worker(least_efficient_id)
-            self.logger.info(f"🔽 Scaled down: Removed worker {least_efficient_id}")
+            # Least efficient idle shared worker first; lane reservations are kept
+            idle = [
+                worker_id for worker_id, worker in self._workers.items()
+                if not worker.is_busy and worker.lanes is None
+            ]
+            if not idle:
+                return
+            worker_id = min(
+                idle,
+                key=lambda w: self.adaptive_pool.worker_metrics[w].efficiency_score
+                if w in self.adaptive_pool.worker_metrics else 100.0
+            )
 
-    async def _apply_throttling(self):
-        """Apply temporary throttling to reduce load."""
-        self.logger.warning("🚨 Applying throttling due to resource pressure")
-        await asyncio.sleep(10)  # Brief pause to allow resources to recover
+            worker = self._workers.pop(worker_id)
+            self.adaptive_pool.worker_metrics.pop(worker_id, None)
+            # Drain in the background: a job picked up in the meantime still completes
+            task = asyncio.create_task(worker.drain())
+            self._draining[worker_id] = task
+            task.add_done_callback(lambda _, w=worker_id: self._draining.pop(w, None))
+            self.logger.info(f"🔽 Scaled down: Retiring worker {worker_id}")
 
     async def _stop_worker(self, worker_id: str):
         """Stop a specific worker."""
@@ -969,7 +1187,11 @@ class WorkerPool:
 
         return {
             "worker_count": len(self._workers),
+            "min_workers": self.min_workers,
             "max_workers": self.max_workers,
+            "draining_workers": len(self._draining),
+            "lane_reservations": self.lane_reservations,
+            "autoscaling": self.scaling_controller.get_stats(),
             "workers": worker_stats,
             "resource_optimization": optimization_stats,
             "service_throttling": throttling_stats,
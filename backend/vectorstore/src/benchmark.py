@@ -0,0 +1,171 @@
+"""Recall vs. latency benchmark for the vector store index types.
+
+Rebuilds a persisted store's vectors with every index type in
+``embeddings.INDEX_TYPES`` and compares them against exact search::
+
+    python -m src.benchmark <store dir> --queries queries.txt --k 10 --json results.json
+
+For each index type the harness reports build/training time, serialised
+index size and, for each ``efSearch`` (HNSW) or ``nprobe`` (IVF) value,
+mean recall@k and single‑query latency percentiles.  Queries are
+embedded from ``--queries`` (one per line) with the store's model, or
+sampled from the stored vectors when no file is given.
+
+Vectors are reconstructed from the persisted shards, so benchmark a
+store built with the ``default`` index type: reconstructions from a
+quantised store are themselves approximate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import faiss  # type: ignore
+import numpy as np
+
+from .docstore import DocumentLog
+from .embeddings import INDEX_TYPES, TRAINED_INDEX_TYPES, create_index, get_embedding_model, set_search_params
+
+
+def load_vectors(store_dir: pathlib.Path) -> tuple[np.ndarray, Dict[str, Any]]:
+    """Reconstruct all vectors of a persisted store (in ID order)."""
+    manifest = DocumentLog(store_dir).read_manifest()
+    if manifest is None:
+        raise SystemExit(f"No manifest.json in {store_dir} (save the store with the current version first)")
+    if any(t != "default" for t in manifest.get("shard_index_types", [])):
+        print("warning: store has quantised shards; reconstructed vectors are approximate", file=sys.stderr)
+    parts = []
+    for name in manifest.get("shards", []):
+        shard = faiss.read_index(str(store_dir / name))
+        base = faiss.downcast_index(shard.index) if hasattr(shard, "id_map") else shard
+        if shard.ntotal:
+            parts.append(base.reconstruct_n(0, shard.ntotal))
+    if not parts:
+        raise SystemExit(f"Store {store_dir} has no vectors")
+    return np.ascontiguousarray(np.vstack(parts), dtype="float32"), manifest
+
+
+def _search_param(index_type: str, metric: str) -> Optional[str]:
+    if index_type in ("ivf_pq", "opq_ivf_pq"):
+        return "nprobe"
+    if index_type == "hnsw_sq8" or (index_type == "default" and metric == "cosine"):
+        return "efSearch"
+    return None
+
+
+def _timed_search(index: faiss.Index, queries: np.ndarray, k: int) -> tuple[np.ndarray, List[float]]:
+    ids = np.empty((len(queries), k), dtype="int64")
+    latencies = []
+    for i in range(len(queries)):
+        # One query at a time, as the service searches
+        start = time.perf_counter()
+        _, found = index.search(queries[i:i + 1], k)
+        latencies.append((time.perf_counter() - start) * 1000)
+        ids[i] = found[0]
+    return ids, latencies
+
+
+def _recall(found: np.ndarray, truth: np.ndarray) -> float:
+    hits = sum(len(set(f[f >= 0]) & set(t[t >= 0])) for f, t in zip(found, truth))
+    return hits / max(1, int((truth >= 0).sum()))
+
+
+def run_benchmark(vectors: np.ndarray, queries: np.ndarray, metric: str, k: int,
+                  index_types: List[str], ef_values: List[int], nprobe_values: List[int]) -> List[Dict[str, Any]]:
+    dim = vectors.shape[1]
+    exact = faiss.IndexFlatL2(dim) if metric == "l2" else faiss.IndexFlatIP(dim)
+    exact.add(vectors)
+    truth, exact_latencies = _timed_search(exact, queries, k)
+    results: List[Dict[str, Any]] = [{
+        "index_type": "exact", "param": None, "value": None, "recall": 1.0,
+        "p50_ms": float(np.percentile(exact_latencies, 50)), "p95_ms": float(np.percentile(exact_latencies, 95)),
+        "size_mb": round(vectors.nbytes / 2 ** 20, 2), "build_s": 0.0,
+    }]
+
+    for index_type in index_types:
+        needed = TRAINED_INDEX_TYPES.get(index_type, 0)
+        if len(vectors) < needed:
+            print(f"skipping {index_type}: needs {needed} training vectors, have {len(vectors)}", file=sys.stderr)
+            continue
+        start = time.perf_counter()
+        index, _ = create_index(dim, metric, index_type, vectors)
+        index.add(vectors)
+        build_s = time.perf_counter() - start
+        size_mb = round(len(faiss.serialize_index(index)) / 2 ** 20, 2)
+
+        param = _search_param(index_type, metric)
+        values: List[Optional[int]]
+        if param == "efSearch":
+            values = list(ef_values)
+        elif param == "nprobe":
+            values = list(nprobe_values)
+        else:
+            values = [None]
+        for value in values:
+            if param == "efSearch":
+                set_search_params(index, ef_search=max(value or 0, k))
+            elif param == "nprobe":
+                set_search_params(index, nprobe=value)
+            found, latencies = _timed_search(index, queries, k)
+            results.append({
+                "index_type": index_type, "param": param, "value": value,
+                "recall": round(_recall(found, truth), 4),
+                "p50_ms": float(np.percentile(latencies, 50)), "p95_ms": float(np.percentile(latencies, 95)),
+                "size_mb": size_mb, "build_s": round(build_s, 2),
+            })
+    return results
+
+
+def _print_table(results: List[Dict[str, Any]], k: int) -> None:
+    print(f"{'index':<12} {'param':<12} {'recall@' + str(k):>9} {'p50 ms':>8} {'p95 ms':>8} {'size MB':>9} {'build s':>8}")
+    for r in results:
+        param = f"{r['param']}={r['value']}" if r["param"] else "-"
+        print(f"{r['index_type']:<12} {param:<12} {r['recall']:>9.3f} {r['p50_ms']:>8.2f} "
+              f"{r['p95_ms']:>8.2f} {r['size_mb']:>9.2f} {r['build_s']:>8.2f}")
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("store", type=pathlib.Path, help="Persisted store directory (<root>/<case>/<model>/<metric>)")
+    parser.add_argument("--queries", type=pathlib.Path, help="Text file with one query per line")
+    parser.add_argument("--num-queries", type=int, default=200, help="Stored vectors sampled as queries without --queries")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--types", default=",".join(INDEX_TYPES), help="Comma-separated index types")
+    parser.add_argument("--ef", type=_int_list, default=[16, 32, 64, 128, 256], help="efSearch values")
+    parser.add_argument("--nprobe", type=_int_list, default=[1, 4, 16, 64], help="nprobe values")
+    parser.add_argument("--json", type=pathlib.Path, help="Also write the results as JSON")
+    args = parser.parse_args(argv)
+
+    vectors, manifest = load_vectors(args.store)
+    metric = manifest["metric"]
+    if args.queries:
+        texts = [line.strip() for line in args.queries.read_text(encoding="utf-8").splitlines() if line.strip()]
+        queries = get_embedding_model(manifest["embedding_model"]).embed(texts)
+        if metric == "cosine":
+            faiss.normalize_L2(queries)
+    else:
+        rows = np.random.default_rng(0).choice(len(vectors), min(args.num_queries, len(vectors)), replace=False)
+        queries = np.ascontiguousarray(vectors[rows])
+
+    types = [t.strip() for t in args.types.split(",") if t.strip()]
+    unknown = set(types) - set(INDEX_TYPES)
+    if unknown:
+        parser.error(f"unknown index types: {', '.join(sorted(unknown))}")
+    print(f"{len(vectors)} vectors, dim {vectors.shape[1]}, metric {metric}, {len(queries)} queries", file=sys.stderr)
+    results = run_benchmark(vectors, queries, metric, args.k, types, args.ef, args.nprobe)
+    _print_table(results, args.k)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
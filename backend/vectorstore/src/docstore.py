@@ -0,0 +1,209 @@
+"""Append-only persistence for vector store documents.
+
+A persisted store directory contains:
+
+* ``texts.bin`` – UTF‑8 document texts concatenated in ID order.
+* ``offsets.bin`` – one little‑endian int64 per document: the end
+  offset of its text in ``texts.bin`` (the start is the previous end).
+* ``metadata.jsonl`` – one JSON object per document, in ID order.
+* ``index_<shard>_<generation>.faiss`` – one FAISS index per shard.
+* ``manifest.json`` – document count, file sizes, shard sizes and the
+  current index file of each shard.
+
+Saving appends only the documents added since the last save and
+rewrites only shards that changed; the manifest is replaced atomically
+last, so it is the commit point.  Bytes past the sizes recorded in the
+manifest belong to an interrupted save and are truncated before the next
+append or ignored on load.  Documents are never updated or deleted, so
+that truncation is the only compaction the log needs.
+
+``MappedTexts`` serves the text blob through ``mmap`` using the offset
+table, so loading a store does not read or decode its documents and the
+pages are shared by every process serving the same store.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import pathlib
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+TEXTS_FILE = "texts.bin"
+OFFSETS_FILE = "offsets.bin"
+METADATA_FILE = "metadata.jsonl"
+
+_OFFSET_SIZE = 8  # int64
+
+
+def _atomic_write(path: pathlib.Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class MappedTexts(Sequence[str]):
+    """Read‑only view of the committed texts backed by ``mmap``."""
+
+    def __init__(self, texts_path: pathlib.Path, offsets_path: pathlib.Path,
+                 doc_count: int, texts_bytes: int) -> None:
+        self._count = doc_count
+        self._texts = self._map(texts_path, texts_bytes)
+        self._offsets = self._map(offsets_path, doc_count * _OFFSET_SIZE)
+        self._ends = memoryview(self._offsets).cast("q") if self._offsets is not None else ()
+
+    @staticmethod
+    def _map(path: pathlib.Path, length: int) -> Optional[mmap.mmap]:
+        if length == 0:
+            return None  # mmap refuses empty mappings
+        with open(path, "rb") as f:
+            return mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i):  # type: ignore[override]
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        start = self._ends[i - 1] if i else 0
+        return self._texts[start:self._ends[i]].decode("utf-8")  # type: ignore[index]
+
+
+class TextShard(Sequence[str]):
+    """One shard's texts: a window of ``MappedTexts`` plus texts added since loading."""
+
+    def __init__(self, mapped: MappedTexts, start: int, size: int) -> None:
+        self._mapped = mapped
+        self._start = start
+        self._size = size
+        self._tail: List[str] = []
+
+    def __len__(self) -> int:
+        return self._size + len(self._tail)
+
+    def __getitem__(self, i):  # type: ignore[override]
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if i < self._size:
+            if i < 0:
+                raise IndexError(i)
+            return self._mapped[self._start + i]
+        return self._tail[i - self._size]
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def append(self, text: str) -> None:
+        self._tail.append(text)
+
+    def extend(self, texts: Iterable[str]) -> None:
+        self._tail.extend(texts)
+
+
+class DocumentLog:
+    """Reads and appends the document files of one store directory."""
+
+    def __init__(self, dir_path: pathlib.Path) -> None:
+        self.dir_path = dir_path
+
+    def read_manifest(self) -> Optional[Dict[str, Any]]:
+        path = self.dir_path / MANIFEST_FILE
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def write_manifest(self, manifest: Dict[str, Any]) -> None:
+        """Commit a save by atomically replacing the manifest."""
+        manifest = {**manifest, "format_version": FORMAT_VERSION}
+        _atomic_write(self.dir_path / MANIFEST_FILE, json.dumps(manifest, indent=2).encode("utf-8"))
+
+    def reset(self) -> None:
+        """Drop all document files (the next append starts a fresh log)."""
+        for name in (TEXTS_FILE, OFFSETS_FILE, METADATA_FILE):
+            (self.dir_path / name).unlink(missing_ok=True)
+
+    def _truncate(self, name: str, size: int) -> None:
+        path = self.dir_path / name
+        if path.exists() and path.stat().st_size > size:
+            with open(path, "r+b") as f:
+                f.truncate(size)
+
+    def append(self, manifest: Optional[Dict[str, Any]], texts: List[str],
+               metadatas: List[dict]) -> Dict[str, int]:
+        """Append documents after the committed ones.
+
+        Returns the new file sizes, to be recorded in the next manifest.
+        """
+        committed = manifest or {}
+        texts_bytes = committed.get("texts_bytes", 0)
+        metadata_bytes = committed.get("metadata_bytes", 0)
+        doc_count = committed.get("doc_count", 0)
+        # Discard anything an interrupted save left behind
+        self._truncate(TEXTS_FILE, texts_bytes)
+        self._truncate(OFFSETS_FILE, doc_count * _OFFSET_SIZE)
+        self._truncate(METADATA_FILE, metadata_bytes)
+
+        encoded = [text.encode("utf-8") for text in texts]
+        ends = array("q")
+        position = texts_bytes
+        for blob in encoded:
+            position += len(blob)
+            ends.append(position)
+        meta_lines = b"".join(
+            json.dumps(meta, ensure_ascii=False, default=str).encode("utf-8") + b"\n" for meta in metadatas
+        )
+
+        for name, payload in ((TEXTS_FILE, b"".join(encoded)),
+                              (OFFSETS_FILE, ends.tobytes()),
+                              (METADATA_FILE, meta_lines)):
+            with open(self.dir_path / name, "ab") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+
+        return {
+            "doc_count": doc_count + len(texts),
+            "texts_bytes": position,
+            "metadata_bytes": metadata_bytes + len(meta_lines),
+        }
+
+    def load(self, manifest: Dict[str, Any], mmap_texts: bool = False
+             ) -> Tuple[Union[List[str], MappedTexts], List[dict]]:
+        """Read the committed metadata, and the texts either into memory or as a ``MappedTexts`` view."""
+        doc_count = manifest.get("doc_count", 0)
+        texts: Union[List[str], MappedTexts]
+        if mmap_texts:
+            texts = MappedTexts(self.dir_path / TEXTS_FILE, self.dir_path / OFFSETS_FILE,
+                                doc_count, manifest.get("texts_bytes", 0))
+        else:
+            ends = array("q")
+            with open(self.dir_path / OFFSETS_FILE, "rb") as f:
+                ends.frombytes(f.read(doc_count * _OFFSET_SIZE))
+            with open(self.dir_path / TEXTS_FILE, "rb") as f:
+                blob = f.read(manifest.get("texts_bytes", 0))
+            texts = []
+            start = 0
+            for end in ends:
+                texts.append(blob[start:end].decode("utf-8"))
+                start = end
+
+        metadatas: List[dict] = []
+        with open(self.dir_path / METADATA_FILE, "rb") as f:
+            for line in f.read(manifest.get("metadata_bytes", 0)).splitlines():
+                metadatas.append(json.loads(line))
+        return texts, metadatas
@@ -4,15 +4,24 @@ This module defines helpers for loading sentence‑transformer models and
 constructing FAISS indices based on a requested similarity metric.  The
 embedding and index objects are encapsulated to make it easier to swap
 models or index types in the future.
+
+Besides the exact/HNSW indices chosen by metric (``default``), stores can
+use compressed index types that must be trained on a sample first:
+
+* ``hnsw_sq8`` – HNSW graph over 8‑bit scalar‑quantised vectors (~4× smaller).
+* ``ivf_pq`` – inverted file with product quantisation (~16–32× smaller).
+* ``opq_ivf_pq`` – ``ivf_pq`` after an OPQ rotation, which usually
+  recovers some of the recall lost to quantisation.
 """
 
 from __future__ import annotations
 
 import os
 from functools import lru_cache
-from typing import Optional
+from typing import Optional, Tuple
 
 import faiss  # type: ignore
+import numpy as np
 from sentence_transformers import SentenceTransformer  # type: ignore
 
 
@@ -31,6 +40,7 @@ class EmbeddingModel:
     def __init__(self, model_name: str) -> None:
         self.model_name = model_name
         self._model: Optional[SentenceTransformer] = None
+        self.batch_size = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
 
     @property
     def model(self) -> SentenceTransformer:
@@ -40,28 +50,88 @@ class EmbeddingModel:
             self._model = SentenceTransformer(self.model_name)
         return self._model
 
-    def embed(self, texts: list[str]) -> list[list[float]]:
+    @property
+    def dimension(self) -> int:
+        """Embedding dimension, read from the model configuration."""
+        dim = self.model.get_sentence_embedding_dimension()
+        if dim is None:
+            # Some custom models do not declare it; fall back to encoding a probe
+            dim = self.embed(["dimension probe"]).shape[1]
+        return int(dim)
+
+    def warm_up(self) -> None:
+        """Load the model and run one encode so the first request pays no setup cost."""
+        self.embed(["warm-up"])
+
+    def embed(self, texts: list[str]) -> np.ndarray:
         """Compute embeddings for a list of texts.
 
-        Returns a list of embedding vectors as Python lists.  We use
-        ``convert_to_numpy=True`` to obtain NumPy arrays and then cast
-        to lists so that FAISS can consume them.
+        Returns a C‑contiguous ``(len(texts), dim)`` float32 array, the
+        layout FAISS consumes directly, so large ingests never round‑trip
+        through Python lists.
         """
-        vectors = self.model.encode(texts, convert_to_numpy=True)
-        return vectors.tolist()  # type: ignore[return-value]
+        vectors = self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+        )
+        return np.ascontiguousarray(vectors, dtype="float32")
+
+
+# Index types that need training, with the minimum number of training vectors
+TRAINED_INDEX_TYPES = {
+    "hnsw_sq8": int(os.getenv("VECTOR_MIN_TRAIN_SQ", "1000")),
+    "ivf_pq": int(os.getenv("VECTOR_MIN_TRAIN_PQ", "10000")),
+    "opq_ivf_pq": int(os.getenv("VECTOR_MIN_TRAIN_PQ", "10000")),
+}
+INDEX_TYPES = ("default", *TRAINED_INDEX_TYPES)
+
+# IVF lists (capped so each centroid trains on >= 39 vectors) and PQ
+# sub‑quantisers (0 = largest of 64/48/32/16/8 dividing the dimension)
+IVF_NLIST = int(os.getenv("VECTOR_IVF_NLIST", "1024"))
+PQ_M = int(os.getenv("VECTOR_PQ_M", "0"))
+TRAIN_SAMPLE_SIZE = int(os.getenv("VECTOR_TRAIN_SAMPLE", "100000"))
 
 
-def _build_faiss_index(dim: int, metric: str) -> faiss.Index:
-    """Create a FAISS index appropriate for the given metric.
+def _pq_subquantizers(dim: int) -> int:
+    if PQ_M:
+        return PQ_M
+    return next((m for m in (64, 48, 32, 16, 8) if dim % m == 0), 1)
+
+
+def _factory_string(dim: int, index_type: str, n_train: int) -> str:
+    if index_type == "hnsw_sq8":
+        return "HNSW32,SQ8"
+    nlist = max(1, min(IVF_NLIST, n_train // 39))
+    m = _pq_subquantizers(dim)
+    if index_type == "ivf_pq":
+        return f"IVF{nlist},PQ{m}"
+    if index_type == "opq_ivf_pq":
+        return f"OPQ{m},IVF{nlist},PQ{m}"
+    raise ValueError(f"Unsupported index type: {index_type}")
+
+
+def _build_faiss_index(dim: int, metric: str, index_type: str = "default", n_train: int = 0) -> faiss.Index:
+    """Create a FAISS index appropriate for the given metric and index type.
+
+    With ``index_type='default'``:
 
     * ``cosine`` → ``IndexHNSWFlat`` with inner product (cosine
       similarity after normalisation).
     * ``inner_product`` → ``IndexFlatIP``.
     * ``l2`` → ``IndexFlatL2``.
 
-    If an unknown metric is provided, a ``ValueError`` is raised.
+    Other index types (see ``TRAINED_INDEX_TYPES``) are built with
+    ``faiss.index_factory``; ``n_train`` sizes the IVF lists and the
+    index must be trained before use.  If an unknown metric or index type
+    is provided, a ``ValueError`` is raised.
     """
     metric = metric.lower()
+    if index_type != "default":
+        if metric not in ("cosine", "inner_product", "l2"):
+            raise ValueError(f"Unsupported similarity metric: {metric}")
+        faiss_metric = faiss.METRIC_L2 if metric == "l2" else faiss.METRIC_INNER_PRODUCT
+        return faiss.index_factory(dim, _factory_string(dim, index_type, n_train), faiss_metric)
     if metric == "cosine":
         # HNSW approximates cosine similarity by using inner product on
         # unit‑normalised vectors.  Note: we normalise embeddings when
@@ -77,6 +147,71 @@ def _build_faiss_index(dim: int, metric: str) -> faiss.Index:
     return index
 
 
+def create_index(dim: int, metric: str, index_type: str = "default",
+                 train_vectors: Optional[np.ndarray] = None) -> Tuple[faiss.Index, str]:
+    """Create an index, training it on a sample of ``train_vectors`` if needed.
+
+    Returns the index and the type actually built: a trained type falls
+    back to ``default`` while fewer than its minimum training vectors are
+    available, so callers can retrain once the shard has grown.
+    """
+    if index_type not in INDEX_TYPES:
+        raise ValueError(f"Unsupported index type: {index_type}")
+    n_available = 0 if train_vectors is None else len(train_vectors)
+    if index_type != "default" and n_available < TRAINED_INDEX_TYPES[index_type]:
+        index_type = "default"
+    if index_type == "default":
+        return _build_faiss_index(dim, metric), index_type
+    sample = train_vectors
+    if n_available > TRAIN_SAMPLE_SIZE:
+        rows = np.random.default_rng(0).choice(n_available, TRAIN_SAMPLE_SIZE, replace=False)
+        sample = train_vectors[np.sort(rows)]
+    index = _build_faiss_index(dim, metric, index_type, len(sample))
+    index.train(np.ascontiguousarray(sample, dtype="float32"))
+    return index, index_type
+
+
+def set_search_params(index: faiss.Index, ef_search: Optional[int] = None, nprobe: Optional[int] = None) -> None:
+    """Set HNSW ``efSearch`` / IVF ``nprobe`` on an index (through ID maps and transforms).
+
+    Parameters that don't apply to the index type are ignored.
+    """
+    space = faiss.ParameterSpace()
+    for name, value in (("efSearch", ef_search), ("nprobe", nprobe)):
+        if value is None:
+            continue
+        try:
+            space.set_index_parameter(index, name, value)
+        except RuntimeError:
+            pass
+
+
+def is_ivf(index_type: str) -> bool:
+    """Whether an index built as ``index_type`` is an inverted file (IVF) index."""
+    return index_type in ("ivf_pq", "opq_ivf_pq")
+
+
+def is_hnsw(index_type: str, metric: str) -> bool:
+    """Whether an index built as ``index_type`` with ``metric`` is an HNSW graph."""
+    return index_type == "hnsw_sq8" or (index_type == "default" and metric.lower() == "cosine")
+
+
+def search_parameters(index_type: str, metric: str, ef_search: int, nprobe: int,
+                      selector: Optional[faiss.IDSelector] = None) -> Optional[faiss.SearchParameters]:
+    """Per‑query search parameters for an index built as ``index_type`` with ``metric``.
+
+    HNSW indices get ``efSearch`` and IVF indices ``nprobe``, both along
+    with ``selector``; exact indices only need parameters to carry a
+    selector, so ``None`` is returned when there is none.
+    """
+    kwargs = {"sel": selector} if selector is not None else {}
+    if is_ivf(index_type):
+        return faiss.SearchParametersIVF(nprobe=nprobe, **kwargs)
+    if is_hnsw(index_type, metric):
+        return faiss.SearchParametersHNSW(efSearch=ef_search, **kwargs)
+    return faiss.SearchParameters(**kwargs) if kwargs else None
+
+
 @lru_cache(maxsize=None)
 def get_embedding_model(model_name: str) -> EmbeddingModel:
     """Get or create an EmbeddingModel by name.
@@ -87,21 +222,20 @@ def get_embedding_model(model_name: str) -> EmbeddingModel:
     return EmbeddingModel(model_name)
 
 
-def build_index(vectors: list[list[float]], metric: str) -> tuple[faiss.Index, int]:
-    """Construct a FAISS index from a list of embedding vectors.
+def build_index(vectors: "np.ndarray | list[list[float]]", metric: str) -> tuple[faiss.Index, int]:
+    """Construct a FAISS index from a matrix of embedding vectors.
 
     The function infers the dimensionality from the first vector and
     returns both the index and the dimension.  Vectors are normalised
     when ``metric == 'cosine'`` to ensure cosine similarity is
     equivalent to inner product.
     """
-    if not vectors:
+    if len(vectors) == 0:
         raise ValueError("Cannot build index from an empty list of vectors")
-    import numpy as np  # delayed import
-    dim = len(vectors[0])
+    arr = np.array(vectors, dtype='float32')  # copy: normalize_L2 works in place
+    dim = arr.shape[1]
     metric_lower = metric.lower()
     index = _build_faiss_index(dim, metric_lower)
-    arr = np.array(vectors, dtype='float32')
     if metric_lower == 'cosine':
         # Normalise each vector to unit length for cosine similarity
         faiss.normalize_L2(arr)
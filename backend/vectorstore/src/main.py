@@ -11,16 +11,26 @@ This FastAPI application exposes endpoints for ingesting documents into
 
 from __future__ import annotations
 
+import asyncio
 import datetime
+import heapq
+import itertools
 import logging
+import math
 import pathlib
-from typing import Dict, List, Optional, Tuple
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 import faiss  # type: ignore
+import numpy as np
 from fastapi import FastAPI, HTTPException, Response as FastAPIResponse
 from pydantic import BaseModel, Field
 
-from .embeddings import get_embedding_model
+from .docstore import DocumentLog, TextShard
+from .embeddings import (
+    INDEX_TYPES, TRAINED_INDEX_TYPES, create_index, get_embedding_model, is_hnsw, is_ivf, search_parameters,
+)
 
 # Additional imports for persistence and configuration
 import os
@@ -87,6 +97,29 @@ def init_logger(case: Optional[str] = None) -> logging.Logger:
 # Vector store implementation
 # ----------------------------------------------------------------------------
 
+# FAISS releases the GIL during search, so shards are searched concurrently on
+# a shared pool.  ``VECTOR_SEARCH_THREADS`` bounds the number of shard searches
+# in flight across all stores.
+SEARCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("VECTOR_SEARCH_THREADS", str(min(8, os.cpu_count() or 1)))),
+    thread_name_prefix="shard-search",
+)
+
+# Candidates fetched per requested result when an index rejects per‑query search
+# parameters (e.g. GPU copies of the shards), so a filter cannot be applied
+# inside the index and hits are post‑filtered instead.
+FILTER_OVERFETCH = int(os.getenv("VECTOR_FILTER_OVERFETCH", "4"))
+
+# HNSW only returns the filter matches its efSearch‑bounded graph walk reaches,
+# so selective filters come back short.  HNSW shards with at most
+# ``VECTOR_FILTER_EXACT_LIMIT`` matches score them exactly; with more, efSearch
+# grows with the shard's selectivity up to ``VECTOR_FILTER_MAX_EF``.
+FILTER_EXACT_LIMIT = int(os.getenv("VECTOR_FILTER_EXACT_LIMIT", "4096"))
+FILTER_MAX_EF = int(os.getenv("VECTOR_FILTER_MAX_EF", "1024"))
+
+# Metadata value types indexed for filtering
+_FILTERABLE_TYPES = (str, int, float, bool)
+
 class VectorStore:
     """A simple vector store using FAISS.
 
@@ -96,111 +129,305 @@ class VectorStore:
     ``get_embedding_model``.
     """
 
-    def __init__(self, embedding_model_name: str, metric: str) -> None:
+    def __init__(self, embedding_model_name: str, metric: str, index_type: str = "default") -> None:
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"Unsupported index type {index_type}")
         self.embedding_model_name = embedding_model_name
         self.metric = metric.lower()
+        # Index type for new shards; shards too small to train use "default" until they grow
+        self.index_type = index_type
+        self.shard_index_types: List[str] = []
+        # Search‑time defaults, overridable per query
+        self.ef_search: int = int(os.getenv("VECTOR_EF_SEARCH", "16"))
+        self.nprobe: int = int(os.getenv("VECTOR_NPROBE", "16"))
         self._embedding_model = get_embedding_model(embedding_model_name)
         self.dim: Optional[int] = None
         # Sharding support: list of FAISS index wrappers, one per shard
         self.shards: List[faiss.IndexIDMap] = []
         # Documents and metadata per shard
-        self.documents_shards: List[List[str]] = []
+        self.documents_shards: List[List[str] | TextShard] = []
         self.metadatas_shards: List[List[dict]] = []
         # Next global document ID used across shards
         self._next_id: int = 0
+        # Dense global ID -> (shard, offset) lookup; IDs are assigned sequentially
+        self._id_shard = array('i')
+        self._id_offset = array('i')
+        # Inverted metadata index for filtered search: key -> str(value) -> IDs
+        self._postings: Dict[str, Dict[str, array]] = {}
+        # Persistence bookkeeping: documents already on disk and shards changed since
+        self._persisted_count: int = 0
+        self._dirty_shards: set[int] = set()
+        # Shards opened read‑only through mmap, by index file; reloaded before writes
+        self._mapped_index_files: Dict[int, str] = {}
         # Maximum documents per shard; beyond this a new shard is created
         self.shard_size: int = int(os.getenv("VECTOR_SHARD_SIZE", "100000"))
 
-    def _create_index(self) -> faiss.IndexIDMap:
-        """Create a new FAISS index for a shard based on the metric and dimension."""
+    def _create_index(self, train_vectors: Optional[np.ndarray] = None) -> Tuple[faiss.IndexIDMap, str]:
+        """Create a new FAISS index for a shard based on the metric, dimension and index type.
+
+        Trained index types are trained on a sample of ``train_vectors``;
+        returns the index and the type actually built.
+        """
         if self.dim is None:
-            # Determine embedding dimension by encoding a dummy
-            dummy_vec = self._embedding_model.embed(["dummy"])[0]
-            self.dim = len(dummy_vec)
-        if self.metric == 'cosine':
-            base_index = faiss.IndexHNSWFlat(self.dim, 32, faiss.METRIC_INNER_PRODUCT)
-            base_index.hnsw.efConstruction = 40
-        elif self.metric == 'inner_product':
-            base_index = faiss.IndexFlatIP(self.dim)
-        elif self.metric == 'l2':
-            base_index = faiss.IndexFlatL2(self.dim)
-        else:
-            raise ValueError(f"Unsupported metric {self.metric}")
-        return faiss.IndexIDMap(base_index)
+            self.dim = self._embedding_model.dimension
+        base_index, built_type = create_index(self.dim, self.metric, self.index_type, train_vectors)
+        return faiss.IndexIDMap(base_index), built_type
+
+    def _retrain_shard(self, shard_idx: int, incoming: np.ndarray) -> None:
+        """Rebuild a ``default`` shard as the store's trained type once enough vectors exist.
+
+        The shard's vectors are reconstructed exactly from its flat/HNSW
+        storage and, with the incoming batch, form the training sample.
+        """
+        shard = self.shards[shard_idx]
+        existing = shard.index.reconstruct_n(0, shard.ntotal) if shard.ntotal else np.empty((0, self.dim), dtype='float32')
+        existing_ids = faiss.vector_to_array(shard.id_map).astype('int64')
+        new_index, built_type = self._create_index(np.vstack([existing, incoming]))
+        if built_type == "default":
+            return
+        if len(existing):
+            new_index.add_with_ids(existing, existing_ids)  # type: ignore[arg-type]
+        self.shards[shard_idx] = new_index
+        self.shard_index_types[shard_idx] = built_type
+        self._dirty_shards.add(shard_idx)
 
     def add_documents(self, texts: List[str], metadatas: Optional[List[dict]] = None) -> None:
         """Add documents and their metadata to the store with sharding.
 
         When the number of documents in the current shard reaches
         ``self.shard_size``, a new shard is created automatically.
-        Embeddings are computed once for all texts.
+        Embeddings are computed once for all texts as a contiguous
+        float32 matrix, normalised in one call and added to each shard
+        as a single slice.
         """
         if metadatas is None:
             metadatas = [{} for _ in texts]
         if len(texts) != len(metadatas):
             raise ValueError("texts and metadatas must be the same length")
+        if not texts:
+            return
         # Compute embeddings for all texts at once
         embeddings = self._embedding_model.embed(texts)
-        import numpy as np
-        for emb, text, meta in zip(embeddings, texts, metadatas):
-            # Create a new shard if needed
+        if self.dim is None:
+            self.dim = embeddings.shape[1]
+        if self.metric == 'cosine':
+            faiss.normalize_L2(embeddings)
+        ids = np.arange(self._next_id, self._next_id + len(texts), dtype='int64')
+        start = 0
+        while start < len(texts):
+            # Create a new shard if needed, training it on the vectors it will hold
             if not self.shards or len(self.documents_shards[-1]) >= self.shard_size:
-                new_index = self._create_index()
-                self.shards.append(new_index)
+                index, built_type = self._create_index(embeddings[start:start + self.shard_size])
+                self.shards.append(index)
+                self.shard_index_types.append(built_type)
                 self.documents_shards.append([])
                 self.metadatas_shards.append([])
-            # Normalise if cosine similarity
-            vec = np.array([emb], dtype='float32')
-            if self.metric == 'cosine':
-                faiss.normalize_L2(vec)
-            # Insert into current shard with global ID
+            # Fill the current shard up to its capacity with one bulk insert
             current_idx = len(self.shards) - 1
-            shard_index = self.shards[current_idx]
-            shard_index.add_with_ids(vec, np.array([self._next_id], dtype='int64'))  # type: ignore[arg-type]
-            self.documents_shards[current_idx].append(text)
-            self.metadatas_shards[current_idx].append(meta)
-            self._next_id += 1
-
-    def query(self, query_text: str, k: int = 5) -> List[Tuple[str, dict, float]]:
+            if current_idx in self._mapped_index_files:
+                # A memory‑mapped index is read‑only: load it fully before adding to it
+                self.shards[current_idx] = faiss.read_index(self._mapped_index_files.pop(current_idx))
+            end = min(len(texts), start + self.shard_size - len(self.documents_shards[current_idx]))
+            if (self.index_type != "default" and self.shard_index_types[current_idx] == "default"
+                    and self.shards[current_idx].ntotal
+                    and self.shards[current_idx].ntotal + end - start >= TRAINED_INDEX_TYPES[self.index_type]):
+                self._retrain_shard(current_idx, embeddings[start:end])
+            self.shards[current_idx].add_with_ids(embeddings[start:end], ids[start:end])  # type: ignore[arg-type]
+            self._dirty_shards.add(current_idx)
+            first_offset = len(self.documents_shards[current_idx])
+            self._id_shard.extend([current_idx] * (end - start))
+            self._id_offset.extend(range(first_offset, first_offset + end - start))
+            self._index_metadata(self._next_id + start, metadatas[start:end])
+            self.documents_shards[current_idx].extend(texts[start:end])
+            self.metadatas_shards[current_idx].extend(metadatas[start:end])
+            start = end
+        self._next_id += len(texts)
+
+    def _index_metadata(self, first_id: int, metadatas: List[dict]) -> None:
+        """Add scalar metadata values of consecutive IDs to the postings."""
+        for doc_id, meta in enumerate(metadatas, start=first_id):
+            for key, value in meta.items():
+                if isinstance(value, _FILTERABLE_TYPES):
+                    self._postings.setdefault(key, {}).setdefault(str(value), array('q')).append(doc_id)
+
+    def _rebuild_id_map(self) -> None:
+        """Recreate the ID lookup and metadata postings from the per‑shard lists (after loading)."""
+        self._id_shard = array('i')
+        self._id_offset = array('i')
+        self._postings = {}
+        first_id = 0
+        for shard_idx, (shard_docs, shard_metas) in enumerate(zip(self.documents_shards, self.metadatas_shards)):
+            self._id_shard.extend([shard_idx] * len(shard_docs))
+            self._id_offset.extend(range(len(shard_docs)))
+            self._index_metadata(first_id, shard_metas)
+            first_id += len(shard_docs)
+
+    def _matching_ids(self, filters: Dict[str, Any]) -> Optional[np.ndarray]:
+        """Sorted IDs whose metadata match every filter, or ``None`` if every document matches.
+
+        A filter value matches by equality; a list value matches any of
+        its elements.
+        """
+        matched: Optional[np.ndarray] = None
+        for key, wanted in filters.items():
+            values = {str(v) for v in (wanted if isinstance(wanted, (list, tuple, set)) else [wanted])}
+            postings = self._postings.get(key, {})
+            lists = [postings[v] for v in values if v in postings]
+            # A document has one value per key, so the postings are disjoint; keys
+            # that cover the whole store (e.g. ``case`` in a per‑case store) don't constrain
+            if sum(len(ids) for ids in lists) == self._next_id:
+                continue
+            ids = [np.frombuffer(ids, dtype=np.int64) for ids in lists]
+            key_ids = np.unique(np.concatenate(ids)) if ids else np.empty(0, dtype=np.int64)
+            matched = key_ids if matched is None else np.intersect1d(matched, key_ids, assume_unique=True)
+            if not len(matched):
+                break
+        return matched
+
+    def _matches(self, meta: dict, filters: Dict[str, Any]) -> bool:
+        for key, wanted in filters.items():
+            values = wanted if isinstance(wanted, (list, tuple, set)) else [wanted]
+            if key not in meta or str(meta[key]) not in {str(v) for v in values}:
+                return False
+        return True
+
+    def get_document(self, doc_id: int) -> Optional[Tuple[str, dict]]:
+        """Return ``(text, metadata)`` for a global ID in constant time."""
+        if doc_id < 0 or doc_id >= len(self._id_shard):
+            return None
+        shard_idx = self._id_shard[doc_id]
+        offset = self._id_offset[doc_id]
+        return self.documents_shards[shard_idx][offset], self.metadatas_shards[shard_idx][offset]
+
+    @property
+    def higher_is_better(self) -> bool:
+        """Whether larger scores mean more similar (false only for ``l2`` distances)."""
+        return self.metric != 'l2'
+
+    def _exact_search(self, shard: faiss.IndexIDMap, ids: np.ndarray, vec: np.ndarray,
+                      k: int) -> List[Tuple[float, int]]:
+        """Score the global ``ids`` held by ``shard`` exactly and return the top ``k``."""
+        offsets = np.frombuffer(self._id_offset, dtype=np.int32)[ids].astype('int64')
+        vectors = shard.index.reconstruct_batch(offsets)
+        if self.metric == 'l2':
+            scores = ((vectors - vec[0]) ** 2).sum(axis=1)
+        else:
+            scores = vectors @ vec[0]
+        order = np.argsort(-scores if self.higher_is_better else scores, kind='stable')[:k]
+        return [(float(scores[i]), int(ids[i])) for i in order]
+
+    def _search_shard(self, shard: faiss.IndexIDMap, index_type: str, vec: np.ndarray, k: int,
+                      ef_search: int, nprobe: int,
+                      selector: Optional[faiss.IDSelector] = None,
+                      filters: Optional[Dict[str, Any]] = None,
+                      matched: Optional[np.ndarray] = None) -> List[Tuple[float, int]]:
+        """Top ``k`` hits of one shard; ``matched`` lists the shard's IDs passing ``selector``."""
+        hnsw_filtered = matched is not None and is_hnsw(index_type, self.metric)
+        if hnsw_filtered:
+            if len(matched) <= FILTER_EXACT_LIMIT:
+                return self._exact_search(shard, matched, vec, k)
+            # Widen the walk so it still meets about ef_search matching documents
+            wanted = math.ceil(ef_search * shard.ntotal / len(matched))
+            ef_search = max(ef_search, min(wanted, FILTER_MAX_EF))
+        params = search_parameters(index_type, self.metric, ef_search, nprobe, selector)
+        if params is not None:
+            try:
+                # IndexIDMap translates the selector to external (global) IDs
+                scores, ids = shard.search(vec, k, params=params)
+            except (RuntimeError, TypeError):
+                # Index that rejects search parameters: it searches with its own
+                # settings, and filtered queries over‑fetch and filter the hits
+                if selector is not None:
+                    scores, ids = shard.search(vec, min(shard.ntotal, k * FILTER_OVERFETCH))
+                    hits = []
+                    for score, idx in zip(scores[0], ids[0]):
+                        found = self.get_document(int(idx)) if idx >= 0 else None
+                        if found is not None and self._matches(found[1], filters or {}):
+                            hits.append((float(score), int(idx)))
+                    return hits[:k]
+                scores, ids = shard.search(vec, k)
+        else:
+            scores, ids = shard.search(vec, k)
+        hits = [(float(score), int(idx)) for score, idx in zip(scores[0], ids[0]) if idx >= 0]
+        if hnsw_filtered and len(hits) < min(k, len(matched)):
+            # The capped walk still came back short: a filtered query returns k results
+            return self._exact_search(shard, matched, vec, k)
+        return hits
+
+    def query(self, query_text: str, k: int = 5,
+              filters: Optional[Dict[str, Any]] = None,
+              ef_search: Optional[int] = None,
+              nprobe: Optional[int] = None) -> List[Tuple[str, dict, float]]:
         """Return the top‑k documents similar to ``query_text`` across all shards.
 
-        The method computes the query embedding once and searches each
-        shard individually, combining and sorting results by similarity.
+        The method computes the query embedding once and searches the
+        shards in parallel.  Each shard returns its hits already ranked,
+        so the global top‑k is a heap merge of those lists in the
+        metric's direction (descending similarity, ascending ``l2``
+        distance); only the winning hits are materialised.
+
+        ``filters`` maps metadata keys to a value or a list of accepted
+        values.  Matching IDs are resolved from the metadata postings and
+        passed to FAISS as an ID bitmap, so the index only scores
+        matching documents and shards without matches are skipped.  HNSW
+        shards with few matches score them exactly instead (see
+        ``FILTER_EXACT_LIMIT``), so a filter matching at least ``k``
+        documents returns ``k`` results.
+
+        ``ef_search`` (HNSW) and ``nprobe`` (IVF) trade recall for latency;
+        they default to the store's ``ef_search`` / ``nprobe`` and are
+        passed per query in the search parameters of the shards they
+        apply to, together with the filter's ID selector.
         """
-        if not self.shards:
+        if not self.shards or k <= 0:
             return []
-        emb = self._embedding_model.embed([query_text])[0]
-        import numpy as np
-        vec = np.array([emb], dtype='float32')
+        vec = self._embedding_model.embed([query_text])
         if self.metric == 'cosine':
             faiss.normalize_L2(vec)
+
+        shards = [(shard, index_type, None) for shard, index_type in zip(self.shards, self.shard_index_types)]
+        selector = None
+        matched = self._matching_ids(filters) if filters else None
+        if matched is not None:
+            if not len(matched):
+                return []
+            # Bit i set <=> global ID i passes the filters (little‑endian bit order)
+            bits = np.zeros(self._next_id, dtype=bool)
+            bits[matched] = True
+            bitmap = np.packbits(bits, bitorder='little')
+            # ``bitmap`` must outlive the searches below: the selector only borrows it
+            selector = faiss.IDSelectorBitmap(len(bits), faiss.swig_ptr(bitmap))
+            # Group the matches by shard (stable, so each group stays sorted)
+            match_shards = np.frombuffer(self._id_shard, dtype=np.int32)[matched]
+            order = np.argsort(match_shards, kind='stable')
+            per_shard_matches = np.bincount(match_shards, minlength=len(shards))
+            groups = np.split(matched[order], np.cumsum(per_shard_matches)[:-1])
+            shards = [(shard, index_type, ids)
+                      for (shard, index_type, _), ids in zip(shards, groups) if len(ids)]
+
+        # HNSW needs efSearch >= k to return k results
+        ef = max(ef_search or self.ef_search, k)
+        probes = nprobe or self.nprobe
+
+        def search(target: Tuple[faiss.IndexIDMap, str, Optional[np.ndarray]]) -> List[Tuple[float, int]]:
+            shard, index_type, shard_matches = target
+            return self._search_shard(shard, index_type, vec, k, ef, probes, selector, filters, shard_matches)
+
+        if len(shards) == 1:
+            per_shard = [search(shards[0])]
+        else:
+            per_shard = list(SEARCH_EXECUTOR.map(search, shards))
+        merged = heapq.merge(*per_shard, key=lambda hit: hit[0], reverse=self.higher_is_better)
         results: List[Tuple[str, dict, float]] = []
-        offset = 0
-        for shard_idx, shard in enumerate(self.shards):
-            scores, ids = shard.search(vec, k)
-            # Map global IDs back to local documents
-            for score, idx in zip(scores[0], ids[0]):
-                if idx < 0:
-                    continue
-                # Determine which shard the id belongs to
-                # Find the shard that contains this global id
-                # Compute document index by subtracting offsets
-                found = False
-                cumulative = 0
-                for s_docs, s_metas in zip(self.documents_shards, self.metadatas_shards):
-                    if idx < cumulative + len(s_docs):
-                        doc = s_docs[idx - cumulative]
-                        meta = s_metas[idx - cumulative]
-                        results.append((doc, meta, float(score)))
-                        found = True
-                        break
-                    cumulative += len(s_docs)
-                if not found:
-                    # Should not happen
-                    continue
-        # Sort combined results by similarity descending and return top k
-        results.sort(key=lambda x: x[2], reverse=True)
-        return results[:k]
+        for score, idx in itertools.islice(merged, k):
+            # Map global IDs back to documents
+            found = self.get_document(idx)
+            if found is None:
+                # Should not happen
+                continue
+            doc, meta = found
+            results.append((doc, meta, score))
+        return results
 
 # ----------------------------------------------------------------------------
 # FastAPI app definitions
@@ -216,6 +443,10 @@ init_logger()
 # Global vector stores keyed by (case, embedding_model, similarity)
 VECTOR_STORES: Dict[Tuple[str, str, str], VectorStore] = {}
 
+DEFAULT_EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+# Index type for stores created without an explicit ``index_type`` (see embeddings.INDEX_TYPES)
+DEFAULT_INDEX_TYPE = os.getenv("VECTOR_INDEX_TYPE", "default")
+
 # -------------------------------------------------------------------------
 # Persistence and configuration
 # -------------------------------------------------------------------------
@@ -240,27 +471,85 @@ def _get_store_dir(case: str, model: str, metric: str) -> pathlib.Path:
     """Return the directory path for a given (case, model, metric)."""
     return VECTOR_ROOT / case / _slugify(model) / metric
 
+def _write_text_files(dir_path: pathlib.Path, store: VectorStore, first_id: int) -> None:
+    """Write ``texts/doc_<id>.txt`` for new documents and merge their sources into ``references.txt``.
+
+    These files provide a human‑readable trace of the documents used to
+    build the vector store and can be useful for debugging and auditing.
+    """
+    try:
+        new_docs = [store.get_document(doc_id) for doc_id in range(first_id, store._next_id)]
+        # Collect unique source URLs from metadata
+        sources = {str(meta["source"]) for _, meta in filter(None, new_docs) if meta.get("source")}
+        refs_path = dir_path / "references.txt"
+        existing: set[str] = set()
+        if refs_path.exists():
+            existing = set(refs_path.read_text(encoding="utf-8").splitlines())
+        if not sources <= existing:
+            with open(refs_path, "w", encoding="utf-8") as rf:
+                rf.write("\n".join(sorted(existing | sources)))
+        # Save each new document as a separate file
+        texts_dir = dir_path / "texts"
+        texts_dir.mkdir(parents=True, exist_ok=True)
+        for doc_id, found in enumerate(new_docs, start=first_id):
+            if found is not None:
+                with open(texts_dir / f"doc_{doc_id}.txt", "w", encoding="utf-8") as tf:
+                    tf.write(found[0])
+    except Exception as exc:
+        # Log but do not propagate exceptions from reference/text file saving
+        logging.error("Failed to persist reference or text files: %s", exc)
+
+def _legacy_index_files(dir_path: pathlib.Path) -> List[pathlib.Path]:
+    """Shard files of the legacy layout (``index_<shard>.faiss``), in shard order."""
+    paths = [p for p in dir_path.glob("index_*.faiss") if len(p.stem.split("_")) == 2]
+    # index_10 sorts before index_2 as text
+    return sorted(paths, key=lambda p: int(p.stem.split("_")[1]))
+
 def _save_vector_store(case: str, model: str, metric: str, store: VectorStore) -> None:
-    """Persist a vector store's shards, metadata and source texts to disk.
-
-    For each shard, the FAISS index is written to ``index_<n>.faiss``.  A
-    single ``metadata.pkl`` file stores the embedding model name, metric,
-    per‑shard documents and metadata and the next global ID.  In addition,
-    this function writes out a ``references.txt`` file listing the unique
-    source URLs contained in the store's metadata, and saves each ingested
-    document as an individual ``doc_<id>.txt`` file inside a ``texts``
-    subdirectory.  These files provide a human‑readable trace of the
-    documents used to build the vector store and can be useful for
-    debugging and auditing.
+    """Persist the changes made to a vector store since its last save.
+
+    Documents added since the last save are appended to the document
+    log (see ``docstore``), only shards that received documents are
+    rewritten (to a new generation file, so the previous one stays valid
+    until the manifest is committed), and text files are written for the
+    new IDs only.  A store loaded from the legacy ``metadata.pkl`` layout
+    is migrated by its first save, which removes the legacy files once
+    the manifest is committed.
 
     GPU indices are converted back to CPU indices before saving to
     guarantee portability across systems that may lack GPUs.
     """
     dir_path = _get_store_dir(case, model, metric)
     dir_path.mkdir(parents=True, exist_ok=True)
-    # Save each shard's FAISS index
-    for i, shard in enumerate(store.shards):
-        idx = shard
+    log = DocumentLog(dir_path)
+    manifest = log.read_manifest()
+    generation = (manifest or {}).get("generation", 0) + 1
+    superseded: List[str] = []
+    if manifest is None or manifest.get("doc_count") != store._persisted_count:
+        # Nothing committed that matches this store: write everything
+        superseded = list((manifest or {}).get("shards", []))
+        if manifest is None and (dir_path / "metadata.pkl").exists():
+            superseded += ["metadata.pkl"] + [p.name for p in _legacy_index_files(dir_path)]
+        log.reset()
+        manifest = None
+        store._persisted_count = 0
+        store._dirty_shards = set(range(len(store.shards)))
+    first_id = store._persisted_count
+    if first_id == store._next_id and not store._dirty_shards:
+        return
+
+    new_texts: List[str] = []
+    new_metas: List[dict] = []
+    for doc_id in range(first_id, store._next_id):
+        doc, meta = store.get_document(doc_id)  # type: ignore[misc]
+        new_texts.append(doc)
+        new_metas.append(meta)
+    sizes = log.append(manifest, new_texts, new_metas)
+
+    # Rewrite dirty shards only
+    shard_files: List[str] = list((manifest or {}).get("shards", []))
+    for i in sorted(store._dirty_shards):
+        idx = store.shards[i]
         if USE_GPU:
             try:
                 # Convert GPU index back to CPU
@@ -268,80 +557,201 @@ def _save_vector_store(case: str, model: str, metric: str, store: VectorStore) -
             except Exception:
                 # Ignore conversion errors
                 pass
-        faiss.write_index(idx, str(dir_path / f"index_{i}.faiss"))
-    # Persist metadata
-    metadata = {
+        name = f"index_{i}_{generation}.faiss"
+        faiss.write_index(idx, str(dir_path / name))
+        if i in store._mapped_index_files:
+            # Still mapped from the superseded file: reload from the new one when written to
+            store._mapped_index_files[i] = str(dir_path / name)
+        if i < len(shard_files):
+            superseded.append(shard_files[i])
+            shard_files[i] = name
+        else:
+            shard_files.append(name)
+
+    log.write_manifest({
         "embedding_model": store.embedding_model_name,
         "metric": store.metric,
-        "documents_shards": store.documents_shards,
-        "metadatas_shards": store.metadatas_shards,
+        "dim": store.dim,
+        "index_type": store.index_type,
+        "shard_index_types": store.shard_index_types,
         "next_id": store._next_id,
-    }
-    with open(dir_path / "metadata.pkl", "wb") as f:
-        pickle.dump(metadata, f)
-    # Write human‑readable reference and text files
-    try:
-        # Collect unique source URLs from metadata
-        sources: set[str] = set()
-        for shard_metas in store.metadatas_shards:
-            for meta in shard_metas:
-                src = meta.get("source")
-                if src:
-                    sources.add(str(src))
-        # Write references.txt
-        if sources:
-            with open(dir_path / "references.txt", "w", encoding="utf-8") as rf:
-                rf.write("\n".join(sorted(sources)))
-        # Save each document as a separate file
-        texts_dir = dir_path / "texts"
-        texts_dir.mkdir(parents=True, exist_ok=True)
-        global_id = 0
-        for shard_docs in store.documents_shards:
-            for doc in shard_docs:
-                doc_path = texts_dir / f"doc_{global_id}.txt"
-                with open(doc_path, "w", encoding="utf-8") as tf:
-                    tf.write(doc)
-                global_id += 1
-    except Exception as exc:
-        # Log but do not propagate exceptions from reference/text file saving
-        import logging
-        logging.error("Failed to persist reference or text files: %s", exc)
+        "generation": generation,
+        "shards": shard_files,
+        "shard_sizes": [len(docs) for docs in store.documents_shards],
+        **sizes,
+    })
+    store._persisted_count = store._next_id
+    store._dirty_shards = set()
+    for name in superseded:
+        (dir_path / name).unlink(missing_ok=True)
+    _write_text_files(dir_path, store, first_id)
+
+# When ``VECTOR_MMAP`` is enabled (the default), persisted shards are memory
+# mapped and document texts are served from the mapped text blob, so loading
+# a store costs little more than reading its metadata and the page cache is
+# shared between processes.  ``IO_FLAG_MMAP`` only maps IVF inverted lists,
+# so flat, HNSW and SQ shards are mapped in place with ``IO_FLAG_MMAP_IFC``
+# instead.  Ignored with ``USE_GPU``.
+USE_MMAP = os.getenv("VECTOR_MMAP", "true").lower() in ("1", "true", "yes")
+
+def _read_index(path: pathlib.Path, mmap: bool = False, index_type: str = "default") -> faiss.Index:
+    if mmap:
+        flag = faiss.IO_FLAG_MMAP if is_ivf(index_type) else faiss.IO_FLAG_MMAP_IFC
+        return faiss.read_index(str(path), flag | faiss.IO_FLAG_READ_ONLY)
+    idx = faiss.read_index(str(path))
+    # Move to GPU if requested
+    if USE_GPU and faiss.get_num_gpus() > 0:
+        try:
+            res = faiss.StandardGpuResources()
+            idx = faiss.index_cpu_to_gpu(res, 0, idx)
+        except Exception:
+            pass
+    return idx
 
 def _load_vector_store(case: str, model: str, metric: str) -> Optional[VectorStore]:
     """Load a vector store from disk.  Returns None if not found.
 
-    This function reconstructs all shards and their associated documents.
+    This function reconstructs all shards and their associated documents
+    from the committed manifest, falling back to the legacy
+    ``metadata.pkl`` layout for stores saved by earlier versions.
     """
     dir_path = _get_store_dir(case, model, metric)
+    log = DocumentLog(dir_path)
+    manifest = log.read_manifest()
+    if manifest is not None:
+        use_mmap = USE_MMAP and not USE_GPU
+        store = VectorStore(manifest["embedding_model"], manifest["metric"], manifest.get("index_type", "default"))
+        texts, metadatas = log.load(manifest, mmap_texts=use_mmap)
+        start = 0
+        for size in manifest.get("shard_sizes", []):
+            store.documents_shards.append(
+                TextShard(texts, start, size) if use_mmap else texts[start:start + size]  # type: ignore[arg-type]
+            )
+            store.metadatas_shards.append(metadatas[start:start + size])
+            start += size
+        store._next_id = manifest.get("next_id", len(texts))
+        store._persisted_count = manifest.get("doc_count", len(texts))
+        store._rebuild_id_map()
+        shard_files = manifest.get("shards", [])
+        store.shard_index_types = manifest.get("shard_index_types") or ["default"] * len(shard_files)
+        for i, name in enumerate(shard_files):
+            store.shards.append(  # type: ignore[arg-type]
+                _read_index(dir_path / name, mmap=use_mmap, index_type=store.shard_index_types[i])
+            )
+            if use_mmap:
+                store._mapped_index_files[i] = str(dir_path / name)
+        store.dim = manifest.get("dim") or (store.shards[0].d if store.shards else None)
+        return store
+
     meta_path = dir_path / "metadata.pkl"
     if not meta_path.exists():
         return None
-    # Load metadata
+    # Load legacy metadata; the next save migrates the store to the log layout
     with open(meta_path, "rb") as f:
         data = pickle.load(f)
     store = VectorStore(data["embedding_model"], data["metric"])
     store.documents_shards = data.get("documents_shards", [])
     store.metadatas_shards = data.get("metadatas_shards", [])
     store._next_id = data.get("next_id", 0)
-    # Load shard indices
-    shard_files = sorted([p for p in dir_path.glob("index_*.faiss")])
-    for path in shard_files:
-        idx = faiss.read_index(str(path))
-        # Move to GPU if requested
-        if USE_GPU and faiss.get_num_gpus() > 0:
-            try:
-                res = faiss.StandardGpuResources()
-                idx = faiss.index_cpu_to_gpu(res, 0, idx)
-            except Exception:
-                pass
-        store.shards.append(idx)  # type: ignore[arg-type]
+    store._rebuild_id_map()
+    for path in _legacy_index_files(dir_path):
+        store.shards.append(_read_index(path))  # type: ignore[arg-type]
+    store.shard_index_types = ["default"] * len(store.shards)
+    store.dim = store.shards[0].d if store.shards else None
     return store
 
+# -------------------------------------------------------------------------
+# Startup warm-up
+# -------------------------------------------------------------------------
+# ``VECTOR_WARM_CASES`` selects the persisted stores loaded at startup: "*"
+# (default) for every store under VECTOR_ROOT, a comma‑separated list of
+# cases, or empty to load lazily as before.  ``VECTOR_WARM_MODELS`` lists
+# extra embedding models to preload besides the default one and those of
+# the warmed stores.
+WARM_CASES = os.getenv("VECTOR_WARM_CASES", "*")
+WARM_MODELS = [m.strip() for m in os.getenv("VECTOR_WARM_MODELS", "").split(",") if m.strip()]
+
+WARMUP_STATE: Dict[str, Any] = {
+    "ready": False,
+    "started_at": None,
+    "finished_at": None,
+    "stores": [],
+    "models": [],
+    "errors": [],
+}
+
+def _discover_stores() -> List[Tuple[str, str, str]]:
+    """Return ``(case, embedding_model, metric)`` of persisted stores selected for warm‑up."""
+    wanted = None if WARM_CASES.strip() == "*" else {c.strip() for c in WARM_CASES.split(",") if c.strip()}
+    keys: List[Tuple[str, str, str]] = []
+    for marker in sorted(VECTOR_ROOT.glob("*/*/*/manifest.json")) + sorted(VECTOR_ROOT.glob("*/*/*/metadata.pkl")):
+        dir_path = marker.parent
+        case, metric = dir_path.parent.parent.name, dir_path.name
+        if wanted is not None and case not in wanted:
+            continue
+        if marker.name == "metadata.pkl" and (dir_path / "manifest.json").exists():
+            continue
+        if marker.name == "manifest.json":
+            model = DocumentLog(dir_path).read_manifest()["embedding_model"]  # type: ignore[index]
+        else:
+            # Legacy layout: the slug is reversible for the usual "org/name" ids
+            model = dir_path.parent.name.replace("__", "/")
+        keys.append((case, model, metric))
+    return keys
+
+def _warm_up() -> None:
+    """Load selected stores and preload their embedding models (runs in a worker thread)."""
+    logger = init_logger()
+    models = {DEFAULT_EMBEDDING_MODEL, *WARM_MODELS}
+    if WARM_CASES.strip():
+        for key in _discover_stores():
+            try:
+                if key not in VECTOR_STORES:
+                    store = _load_vector_store(*key)
+                    if store is None:
+                        continue
+                    # A request may have loaded it meanwhile; keep that instance
+                    store = VECTOR_STORES.setdefault(key, store)
+                    models.add(store.embedding_model_name)
+                else:
+                    models.add(VECTOR_STORES[key].embedding_model_name)
+                WARMUP_STATE["stores"].append("/".join(key))
+            except Exception as exc:
+                WARMUP_STATE["errors"].append(f"store {'/'.join(key)}: {exc}")
+                logger.error("Warm-up failed to load store %s: %s", key, exc)
+    for model_name in sorted(models):
+        try:
+            get_embedding_model(model_name).warm_up()
+            WARMUP_STATE["models"].append(model_name)
+        except Exception as exc:
+            WARMUP_STATE["errors"].append(f"model {model_name}: {exc}")
+            logger.error("Warm-up failed to load model %s: %s", model_name, exc)
+
+async def _run_warm_up() -> None:
+    WARMUP_STATE["started_at"] = datetime.datetime.utcnow().isoformat()
+    try:
+        await asyncio.to_thread(_warm_up)
+    finally:
+        WARMUP_STATE["finished_at"] = datetime.datetime.utcnow().isoformat()
+        WARMUP_STATE["ready"] = True
+        init_logger().info(
+            f"Warm-up finished: {len(WARMUP_STATE['stores'])} stores, "
+            f"{len(WARMUP_STATE['models'])} models, {len(WARMUP_STATE['errors'])} errors"
+        )
+
+@app.on_event("startup")
+async def start_warm_up() -> None:
+    """Warm up in the background so liveness checks pass while stores load."""
+    app.state.warm_up_task = asyncio.create_task(_run_warm_up())
+
 class IngestPayload(BaseModel):
     sources: List[str] = Field(..., description="List of URLs to scrape or open data pages")
     case: str = Field(..., description="Name of the case for per‑case storage and logging")
     embedding_model: Optional[str] = Field(None, description="Override embedding model for this ingestion")
     similarity: Optional[str] = Field(None, description="Override similarity metric (cosine, inner_product, l2)")
+    index_type: Optional[str] = Field(
+        None, description="Index type for a new store (default, hnsw_sq8, ivf_pq, opq_ivf_pq)"
+    )
 
 class QueryPayload(BaseModel):
     query: str = Field(..., description="Search query text")
@@ -349,6 +759,11 @@ class QueryPayload(BaseModel):
     case: Optional[str] = Field(None, description="Limit search to this case")
     embedding_model: Optional[str] = Field(None, description="Embedding model used to encode documents")
     similarity: Optional[str] = Field(None, description="Similarity metric (cosine, inner_product, l2)")
+    filters: Optional[Dict[str, Any]] = Field(
+        None, description="Metadata filters, e.g. {\"source\": [\"https://...\"]}; list values match any element"
+    )
+    ef_search: Optional[int] = Field(None, description="HNSW search depth for this query (higher = better recall, slower)")
+    nprobe: Optional[int] = Field(None, description="IVF lists probed for this query (higher = better recall, slower)")
 
 @app.get("/healthz")
 async def healthz() -> dict:
@@ -356,6 +771,14 @@ async def healthz() -> dict:
     return {"status": "ok"}
 
 
+@app.get("/readyz")
+async def readyz(response: FastAPIResponse) -> dict:
+    """Readiness check: 503 until the startup warm‑up has finished."""
+    if not WARMUP_STATE["ready"]:
+        response.status_code = 503
+    return {"status": "ready" if WARMUP_STATE["ready"] else "warming_up", **WARMUP_STATE}
+
+
 @app.get("/metrics")
 async def metrics() -> FastAPIResponse:
     """Expose Prometheus metrics for scraping."""
@@ -380,8 +803,12 @@ async def ingest(payload: IngestPayload) -> dict:
     logger.info(
         f"Ingestion request received: sources={len(payload.sources)}, case={case}, model={payload.embedding_model}, metric={payload.similarity}"
     )
-    model_name = payload.embedding_model or 'sentence-transformers/all-MiniLM-L6-v2'
+    model_name = payload.embedding_model or DEFAULT_EMBEDDING_MODEL
     metric = payload.similarity or 'cosine'
+    index_type = payload.index_type or DEFAULT_INDEX_TYPE
+    if index_type not in INDEX_TYPES:
+        REQUEST_COUNT.labels(endpoint=endpoint, method=method, status="400").inc()
+        raise HTTPException(status_code=400, detail=f"Unsupported index type {index_type}")
     key = (case, model_name, metric)
     # Retrieve or create the vector store.  First attempt to load from disk
     # so that indices persist across container restarts.
@@ -390,8 +817,12 @@ async def ingest(payload: IngestPayload) -> dict:
         if loaded is not None:
             VECTOR_STORES[key] = loaded
         else:
-            VECTOR_STORES[key] = VectorStore(model_name, metric)
+            VECTOR_STORES[key] = VectorStore(model_name, metric, index_type)
     store = VECTOR_STORES[key]
+    if payload.index_type and payload.index_type != store.index_type:
+        logger.warning(
+            f"Store already uses index type '{store.index_type}'; ignoring requested '{payload.index_type}'"
+        )
     try:
         result = ingest_sources(payload.sources, case, store, logger)
     except Exception as exc:
@@ -420,7 +851,7 @@ async def query(payload: QueryPayload) -> List[dict]:
     has not been ingested yet, a 404 is returned.
     """
     case_name = payload.case or 'base'
-    model_name = payload.embedding_model or 'sentence-transformers/all-MiniLM-L6-v2'
+    model_name = payload.embedding_model or DEFAULT_EMBEDDING_MODEL
     metric = payload.similarity or 'cosine'
     key = (case_name, model_name, metric)
     logger = init_logger(case_name)
@@ -443,7 +874,10 @@ async def query(payload: QueryPayload) -> List[dict]:
         REQUEST_LATENCY.labels(endpoint=endpoint).observe(datetime.datetime.now().timestamp() - start_time)
         raise HTTPException(status_code=404, detail="Case/model/metric combination not found")
     try:
-        results = query_vector_store(store, payload.query, payload.k, case_name)
+        results = query_vector_store(
+            store, payload.query, payload.k, case_name, payload.filters,
+            ef_search=payload.ef_search, nprobe=payload.nprobe
+        )
     except Exception as exc:
         status = "500"
         logger.error("Query failed: %s", exc)
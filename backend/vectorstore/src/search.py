@@ -7,21 +7,24 @@ along with their metadata and similarity scores.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
 def query_vector_store(
     vector_store: Any,
     query: str,
     k: int = 5,
-    case: str | None = None
+    case: str | None = None,
+    filters: Optional[Dict[str, Any]] = None,
+    ef_search: Optional[int] = None,
+    nprobe: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """Query the vector store and return the top‑k documents.
 
     Parameters
     ----------
     vector_store : object
-        The vector store implementing ``query`` method returning
+        The vector store implementing ``query(text, k, filters)`` returning
         (doc, metadata, score) tuples.
     query : str
         The user query text.
@@ -30,6 +33,13 @@ def query_vector_store(
     case : str, optional
         Restrict results to a given case by filtering on the metadata's
         ``case`` field.  If omitted, all cases are considered.
+    filters : dict, optional
+        Metadata filters (``{"source": [...], "lang": "ar"}``); a list
+        value matches any of its elements.  Filters are applied inside
+        the index, so filtered queries still return up to ``k`` results.
+    ef_search, nprobe : int, optional
+        Per‑query HNSW search depth and IVF probe count; higher values
+        improve recall at the cost of latency.
 
     Returns
     -------
@@ -37,14 +47,15 @@ def query_vector_store(
         A list of search results with keys ``text``, ``metadata`` and
         ``score``.
     """
-    results = vector_store.query(query, k)
-    filtered: List[Dict[str, Any]] = []
-    for doc, meta, score in results:
-        if case and meta.get("case") != case:
-            continue
-        filtered.append({
+    filters = dict(filters or {})
+    if case:
+        filters["case"] = case
+    results = vector_store.query(query, k, filters=filters or None, ef_search=ef_search, nprobe=nprobe)
+    return [
+        {
             "text": doc,
             "metadata": meta,
             "score": score
-        })
-    return filtered
\ No newline at end of file
+        }
+        for doc, meta, score in results
+    ]
\ No newline at end of file